@@ -4,11 +4,23 @@ Algorithms for the chips&circuits case.
 
 This module contains algorithms that find a solution for the chips&circuits case.
 Also see:
+        pydoc algorithms.annealing
+        pydoc algorithms.astar
+        pydoc algorithms.controller
         pydoc algorithms.greedy
+        pydoc algorithms.portfolio
         pydoc algorithms.random
+        pydoc algorithms.ripup
+        pydoc algorithms.startstate
         pydoc algorithms.hillclimber
 """
 
 from code.algorithms.greedy import Greedy, GreedyLookAhead, GreedyNoIntersect, GreedyNoIntersectLookAhead, GreedyCosts, GreedyLookAheadCosts, GreedyWireJam, GreedyLookAheadWireJam
+from code.algorithms.astar import AStar
+from code.algorithms.controller import BudgetExhausted, RunController
 from code.algorithms.random import Random
-from code.algorithms.hillclimber import HillClimber
\ No newline at end of file
+from code.algorithms.ripup import DeadEnd, RipUp, RandomRipUp, GreedyRipUp, GreedyLookAheadRipUp, GreedyNoIntersectRipUp, GreedyNoIntersectLookAheadRipUp, GreedyCostsRipUp, GreedyLookAheadCostsRipUp, GreedyWireJamRipUp, GreedyLookAheadWireJamRipUp
+from code.algorithms.startstate import StartState, RandomStartState, GreedyStartState, FileStartState
+from code.algorithms.hillclimber import HillClimber
+from code.algorithms.annealing import SimulatedAnnealing
+from code.algorithms.portfolio import Portfolio
\ No newline at end of file
@@ -0,0 +1,379 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+
+# Built-in/Generic Imports
+import math
+import random
+import time
+
+# Own modules
+from code.algorithms.hillclimber import HillClimber
+
+__author__ = 'Eline van Groningen, Mimoun Boulfich, Syrka van Kuppenveld'
+__copyright__ = 'Copyright 2020, Chips & Circuits'
+__credits__ = ['Eline van Groningen, Mimoun Boulfich, Syrka van Kuppenveld']
+__license__ = 'GNU GPL 3.0'
+__version__ = '0.1.0'
+__maintainer__ = 'Eline van Groningen, Mimoun Boulfich, Syrka van Kuppenveld'
+__email__ = 'elinevangroningen@gmail.com, mimounboulfich@live.nl, syrkavankuppenveld@gmail.com'
+__status__ = 'Dev'
+
+"""
+Code for the Simulated Annealing algorithm.
+
+
+This module contains the code for the simulated annealing algorithm, which uses the
+adjustments of the hillclimber algorithm.
+"""
+
+
+class SimulatedAnnealing(HillClimber):
+    """
+    Provides an Object to perform the Simulated Annealing algorithm with.
+
+    Start State
+    -----------
+    The algorithm starts with a Random start state, or the start state of the given
+    StartState provider, as the HillClimber.
+
+    Moves
+    -----
+    A move removes a random net and rebuilds it with the Greedy LookAhead algorithm,
+    as an adjustment of the HillClimber.
+
+    Acceptance
+    ----------
+    A move that does not increase the costs is always accepted, a move that
+    increases the costs by delta with probability exp(-delta / temperature), so
+    the algorithm can leave a local minimum while the temperature is high. A
+    rejected move is undone with the Journal.
+
+    Temperature
+    -----------
+    The temperature cools from start_temperature to end_temperature over the
+    budget, geometrically, linearly or by a given schedule. If reheat_patience moves
+    in a row do not improve the best costs, the temperature is reheated to the start
+    temperature and cools again over the rest of the budget.
+
+    Budget
+    ------
+    The algorithm stops after the iteration budget or the time budget, whichever
+    runs out first, and returns the best state it has seen.
+    """
+
+    SCHEDULES = ('geometric', 'linear')
+
+    # Number of moves between the progress messages and samples of the costs over time
+    REPORT_INTERVAL = 100
+
+    def __init__(self, graph, start_temperature=300, end_temperature=1, schedule='geometric', iterations=10000, time_budget=None,
+                 reheat_patience=None, start_state_flow=(False, False), conversion_flow=(False, False), chip=None, netlist=None,
+                 start_state=None, seed=None):
+        """
+        Initializes the states of the algorithm.
+
+        Parameters
+        ----------
+        graph: a Graph Object
+                A Graph Object of the used chip and netlist.
+
+        start_temperature: a float
+                The temperature at the start and after a reheat. The default is the
+                costs of an intersection, which is then accepted with probability 1/e.
+
+        end_temperature: a float
+                The temperature at the end of the budget, larger than 0.
+
+        schedule: a string or a function
+                'geometric' or 'linear', or a function of the start temperature, the
+                end temperature and the fraction of the budget used (0 to 1) that
+                returns the temperature.
+
+        iterations: an int
+                The maximum number of moves, None for no limit.
+
+        time_budget: a float
+                The maximum number of seconds of the moves, None for no limit.
+
+        reheat_patience: an int
+                The number of moves in a row without a new best state after which the
+                temperature is reheated, None never reheats.
+
+        start_state_flow: boolean tuple
+                A boolean tuple needed for showing and saving the visualization of the start state.
+
+        conversion_flow: boolean tuple
+                A boolean tuple needed for showing and saving the visualization of the conversion plot.
+
+        chip: an int
+                The number of the used chip.
+
+        netlist: an int
+                The number of the used netlist.
+
+        start_state: a StartState object
+                Provides the start state, None builds it with the Random algorithm.
+
+        seed: an int
+                The seed of the start state, None does not seed it.
+        """
+
+        super().__init__(graph, 1, start_state_flow, conversion_flow, chip, netlist, processes=1, start_state=start_state, seed=seed)
+
+        if schedule not in self.SCHEDULES and not callable(schedule):
+            raise ValueError(f"unknown schedule: {schedule}")
+
+        if iterations is None and time_budget is None:
+            raise ValueError("simulated annealing needs an iteration or a time budget")
+
+        if end_temperature <= 0 or start_temperature < end_temperature:
+            raise ValueError("the temperatures must satisfy start_temperature >= end_temperature > 0")
+
+        self.start_temperature = start_temperature
+        self.end_temperature = end_temperature
+        self.schedule = schedule
+
+        # The look ahead uses time_budget for its own search, so the budget has another name
+        self.max_iterations = iterations
+        self.max_seconds = time_budget
+        self.reheat_patience = reheat_patience
+
+        # Statistics of the run
+        self.move_count = 0
+        self.accepted = 0
+        self.reheats = 0
+        self.moves_per_second = None
+
+        # Samples of the (seconds, move, costs, best costs, temperature) during the run
+        self.history = []
+
+    def get_progress(self, elapsed):
+        """
+        Returns the fraction of the budget that is used.
+
+        Parameters
+        ----------
+        elapsed: a float
+                The number of seconds since the first move.
+
+        Returns
+        -------
+        float
+                The fraction of the iteration or time budget that is used, whichever
+                is larger.
+        """
+
+        progress = 0.0
+
+        if self.max_iterations is not None:
+            progress = max(progress, self.move_count / self.max_iterations)
+
+        if self.max_seconds is not None:
+            progress = max(progress, elapsed / self.max_seconds)
+
+        return min(progress, 1.0)
+
+    def get_temperature(self, progress):
+        """
+        Returns the temperature of the schedule.
+
+        Parameters
+        ----------
+        progress: a float
+                The fraction of the cooling that is done, from 0 to 1.
+
+        Returns
+        -------
+        float
+                The temperature.
+        """
+
+        if callable(self.schedule):
+            return self.schedule(self.start_temperature, self.end_temperature, progress)
+
+        if self.schedule == 'linear':
+            return self.start_temperature + (self.end_temperature - self.start_temperature) * progress
+
+        return self.start_temperature * (self.end_temperature / self.start_temperature) ** progress
+
+    def move(self):
+        """
+        Rebuilds a random net and returns the change in costs.
+
+        Returns
+        -------
+        int
+                The costs after the move minus the costs before the move.
+        """
+
+        connection, gates = self.get_random_connection()
+        self.remove_connection(connection, gates)
+        self.apply_random_adjustment(connection, gates)
+
+        return self.wire.compute_costs() - self.cost
+
+    def accept(self, delta, temperature):
+        """
+        Returns whether a move that changes the costs by delta is accepted.
+
+        Parameters
+        ----------
+        delta: an int
+                The change in costs of the move.
+
+        temperature: a float
+                The current temperature.
+
+        Returns
+        -------
+        bool
+                True if the move is accepted, else False.
+        """
+
+        if delta <= 0:
+            return True
+
+        return random.random() < math.exp(-delta / temperature)
+
+    def report(self, elapsed, temperature):
+        """
+        Samples the costs over time and updates the user on the progress.
+
+        Parameters
+        ----------
+        elapsed: a float
+                The number of seconds since the first move.
+
+        temperature: a float
+                The current temperature.
+        """
+
+        self.history.append((elapsed, self.move_count, self.cost, self.best_cost, temperature))
+        print(f"Move {self.move_count}: costs {self.cost}, best costs {self.best_cost}, temperature {temperature:.1f}")
+
+    def anneal(self):
+        """
+        Moves from the start state until the budget runs out, and lays the best
+        state that was seen.
+        """
+
+        start = time.perf_counter()
+
+        # Keep a copy of the start state, the moves change the current wire path
+        self.best_wire_path = dict(self.wire_path)
+
+        # Progress at the last reheat, the temperature cools over the rest of the budget
+        cooling_start = 0.0
+        since_best = 0
+        temperature = self.start_temperature
+
+        while True:
+            elapsed = time.perf_counter() - start
+            progress = self.get_progress(elapsed)
+            if progress >= 1:
+                break
+
+            # Reheat if the best state did not improve for too long
+            if self.reheat_patience is not None and since_best >= self.reheat_patience:
+                cooling_start = progress
+                since_best = 0
+                self.reheats += 1
+                print(f"Reheat {self.reheats}...")
+
+            temperature = self.get_temperature((progress - cooling_start) / (1 - cooling_start))
+
+            # Apply a move and accept or undo it
+            delta = self.move()
+            self.move_count += 1
+            since_best += 1
+
+            if self.accept(delta, temperature):
+                self.journal.commit()
+                self.cost += delta
+                self.accepted += 1
+
+                # Keep a copy of the best state, later moves change the current one
+                if self.cost < self.best_cost:
+                    self.best_cost = self.cost
+                    self.best_wire_path = dict(self.wire_path)
+                    since_best = 0
+            else:
+                self.journal.rollback()
+
+            # Keep track of the costs for the conversion plot
+            self.climbers_costs.append(self.cost)
+            self.iteration.append(len(self.iteration))
+
+            if self.move_count % self.REPORT_INTERVAL == 0:
+                self.report(elapsed, temperature)
+
+        elapsed = time.perf_counter() - start
+        self.report(elapsed, temperature)
+        self.moves_per_second = self.move_count / elapsed if elapsed > 0 else None
+
+        # Return to the best state
+        self.wire_path = self.best_wire_path
+        self.lay_wire_path(self.best_wire_path)
+        self.cost = self.best_cost
+
+    def get_filename_startstate(self, i):
+        """
+        Returns the filename of the start state.
+
+        Returns
+        -------
+        string
+                A string representing the name of the file
+        """
+
+        return 'start_state_annealing.png'
+
+    def get_filename_conversion(self):
+        """
+        Returns the filename of the conversion plot.
+
+        Returns
+        -------
+        string
+                A string representing the name of the file
+        """
+
+        return 'conversion_plot_annealing.png'
+
+    def notify_user(self):
+        """
+        Notify user on the found costs and the throughput.
+        """
+
+        print(f"{self.move_count} moves, {self.accepted} accepted, {self.reheats} reheats")
+        if self.moves_per_second is not None:
+            print(f"{self.moves_per_second:.1f} moves per second")
+
+        print("\033[33m"f"Wire costs = {self.best_cost}\n""\033[0m")
+
+    def run(self):
+        """
+        Runs the Simulated Annealing algorithm and returns the best wire path.
+
+        Returns
+        -------
+        dict
+                A dict with connections as key and the wire path as value.
+        """
+
+        # Get the start state
+        self.get_start_state(0, self.get_seed(0))
+
+        # Handle the visualization of the start state
+        self.handle_start_state_visualization(0)
+
+        # Move until the budget runs out
+        self.anneal()
+
+        # Notify user on the costs and throughput
+        self.notify_user()
+
+        # Handle the showing and saving of the conversion plot
+        self.handle_conversion_plot_visualization()
+
+        return self.best_wire_path
@@ -0,0 +1,183 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+
+# Built-in/Generic Imports
+import heapq
+import random
+
+# Own modules
+from code.algorithms.greedy import Greedy
+
+__author__ = 'Eline van Groningen, Mimoun Boulfich, Syrka van Kuppenveld'
+__copyright__ = 'Copyright 2020, Chips & Circuits'
+__credits__ = ['Eline van Groningen, Mimoun Boulfich, Syrka van Kuppenveld']
+__license__ = 'GNU GPL 3.0'
+__version__ = '0.1.0'
+__maintainer__ = 'Eline van Groningen, Mimoun Boulfich, Syrka van Kuppenveld'
+__email__ = 'elinevangroningen@gmail.com, mimounboulfich@live.nl, syrkavankuppenveld@gmail.com'
+__status__ = 'Dev'
+
+"""
+Code for the A* algorithm.
+
+
+This module contains the code for the A* maze router.
+"""
+
+
+class AStar(Greedy):
+    """
+    Creates a Wire object that connects the gates according to the netlist,
+    routing every net with an A* search over the grid.
+
+    Costs
+    -----
+    A step costs 1 per wire unit plus 300 if it lands on a node that is already
+    wired (an intersection), the same costs as the wire. The Manhattan Distance
+    to the goal is the heuristic, which never overestimates these costs.
+
+    Search
+    ------
+    Since A* explores the grid until the goal is reached, a net is always found
+    if a path exists. Only a net without any path raises a ValueError.
+
+    Random element
+    --------------
+    Ties between equally promising nodes are broken randomly.
+    """
+
+    # Costs of a wire unit and an intersection
+    COST_UNIT = 1
+    COST_INTERSECTION = 300
+
+    def step_costs(self, position, step, goal):
+        """
+        Returns the costs of the step, or None if the step is not allowed.
+
+        Parameters
+        ----------
+        position: a node
+                A node representing the current position of the wire.
+
+        step: a node
+                A node representing the next position of the wire.
+
+        goal: a node
+                A node representing the goal position on the grid.
+
+        Returns
+        -------
+        int
+                The costs of the step.
+        """
+
+        # The wire cannot be laid twice or run through another gate
+        if not self.wire.check_collision(position, step):
+            return None
+        if self.graph.is_gate(step):
+            return self.COST_UNIT if step == goal else None
+
+        # Each visit of an already wired node adds an intersection
+        if self.graph.get_intersection(step) > 0:
+            return self.COST_UNIT + self.COST_INTERSECTION
+
+        return self.COST_UNIT
+
+    def find_path(self, start, goal):
+        """
+        Returns the cheapest list of nodes from start to goal.
+
+        Parameters
+        ----------
+        start: a node
+                A node representing the start position on the grid.
+
+        goal: a node
+                A node representing the goal position on the grid.
+
+        Returns
+        -------
+        list
+                A list of nodes from start to goal.
+        """
+
+        # Open set of (estimated total costs, distance to goal, random tie breaker, node)
+        open_set = [(self.compute_manhattan_dist(start, goal), 0, random.random(), start)]
+        costs = {start: 0}
+        came_from = {start: None}
+        closed = set()
+
+        while open_set:
+            _, _, _, position = heapq.heappop(open_set)
+
+            # Reconstruct the path once the goal is reached
+            if position == goal:
+                path = []
+                while position is not None:
+                    path.append(position)
+                    position = came_from[position]
+                path.reverse()
+
+                return path
+
+            if position in closed:
+                continue
+            closed.add(position)
+
+            # Expand the neighbors of the current position
+            for neighbor in self.graph.get_neighbors(position):
+                if neighbor in closed:
+                    continue
+
+                step_costs = self.step_costs(position, neighbor, goal)
+                if step_costs is None:
+                    continue
+
+                new_costs = costs[position] + step_costs
+                if neighbor not in costs or new_costs < costs[neighbor]:
+                    costs[neighbor] = new_costs
+                    came_from[neighbor] = position
+                    dist = self.compute_manhattan_dist(neighbor, goal)
+                    heapq.heappush(open_set, (new_costs + dist, dist, random.random(), neighbor))
+
+        # No path exists
+        raise ValueError
+
+    def make_connection(self, gate_a, gate_b):
+        """
+        Returns the wire path between gate_a and gate_b.
+
+        Parameters
+        ----------
+        gate_a: a Gate object
+                A Gate object representing the start of the net.
+
+        gate_b: a Gate object
+                A Gate object representing the end of the net.
+
+        Returns
+        -------
+        list
+                A list containing the wire path to connect gate_a and gate_b.
+        """
+
+        # Get correspoding nodes for position(gate_a) and goal(gate_b)
+        position = self.graph.get_gate_node(gate_a)
+        goal = self.graph.get_gate_node(gate_b)
+
+        path = self.find_path(position, goal)
+
+        # Lay the wire along the path
+        wire_path = [self.graph.get_coords(position)]
+        for step in path[1:]:
+            self.wire.update_path(position, step)
+            self.wire.update_coords(step)
+
+            # Increment the intersection if step is not a gate
+            if not self.graph.is_gate(step):
+                self.graph.increment_intersection(step)
+
+            wire_path.append(self.graph.get_coords(step))
+            position = step
+
+        return wire_path
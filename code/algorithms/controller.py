@@ -0,0 +1,257 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+
+# Built-in/Generic Imports
+import time
+
+# Own modules
+from code.classes import Wire
+
+__author__ = 'Eline van Groningen, Mimoun Boulfich, Syrka van Kuppenveld'
+__copyright__ = 'Copyright 2020, Chips & Circuits'
+__credits__ = ['Eline van Groningen, Mimoun Boulfich, Syrka van Kuppenveld']
+__license__ = 'GNU GPL 3.0'
+__version__ = '0.1.0'
+__maintainer__ = 'Eline van Groningen, Mimoun Boulfich, Syrka van Kuppenveld'
+__email__ = 'elinevangroningen@gmail.com, mimounboulfich@live.nl, syrkavankuppenveld@gmail.com'
+__status__ = 'Dev'
+
+"""
+Code for the run controller.
+
+
+This module contains the code for stopping the algorithms on a time budget, an
+iteration budget or a number of iterations without improvement, and keeping the
+best solution found until then.
+"""
+
+
+class BudgetExhausted(ValueError):
+    """
+    Raised when the time budget of a run controller runs out while a solution is
+    being built, or when no solution was found within the budget.
+
+    Since it is a ValueError, the attempt that is being built is given up as any
+    other dead end.
+    """
+
+
+class RunController():
+    """
+    Stops a run on the first of its limits and keeps the cheapest feasible solution
+    seen so far.
+
+    Limits
+    ------
+    time_budget: the number of seconds since the start.
+    iterations: the number of iterations, an iteration is an attempt or an adjustment.
+    patience: the number of iterations in a row without a cheaper solution.
+
+    Anytime runs
+    ------------
+    With a controller, the Random and Greedy algorithms (and the algorithms based
+    on them) do not stop at their first solution, but keep building the netlist
+    from scratch until a limit is reached, and return the cheapest solution. The
+    HillClimber stops its climbs on the controller.
+    """
+
+    def __init__(self, time_budget=None, iterations=None, patience=None):
+        """
+        Initializes a RunController object.
+
+        Parameters
+        ----------
+        time_budget: a float
+                The maximum number of seconds, None for no limit.
+
+        iterations: an int
+                The maximum number of iterations, None for no limit.
+
+        patience: an int
+                The maximum number of iterations in a row without a cheaper
+                solution, None for no limit.
+        """
+
+        if time_budget is None and iterations is None and patience is None:
+            raise ValueError("a run controller needs a time budget, an iteration budget or a patience")
+
+        self.time_budget = time_budget
+        self.iterations = iterations
+        self.patience = patience
+
+        # Counters of the run
+        self.start_time = None
+        self.iteration = 0
+        self.since_improvement = 0
+        self.failures = 0
+
+        # The cheapest feasible solution and the limit that stopped the run
+        self.best_costs = None
+        self.best_solution = None
+        self.stop_reason = None
+
+    def start(self, costs=None, solution=None):
+        """
+        Starts the clock and resets the counters and the best solution.
+
+        Parameters
+        ----------
+        costs: an int
+                The costs of the solution the run starts from, if any.
+
+        solution: a dict
+                The solution the run starts from, None if there is none.
+        """
+
+        self.start_time = time.perf_counter()
+        self.iteration = 0
+        self.since_improvement = 0
+        self.failures = 0
+        self.best_costs = costs if solution is not None else None
+        self.best_solution = solution
+        self.stop_reason = None
+
+    def get_elapsed(self):
+        """
+        Returns the number of seconds since the start.
+
+        Returns
+        -------
+        float
+                The number of seconds since the start.
+        """
+
+        return time.perf_counter() - self.start_time
+
+    def get_progress(self):
+        """
+        Returns the fraction of the time or iteration budget that is used, whichever
+        is larger.
+
+        Returns
+        -------
+        float
+                The fraction from 0 to 1, 0 if there is no budget.
+        """
+
+        progress = 0.0
+
+        if self.iterations is not None:
+            progress = max(progress, self.iteration / self.iterations)
+
+        if self.time_budget is not None:
+            progress = max(progress, self.get_elapsed() / self.time_budget)
+
+        return min(progress, 1.0)
+
+    def check(self):
+        """
+        Raises BudgetExhausted if the time budget ran out. Called while a solution
+        is built, so a long attempt does not exceed the budget.
+        """
+
+        if self.time_budget is not None and self.get_elapsed() >= self.time_budget:
+            raise BudgetExhausted("the time budget ran out")
+
+    def update(self, costs, solution):
+        """
+        Counts an iteration and keeps the solution if it is the cheapest so far.
+
+        Parameters
+        ----------
+        costs: an int
+                The costs of the solution.
+
+        solution: a dict
+                The solution of the iteration, None if the iteration found none.
+
+        Returns
+        -------
+        bool
+                True if the solution is cheaper than the best one, else False.
+        """
+
+        self.iteration += 1
+
+        if solution is None:
+            self.failures += 1
+        elif self.best_solution is None or costs < self.best_costs:
+            self.best_costs = costs
+            self.best_solution = solution
+            self.since_improvement = 0
+            return True
+
+        self.since_improvement += 1
+
+        return False
+
+    def is_done(self):
+        """
+        Returns True if a limit is reached, and sets the limit as the stop reason.
+
+        Returns
+        -------
+        bool
+                True if the run has to stop, else False.
+        """
+
+        if self.iterations is not None and self.iteration >= self.iterations:
+            self.stop_reason = 'iterations'
+        elif self.time_budget is not None and self.get_elapsed() >= self.time_budget:
+            self.stop_reason = 'time'
+        elif self.patience is not None and self.since_improvement >= self.patience:
+            self.stop_reason = 'patience'
+
+        return self.stop_reason is not None
+
+    def run(self, algo):
+        """
+        Builds the netlist from scratch with the algorithm until a limit is reached,
+        lays the cheapest solution on the graph and returns it.
+
+        Parameters
+        ----------
+        algo: an algorithm object
+                An algorithm with a build_route method, which returns the route of
+                one attempt or raises a ValueError on a dead end.
+
+        Returns
+        -------
+        dict
+                A dictionary containing the route of the wire per connection.
+        """
+
+        self.start()
+
+        while not self.is_done():
+
+            # Every attempt starts from an empty grid
+            algo.graph.journal = None
+            algo.graph.clear_graph()
+            algo.wire = Wire(algo.graph)
+
+            try:
+                route = algo.build_route()
+            except BudgetExhausted:
+                self.stop_reason = 'time'
+                break
+            except ValueError:
+                self.update(None, None)
+                print(f"Restart {self.failures}...")
+                continue
+
+            if self.update(algo.wire.compute_costs(), route):
+                print(f"Iteration {self.iteration}: costs {self.best_costs}")
+
+        if self.best_solution is None:
+            raise BudgetExhausted("no solution was found within the budget")
+
+        # Lay the cheapest solution, so the wire of the algorithm is the best one
+        algo.graph.journal = None
+        algo.graph.clear_graph()
+        algo.wire = Wire(algo.graph)
+
+        for path in self.best_solution.values():
+            algo.wire.lay_path(path)
+
+        return self.best_solution
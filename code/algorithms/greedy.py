@@ -4,6 +4,7 @@
 # Built-in/Generic Imports
 import copy
 import random
+import time
 
 # Own modules
 from code.classes import Graph, Wire
@@ -24,14 +25,14 @@ Code for the Greedy Algorithm.
 
 This module contains the code for the Greedy algorithm and the extensions thereof. 
 These are: 
-* LookAhead: with a 4 step depth look ahead.
+* LookAhead: with a look ahead, 4 steps deep by default.
 * NoIntersect: intersections as hard constraint.
-* NoIntersectLookAhead: intersections as a hard constraint, and a 4 step look a head.
+* NoIntersectLookAhead: intersections as a hard constraint, and a look a head.
 * Costs: different costs formula.
-* LookAheadCosts: different costs formula and 4 step depth look ahead.
+* LookAheadCosts: different costs formula and a look ahead.
 * WireJam: different cost/distance formula, tries to avoid crowed wire places on grid.
 * LookAheadWireJam: different cost/distance formula, tries to avoid crowed wire places 
-  on grid with a 4 step depth look ahead. 
+  on grid with a look ahead. 
 
 """
 
@@ -51,6 +52,9 @@ class Greedy():
     distance.
     """
 
+    # Run controller that limits the run, None runs until a solution is found
+    controller = None
+
     def __init__(self, graph, order, approach):
         """
         Initializes the Random Greedy Net algorithm.
@@ -71,7 +75,7 @@ class Greedy():
  
         self.graph = graph
         self.order = order 
-        self.wire = Wire()
+        self.wire = Wire(self.graph)
         self.approach = approach
 
     def next_position(self, position, goal):
@@ -95,10 +99,10 @@ class Greedy():
         mdist = []
 
         # Iterate over neighbors current position
-        for neighbor in position.neighbors:
+        for neighbor in self.graph.get_neighbors(position):
 
             # If move is allowed compute and append Manhattan Distance
-            if self.wire.check_collision(position, neighbor) and (neighbor.isgate is False or neighbor == goal):
+            if self.wire.check_collision(position, neighbor) and (not self.graph.is_gate(neighbor) or neighbor == goal):
                 dist = self.compute_manhattan_dist(neighbor, goal)
                 mdist.append((neighbor, dist))
 
@@ -125,9 +129,12 @@ class Greedy():
                 The Manhattan Distance.
         """
 
-        x_dist = abs(position.xcoord - goal.xcoord)
-        y_dist = abs(position.ycoord - goal.ycoord)
-        z_dist = abs(position.zcoord - goal.zcoord)
+        position_x, position_y, position_z = self.graph.get_coords(position)
+        goal_x, goal_y, goal_z = self.graph.get_coords(goal)
+
+        x_dist = abs(position_x - goal_x)
+        y_dist = abs(position_y - goal_y)
+        z_dist = abs(position_z - goal_z)
 
         return x_dist + y_dist + z_dist
 
@@ -181,11 +188,11 @@ class Greedy():
         wire_path = []
 
         # Get correspoding nodes for position(gate_a) and goal(gate_b)
-        position = self.graph.nodes[(gate_a.xcoord, gate_a.ycoord, gate_a.zcoord)]
-        goal = self.graph.nodes[(gate_b.xcoord, gate_b.ycoord, gate_b.zcoord)]
+        position = self.graph.get_gate_node(gate_a)
+        goal = self.graph.get_gate_node(gate_b)
 
         # Add start position to wire path
-        wire_path.append((position.xcoord, position.ycoord, position.zcoord))
+        wire_path.append(self.graph.get_coords(position))
 
         # Iterate until connection has been made
         while position != goal:
@@ -201,130 +208,140 @@ class Greedy():
             self.wire.update_coords(position)
             
             # Increment position.intersection if position is not a gate
-            if position.isgate is False:
-                position.increment_intersection()
+            if not self.graph.is_gate(position):
+                self.graph.increment_intersection(position)
 
             # Append step to wire path
-            wire_path.append((position.xcoord, position.ycoord, position.zcoord))
+            wire_path.append(self.graph.get_coords(position))
         
         return wire_path
 
-    def run(self):
+    def build_route(self):
         """
-        Returns a dictionary with the wire route that connects all gates according 
-        to the netlist.
+        Returns a dictionary with the wire route of one attempt to connect all gates
+        according to the netlist.
+
+        Raises a ValueError if the wire gets stuck.
 
         Returns
         -------
         dict 
                 A dictionary containing the route of the wire per connection.
         """
-        
-        run_counter = 1
+
+        route = {}
 
         # Built connections based on an ordered list of connection which is  
         # pre-determined by a chosen heuristic
         if self.approach is True:
-            route = {}
-            
-            # Repeat run until solution is found
-            not_found = True
-            while not_found:
-                try:
 
-                    # Make deep copy of connection order
-                    connections = copy.deepcopy(self.order)
+            # Make deep copy of connection order
+            connections = copy.deepcopy(self.order)
 
-                    # Iterate until netlist is empyt
-                    while connections:
+            # Iterate until netlist is empyt
+            while connections:
 
-                        # Get random connection 
-                        connection = connections.pop(0)
+                # Stop the attempt if the budget of the controller ran out
+                if self.controller is not None:
+                    self.controller.check()
 
-                        # Get corresponding Gate objects
-                        a, b = connection[0], connection[1]
-                        gate_a, gate_b = self.graph.gates[a], self.graph.gates[b]
+                # Get random connection 
+                connection = connections.pop(0)
 
-                        # Generate the connection between gate a and b
-                        route[(a, b)] = self.make_connection(gate_a, gate_b)
-
-                    # Set not_found to False   
-                    not_found = False
-
-                except ValueError:
+                # Get corresponding Gate objects
+                a, b = connection[0], connection[1]
+                gate_a, gate_b = self.graph.gates[a], self.graph.gates[b]
 
-                    # Clear graph, wire and route
-                    self.graph.clear_graph()
-                    self.wire = Wire()
-                    route = {}
-
-                    # Print restart
-                    print(f"Restart {run_counter}...")
-                    run_counter += 1
+                # Generate the connection between gate a and b
+                route[(a, b)] = self.make_connection(gate_a, gate_b)
 
             return route
 
         # Built connections based on an ordered list of gates which is  
         # pre-determined by a chosen heuristic
-        else:
-            route = {}
-            completed = set()
-            
-            # Repeat run until solution is found
-            not_found = True
-            while not_found:
-                try:
+        completed = set()
 
-                    # Make deep copy of connection order
-                    gates = copy.deepcopy(self.order)
+        # Make deep copy of connection order
+        gates = copy.deepcopy(self.order)
 
-                    # Iterate until netlist is empyt
-                    while gates:
+        # Iterate until netlist is empyt
+        while gates:
 
-                        # Get gate object and corresponding connections
-                        gateID = gates.pop(0)
-                        gate_a = self.graph.gates[gateID]
+            # Stop the attempt if the budget of the controller ran out
+            if self.controller is not None:
+                self.controller.check()
 
-                        # Check if gate_a in connections
-                        if gate_a in self.graph.connections:
+            # Get gate object and corresponding connections
+            gateID = gates.pop(0)
+            gate_a = self.graph.gates[gateID]
 
-                            # Get corresponding connections
-                            connections = self.graph.connections[gate_a]
+            # Check if gate_a in connections
+            if gate_a in self.graph.connections:
 
-                            # Iterate until connections is empty
-                            while connections:
+                # Get copy of the corresponding connections
+                connections = set(self.graph.connections[gate_a])
 
-                                # Generate next connection
-                                gate_b = connections.pop()
+                # Iterate until connections is empty
+                while connections:
 
-                                # Check if connection is already completed
-                                a, b = gate_a.gateID, gate_b.gateID
-                                connection = tuple(sorted((a, b)))
-                                if connection not in completed:
-            
-                                    # Generate the connection between gate a and b
-                                    route[(a, b)] = self.make_connection(gate_a, gate_b)
+                    # Generate next connection
+                    gate_b = connections.pop()
+
+                    # Check if connection is already completed
+                    a, b = gate_a.gateID, gate_b.gateID
+                    connection = tuple(sorted((a, b)))
+                    if connection not in completed:
+
+                        # Generate the connection between gate a and b
+                        route[(a, b)] = self.make_connection(gate_a, gate_b)
 
-                                    # Add connection to completed
-                                    completed.add(connection)
+                        # Add connection to completed
+                        completed.add(connection)
 
-                    # Set not_found to Flase   
-                    not_found = False
+        return route
 
-                except ValueError:
+    def run(self):
+        """
+        Returns a dictionary with the wire route that connects all gates according 
+        to the netlist.
 
-                    # Clear graph, wire and route
-                    self.graph.clear_graph()
-                    self.wire = Wire()
-                    completed = set()
-                    route = {}
+        Returns
+        -------
+        dict 
+                A dictionary containing the route of the wire per connection.
+        """
 
-                    # Print restart
-                    print(f"Restart {run_counter}...")
-                    run_counter += 1
+        # Keep the cheapest route of the attempts within the limits of the controller
+        if self.controller is not None:
+            route = self.controller.run(self)
+            self.restarts = self.controller.failures
 
             return route
 
+        run_counter = 1
+
+        # Repeat run until solution is found
+        not_found = True
+        while not_found:
+            try:
+                route = self.build_route()
+                not_found = False
+
+            except ValueError:
+
+                # Clear graph and wire
+                self.graph.clear_graph()
+                self.wire = Wire(self.graph)
+
+                # Print restart
+                print(f"Restart {run_counter}...")
+                run_counter += 1
+
+        # Number of restarts needed to find a solution
+        self.restarts = run_counter - 1
+
+        return route
+
 
 class GreedyLookAhead(Greedy):
     """ 
@@ -342,233 +359,419 @@ class GreedyLookAhead(Greedy):
 
     Look ahead
     ----------
-    Depth of 4.
-
+    Depth of 4, unless another depth is given.
+
+    Search
+    ------
+    The look ahead is a depth-first search over fixed-size arrays, indexed by the 
+    node indices of the graph. The allowed moves and the costs of a node are only 
+    computed once per search, and the allowed moves are kept for the next search 
+    if it starts from the chosen step.
+
+    The search deepens one step at a time up to the depth, and skips a branch once 
+    its costs plus a lower bound for the remaining steps exceed the cheapest path 
+    found. If a node or time budget is given and runs out, the next position is 
+    chosen from the deepest search that was completed.
     """
 
-    def next_position(self, position, goal):
+    # True if the costs of a step do not change when the wire is extended
+    REUSE_COSTS = True
+
+    # Look ahead settings, also used by subclasses that do not call __init__
+    depth = 4
+    node_budget = None
+    time_budget = None
+
+    # Search tables, allocated on the first search
+    on_path = None
+    last_step = None
+
+    def __init__(self, graph, order, approach, depth=4, node_budget=None, time_budget=None):
+        """
+        Initializes the Greedy LookAhead algorithm.
+
+        Parameters
+        ----------
+        graph: a Graph object
+                A Graph object representing the chip grid.
+
+        order: a list
+                A list of either gates or connections that indicates the order in 
+                which the connections/nets of the netlist will be build.
+
+        approach: boolean
+                A boolean of which True indicates that "order" is a list of 
+                connections and False indicates a list of gates.
+
+        depth: an int
+                The number of steps to look ahead.
+
+        node_budget: an int
+                The maximum number of steps the look ahead may try per position, 
+                None for no maximum.
+
+        time_budget: a float
+                The maximum number of seconds the look ahead may take per position, 
+                None for no maximum.
+        """
+
+        super().__init__(graph, order, approach)
+
+        self.depth = depth
+        self.node_budget = node_budget
+        self.time_budget = time_budget
+
+    def init_search(self):
+        """
+        Allocates the tables of the look ahead search.
+        """
+
+        size = self.graph.size
+
+        # A node is on the current path if its stamp equals the search stamp
+        self.on_path = [0] * size
+        self.search_stamp = 0
+
+        # Allowed moves and costs per node, valid if their stamp equals the epoch
+        self.moves = [None] * size
+        self.moves_stamp = [0] * size
+        self.moves_epoch = 0
+        self.costs = [0] * size
+        self.costs_stamp = [0] * size
+        self.costs_epoch = 0
+
+        # Manhattan Distance to the goal per node, for the lower bounds
+        self.distances = [0] * size
+
+        # Fixed-size stack with the node, moves left and path costs per depth
+        self.stack_nodes = [None] * (self.depth + 1)
+        self.stack_moves = [None] * (self.depth + 1)
+        self.stack_left = [0] * (self.depth + 1)
+        self.stack_costs = [0] * (self.depth + 1)
+
+    def step_allowed(self, position, step):
         """
-        Returns next position according to 4 steps look ahead.
+        Returns True if the wire may be extended from position to step, otherwise 
+        False.
 
         Parameters
         ----------
         position: a Node object
                 A Node object representing the current position of the wire.
 
-        goal: a Node object
-                A Node object representing the goal position.
-        
+        step: a Node object
+                A Node object representing the next position of the wire.
+
         Returns
         -------
-        Node object
-                The Node object that will be the new position of the wire.
+        bool
+                True if the step is allowed, otherwise False.
         """
 
-        DEPTH = 4
-        stack = [[]]
-        paths = []
+        return self.wire.check_collision(position, step)
 
-        # Set first to True
-        first = True
+    def step_cost(self, position, step, goal):
+        """
+        Returns the costs of a step of a look ahead path.
 
-        # Iterate until the stack is empty
-        while len(stack) > 0:
-            state = stack.pop()
+        Parameters
+        ----------
+        position: a Node object
+                A Node object representing the position from which is looked ahead.
 
-            # Append the state to path if first iteration is false and it reached the goal 
-            # gate or if state length equals the depth
-            length = len(state)
-            if first is False and (length == DEPTH + 1 or state[length - 1] == goal):
-                paths.append(state)
+        step: a Node object
+                A Node object representing a step of the path.
 
-            # Only continue if len state does not exceed the depth
-            # depth + 1 >> because the current position is also added to the state in the
-            # first iteration, however, this should not be included as a depth level
-            elif len(state) < DEPTH + 1:
-                
-                # Assign next position according to first
-                if first:
-                    position_next = position
-                else:
-                    position_next = state[len(state) - 1]
-
-                # Iterate over neighbors of the current position
-                for neighbor in position_next.neighbors:
-     
-                    # Different approach for first iteration
-                    if first:
-                        child = [position_next.get_copy(), neighbor.get_copy()]
-
-                        # Return position if goal gate is reached and no collision is caused
-                        if (neighbor.xcoord, neighbor.ycoord, neighbor.zcoord) == (goal.xcoord, goal.ycoord, goal.zcoord) and self.wire.check_collision(position_next, neighbor):
-
-                            # Get corresponding position from original graph nodes
-                            position = self.graph.nodes[(neighbor.xcoord, neighbor.ycoord, neighbor.zcoord)]
-                            return position
-
-                        # Only append path if no collission occurs
-                        elif self.wire.check_collision(position_next, neighbor):
-                            stack.append(child)
-                    else:
-                        child = self.copy_nodes(state)
-
-                        # Only append if valid
-                        if self.path_check(child, position_next, neighbor) and self.valid_check(child, neighbor):
-                            child.append(neighbor)
-                            stack.append(child)
-
-                # Set first to False
-                first = False
-
-        # Generate list with all path distances
-        mdist = self.all_distances(paths, goal)
-
-        # Get next position 
-        position = self.get_random_min(mdist)
+        goal: a Node object
+                A Node object repesenting the goal position on the grid.
 
-        # Get corresponding position from orginal graph nodes
-        position = self.graph.nodes[(position.xcoord, position.ycoord, position.zcoord)]
+        Returns
+        -------
+        int
+                The costs of the step.
+        """
 
-        return position
+        return self.compute_manhattan_dist(step, goal)
 
-    def copy_nodes(self, state):
+    def get_moves(self, node):
         """
-        Returns a 'deep' copy of list of nodes.
+        Returns the allowed moves from a node, computed once per epoch.
 
         Parameters
         ----------
-        state: a list
-                A list containing Node objects representing a wire path.
+        node: a Node object
+                A Node object on the grid.
 
-        Returns 
+        Returns
         -------
         list
-                A list containing 'deep' copy of the nodes in the original list.
+                A list of the neighbors to which the wire may be extended.
         """
 
-        copy = []
-        for node in state:
-            node_copy = node.get_copy()
-            copy.append(node_copy)
+        index = self.graph.get_index(node)
+        if self.moves_stamp[index] != self.moves_epoch:
+            self.moves[index] = [neighbor for neighbor in self.graph.get_neighbors(node) if self.step_allowed(node, neighbor)]
+            self.moves_stamp[index] = self.moves_epoch
 
-        return copy
+        return self.moves[index]
 
-    def path_check(self, child, position, neighbor):
+    def get_cost(self, position, step, goal):
         """
-        Returns True if path is valid, otherwise False.
-        
+        Returns the costs of a step, computed once per epoch.
+
         Parameters
         ----------
-        child: a list 
-                A list containing Node objects representing a wire path.
-
         position: a Node object
-                A node object representing the current position of the wire in 
-                the grid.
+                A Node object representing the position from which is looked ahead.
+
+        step: a Node object
+                A Node object representing a step of the path.
 
-        neighbor: a Node object 
-                A Node object representing the neighbor of the current position of 
-                the wire.
+        goal: a Node object
+                A Node object repesenting the goal position on the grid.
 
-        Returns 
+        Returns
         -------
-        bool
-                True if successful, otherwise False.
+        int
+                The costs of the step.
         """
 
-        # Get corresponding Node object from graph
-        neighbor_coords = neighbor.xcoord, neighbor.ycoord, neighbor.zcoord
-        neighbor_node = self.graph.nodes[neighbor_coords]
+        index = self.graph.get_index(step)
+        if self.costs_stamp[index] != self.costs_epoch:
+            self.costs[index] = self.step_cost(position, step, goal)
+            self.costs_stamp[index] = self.costs_epoch
+
+            # The Manhattan Distance itself, also if a subclass adds costs to it
+            self.distances[index] = Greedy.compute_manhattan_dist(self, step, goal)
 
-        return self.wire.check_collision(position, neighbor) and neighbor_node not in child
+        return self.costs[index]
 
-    def valid_check(self, child, neighbor):
+    def lower_bound(self, distance, steps):
         """
-        Returns True if move is valid, otherwise False.
-        
+        Returns a lower bound for the costs of the remaining steps of a path.
+
+        Each step costs at least its Manhattan Distance to the goal, which decreases 
+        by at most 1 per step, and a path ends at the goal.
+
         Parameters
         ----------
-        child: a list 
-                A list containing Node objects representing a wire path.
+        distance: an int
+                The Manhattan Distance of the last step of the path to the goal.
 
-        neighbor: a Node object 
-                A Node object representing the neighbour of the current position 
-                of the wire.
+        steps: an int
+                The number of steps left.
 
-        Returns 
+        Returns
         -------
-        bool
-                True if successful, otherwise False.
+        int
+                The lower bound of the costs.
         """
 
-        # Get coordinates of neighbor
-        neighbor_x, neighbor_y, neighbor_z = neighbor.xcoord, neighbor.ycoord, neighbor.zcoord
+        if steps >= distance:
+            return distance * (distance - 1) // 2
 
-        # Get coordinates of last position in child
-        last = len(child) - 1
-        child_x, child_y, child_z = child[last].xcoord, child[last].ycoord, child[last].zcoord
+        return steps * distance - steps * (steps + 1) // 2
 
-        # Compute absolute difference between child and neighbor
-        x_diff = abs(child_x - neighbor_x)
-        y_diff = abs(child_y - neighbor_y)
-        z_diff = abs(child_z - neighbor_z)
-        abs_diff = x_diff + y_diff + z_diff
+    def start_search(self, position, goal):
+        """
+        Invalidates the allowed moves and costs that may have changed since the last 
+        search.
 
-        return abs_diff == 1 and x_diff < 2 and y_diff < 2 and z_diff < 2
+        Parameters
+        ----------
+        position: a Node object
+                A Node object representing the current position of the wire.
 
-    def all_distances(self, paths, goal):
+        goal: a Node object
+                A Node object representing the goal position.
         """
-        Returns the list with all distances and their corresponding total 
-        (Manhattan) costs.
-        
+
+        if self.on_path is None:
+            self.init_search()
+
+        # Only the step from the last search was laid, which changes the moves of
+        # its neighborhood
+        if self.last_step == (position, goal):
+            self.moves_stamp[self.graph.get_index(position)] = 0
+            for neighbor in self.graph.get_neighbors(position):
+                self.moves_stamp[self.graph.get_index(neighbor)] = 0
+        else:
+            self.moves_epoch += 1
+            self.costs_epoch += 1
+
+        if not self.REUSE_COSTS:
+            self.costs_epoch += 1
+
+    def make_connection(self, gate_a, gate_b):
+        """
+        Returns the wire path between gate_a and gate_b.
+
         Parameters
         ----------
-        path: a list
-                A list containing all valid paths for a four step look ahead.
+        gate_a: a Gate object
+                A Gate object representing the start of the net.
 
-        goal: a Node object
-                A Node object repesenting the goal position on the grid.
+        gate_b: a Gate object
+                A Gate object representing the end of the net.
 
-        Returns 
+        Returns
         -------
-        list        
-                A list with tuples. First element of tuple is the neighbour and 
-                the second element is the path's costs. 
+        tuple
+                A tuple containing the wire path to connect gate_a and gate_b.
         """
 
-        costs = []
-
-        # Compute the number of steps (= cost) needed to get to the goal gate
-        for path in paths:
-            total_dist = self.path_distance(path, goal)
-            costs.append((path[1], total_dist))
+        # The moves of an earlier search are not valid anymore after other edits
+        self.last_step = None
 
-        return costs
+        return super().make_connection(gate_a, gate_b)
 
-    def path_distance(self, path, goal):
+    def search(self, position, goal, moves, depth, deadline):
         """
-        Returns the Manhattan Distance for total path.
-        
+        Returns the first steps of the cheapest paths of the given depth, or None if 
+        the budget ran out.
+
         Parameters
         ----------
-        path: a list
-                A list of Nodes representing a wire path.
+        position: a Node object
+                A Node object representing the current position of the wire.
 
         goal: a Node object
-                A Node object repesenting the goal position on the grid.
+                A Node object representing the goal position.
+
+        moves: a list
+                The allowed moves from position, the last one is tried first.
+
+        depth: an int
+                The number of steps of the paths.
 
-        Returns 
+        deadline: a float
+                The time.perf_counter() at which the time budget runs out, None for 
+                no time budget.
+
+        Returns
         -------
-        int
-                The Manhattan Distance of the total path.
+        list
+                The first step of every cheapest path, once per path.
         """
+
+        self.search_stamp += 1
+        stamp = self.search_stamp
+        on_path = self.on_path
+        distances = self.distances
+        nodes, stack_moves, left, costs = self.stack_nodes, self.stack_moves, self.stack_left, self.stack_costs
+
+        nodes[0], stack_moves[0], left[0], costs[0] = position, moves, len(moves), 0
+        on_path[self.graph.get_index(position)] = stamp
+
+        best = None
+        choices = []
+
+        # Depth-first search, the moves are taken last first, as the paths were
+        # popped of a stack before
+        level = 0
+        while level >= 0:
+
+            # Backtrack if all moves from this level are tried
+            if left[level] == 0:
+                on_path[self.graph.get_index(nodes[level])] = 0
+                level -= 1
+                continue
+
+            left[level] -= 1
+            step = stack_moves[level][left[level]]
+            index = self.graph.get_index(step)
+            if on_path[index] == stamp:
+                continue
+
+            # Stop if the budget ran out, the shallowest search is always completed
+            self.tried += 1
+            if depth > 1:
+                if self.node_budget is not None and self.tried > self.node_budget:
+                    return None
+                if deadline is not None and self.tried % 64 == 0 and time.perf_counter() > deadline:
+                    return None
+
+            cost = costs[level] + self.get_cost(position, step, goal)
+
+            # A path ends at the depth or at the goal, keep the first steps of the 
+            # cheapest paths
+            if level + 1 == depth or step == goal:
+                first = nodes[1] if level > 0 else step
+                if best is None or cost < best:
+                    best = cost
+                    choices = [first]
+                elif cost == best:
+                    choices.append(first)
+                continue
+
+            # Skip the branch if it cannot become as cheap as the cheapest path
+            if best is not None and cost + self.lower_bound(distances[index], depth - level - 1) > best:
+                continue
+
+            level += 1
+            moves = self.get_moves(step)
+            nodes[level], stack_moves[level], left[level], costs[level] = step, moves, len(moves), cost
+            on_path[index] = stamp
+
+        return choices
+
+    def next_position(self, position, goal):
+        """
+        Returns next position according to the look ahead.
+
+        Parameters
+        ----------
+        position: a Node object
+                A Node object representing the current position of the wire.
+
+        goal: a Node object
+                A Node object representing the goal position.
         
-        dist = 0
-        for i, step in enumerate(path):
-            if i > 0:
-                dist += self.compute_manhattan_dist(step, goal)
+        Returns
+        -------
+        Node object
+                The Node object that will be the new position of the wire.
+        """
 
-        return dist
+        self.start_search(position, goal)
+
+        # Return goal if it can be reached directly
+        moves = self.get_moves(position)
+        if goal in moves:
+            self.last_step = None
+            return goal
+
+        self.tried = 0
+        deadline = None
+        if self.time_budget is not None:
+            deadline = time.perf_counter() + self.time_budget
+
+        # Deepen the search one step at a time, so that a completed search is left 
+        # when the budget runs out
+        choices = []
+        for depth in range(1, self.depth + 1):
+            deeper = self.search(position, goal, moves, depth, deadline)
+            if deeper is None:
+                break
+            choices = deeper
+
+            # Deeper paths start with a shallower one, so none exist if no path does
+            if not choices:
+                break
+
+            # Try the first steps of the cheapest paths first, which finds a cheap 
+            # path early and so skips more branches in the deeper search
+            preferred = set(choices)
+            moves = [move for move in moves if move not in preferred] + [move for move in moves if move in preferred]
+
+        # No path of the look ahead can be built
+        if not choices:
+            raise ValueError
+
+        position = random.choice(choices)
+        self.last_step = (position, goal)
+
+        return position
 
 
 class GreedyNoIntersect(Greedy):
@@ -609,10 +812,10 @@ class GreedyNoIntersect(Greedy):
         mdist = []
 
         # Iterate over neighbors current position
-        for neighbor in position.neighbors:
+        for neighbor in self.graph.get_neighbors(position):
 
             # If move is allowed compute and append Manhattan Distance
-            if self.wire.check_collision(position, neighbor) and neighbor.intersection == 0 and (neighbor.isgate is False or neighbor == goal):
+            if self.wire.check_collision(position, neighbor) and self.graph.get_intersection(neighbor) == 0 and (not self.graph.is_gate(neighbor) or neighbor == goal):
                 dist = self.compute_manhattan_dist(neighbor, goal)
                 mdist.append((neighbor, dist))
                   
@@ -642,11 +845,11 @@ class GreedyNoIntersect(Greedy):
         wire_path = []
 
         # Get correspoding nodes for position(gate_a) and goal(gate_b)
-        position = self.graph.nodes[(gate_a.xcoord, gate_a.ycoord, gate_a.zcoord)]
-        goal = self.graph.nodes[(gate_b.xcoord, gate_b.ycoord, gate_b.zcoord)]
+        position = self.graph.get_gate_node(gate_a)
+        goal = self.graph.get_gate_node(gate_b)
 
         # Add start position to wire path
-        wire_path.append((position.xcoord, position.ycoord, position.zcoord))
+        wire_path.append(self.graph.get_coords(position))
 
         # Iterate until connection has been made
         while position != goal:
@@ -662,16 +865,16 @@ class GreedyNoIntersect(Greedy):
             self.wire.update_coords(position)
 
             # Increment position.intersection if position is not a gate
-            if position.isgate is False:
-                position.increment_intersection()
+            if not self.graph.is_gate(position):
+                self.graph.increment_intersection(position)
 
             # Append step to wire path
-            wire_path.append((position.xcoord, position.ycoord, position.zcoord))
+            wire_path.append(self.graph.get_coords(position))
         
         return tuple(wire_path)
 
 
-class GreedyNoIntersectLookAhead(GreedyNoIntersect):
+class GreedyNoIntersectLookAhead(GreedyLookAhead, GreedyNoIntersect):
     """ 
     Creates a Wire object that connects the gates according to the netlist 
     and the lowest Manhattan Distance. For this algorithm, intersections
@@ -691,227 +894,26 @@ class GreedyNoIntersectLookAhead(GreedyNoIntersect):
     Depth of 4.
     """
 
-    def next_position(self, position, goal):
+    def step_allowed(self, position, step):
         """
-        Returns next position occuring to 4 steps look ahead.
+        Returns True if the wire may be extended from position to step without a 
+        collision or an intersection, otherwise False.
 
         Parameters
         ----------
         position: a Node object
                 A Node object representing the current position of the wire.
 
-        goal: a Node object
-                A Node object representing the goal position on the grid.
-        
-        Returns
-        -------
-        Node object
-                The Node object that will be the new position of the wire.
-        """
-
-        DEPTH = 4
-        stack = [[]]
-        paths = []
-
-        # Set first to True
-        first = True
-
-        # Iterate until the stack is empty
-        while len(stack) > 0:
-            state = stack.pop()
-
-            # Append the state to path if first iteration is false and it reached the goal 
-            # gate or state length equals the depth
-            length = len(state)
-            if first is False and (length == DEPTH + 1 or state[length - 1] == goal):
-                paths.append(state)
-
-            # Only continue if len state does not exceed the depth
-            # depth + 1 >> because the current position is also added to the state in the
-            # first iteration, however, this should not be included as a depth level
-            elif len(state) < DEPTH + 1:
-                
-                # Assign next position according to first
-                if first:
-                    position_next = position
-                else:
-                    position_next = state[len(state) - 1]
-
-                # Iterate over neighbors current position
-                for neighbor in position_next.neighbors:
-     
-                    # Different approach for first iteration
-                    if first and neighbor.intersection ==  0:
-                        child = [position_next.get_copy(), neighbor.get_copy()]
-
-                        # Return position if goal gate is reached and no collision is caused
-                        if (neighbor.xcoord, neighbor.ycoord, neighbor.zcoord) == (goal.xcoord, goal.ycoord, goal.zcoord) and self.wire.check_collision(position_next, neighbor):
-
-                            # Get corresponding position from original graph nodes
-                            position = self.graph.nodes[(neighbor.xcoord, neighbor.ycoord, neighbor.zcoord)]
-                            return position
-
-                        # Only append neighbor if no collission or intersection occurs
-                        elif self.wire.check_collision(position_next, neighbor) and neighbor.intersection == 0:
-                            stack.append(child)
-                    else:
-                        child = self.copy_nodes(state)
-
-                        # Only append if neighbor is valid
-                        if self.path_check(child, position_next, neighbor) and self.valid_check(child, neighbor):
-                            child.append(neighbor)
-                            stack.append(child)
-
-                # Set first to False
-                first = False
-
-        # Generate list with all path distances
-        mdist = self.all_distances(paths, goal)
-
-        # Get next position 
-        position = self.get_random_min(mdist)
-
-        # Get corresponding position form orginal graph nodes
-        position = self.graph.nodes[(position.xcoord, position.ycoord, position.zcoord)]
-
-        return position
-
-    def copy_nodes(self, state):
-        """
-        Returns a 'deep' copy of list of nodes.
-
-        Parameters
-        ----------
-        state: a list
-                A list containing Node objects representing a wire path.
-
-        Returns 
-        -------
-        list
-                A list containing 'deep' copy of the nodes in the original list.
-        """
-
-        copy = []
-        for node in state:
-            node_copy = node.get_copy()
-            copy.append(node_copy)
-
-        return copy
-
-    def path_check(self, child, position, neighbor):
-        """
-        Returns True if path is valid, otherwise False.
-        
-        Parameters
-        ----------
-        child: a list 
-                A list containing Node objects representing a wire path.
-
-        position: a Node object
-                A node object representing the current position of the wire in 
-                the grid.
-
-        neighbor: a Node object 
-                A Node object representing the neighbor of the current position of 
-                the wire.
-
-        Returns 
-        -------
-        bool
-                True if successful, otherwise False.
-        """
-       
-        neighbor_coords = neighbor.xcoord, neighbor.ycoord, neighbor.zcoord
-        neighbor_node = self.graph.nodes[neighbor_coords]
-
-        return self.wire.check_collision(position, neighbor) and neighbor.intersection == 0 and neighbor_node not in child
-
-    def valid_check(self, child, neighbor):
-        """
-        Returns True if move is valid, otherwise False.
-        
-        Parameters
-        ----------
-        child: a list 
-                A list containing Node objects representing a wire path.
-
-        neighbor: a Node object 
-                A Node object representing the neighbour of the current position of 
-                the wire.
+        step: a Node object
+                A Node object representing the next position of the wire.
 
-        Returns 
+        Returns
         -------
         bool
-                True if successful, otherwise False.
+                True if the step is allowed, otherwise False.
         """
 
-        # Get coordinates of neighbor
-        neighbor_x, neighbor_y, neighbor_z = neighbor.xcoord, neighbor.ycoord, neighbor.zcoord
-
-        # Get coordinates of last position in child
-        last = len(child) - 1
-        child_x, child_y, child_z = child[last].xcoord, child[last].ycoord, child[last].zcoord
-
-        # Compute absolute difference between child and neighbour
-        x_diff = abs(child_x - neighbor_x)
-        y_diff = abs(child_y - neighbor_y)
-        z_diff = abs(child_z - neighbor_z)
-        abs_diff = x_diff + y_diff + z_diff
-
-        return abs_diff == 1 and x_diff < 2 and y_diff < 2 and z_diff < 2
-
-    def all_distances(self, paths, goal):
-        """
-        Returns the list with all distances and their corresponding total distance.
-        
-        Parameters
-        ----------
-        paths: a list
-                A list containing all valid paths for a four step look ahead.
-
-        goal: a Node object
-                A Node object repesenting the goal position on the grid.
-
-        Returns 
-        -------
-                A list with tuples. First element of tuple is the neighbour and 
-                the second element is the Manhattan distance. 
-
-        """
-
-        mdist = []
-
-        for path in paths:
-            total_dist = self.path_distance(path, goal)
-            mdist.append((path[1], total_dist))
-
-        return mdist
-
-    def path_distance(self, path, goal):
-        """
-        Returns the Manhattan Distance for total path.
-        
-        Parameters
-        ----------
-        path: a list
-                A list of Nodes representing a wire path.
-
-        goal: a Node object
-                A Node object repesenting the goal position on the grid. 
-
-        Returns 
-        -------
-        int
-                The Manhattan Distance of the total path.
-        
-        """
-        
-        dist = 0
-        for i, step in enumerate(path):
-            if i > 0:
-                dist += self.compute_manhattan_dist(step, goal)
-
-        return dist
+        return self.wire.check_collision(position, step) and self.graph.get_intersection(step) == 0
 
 
 class GreedyCosts(Greedy):
@@ -932,10 +934,33 @@ class GreedyCosts(Greedy):
     -----
     The cost assigned to the step are higher if the step remaings on the lower 4 layers
     of the chip and if the step and its neighbors already are wired, in order to avoid 
-    these places on the grid. 
+    these places on the grid. The weights are the COST_ class attributes and the costs
+    per node are kept in a CostField. 
 
     """
 
+    # Weights of the wire costs, see CostField
+    COST_LAYER_0 = 10
+    COST_LAYER_1 = 8
+    COST_LAYER_2 = 6
+    COST_LAYER_3 = 4
+    COST_INTERSECTION = 10
+    COST_NEIGHBORS = 2
+
+    def get_cost_field(self):
+        """
+        Returns the CostField of the graph with the weights of the algorithm.
+
+        Returns
+        -------
+        CostField object
+                The cost field that holds the wire costs of a step per node.
+        """
+
+        layer_costs = (self.COST_LAYER_0, self.COST_LAYER_1, self.COST_LAYER_2, self.COST_LAYER_3)
+
+        return self.graph.get_cost_field(layer_costs, self.COST_INTERSECTION, self.COST_NEIGHBORS)
+
     def compute_wire_costs(self, position, step, goal):
         """
         Increases cost of the step if the step is in the lower layers of the 
@@ -961,19 +986,9 @@ class GreedyCosts(Greedy):
                 The wire costs of the step.
         """
         
-        # Magic numbers
-        COST_LAYER_0 = 10
-        COST_LAYER_1 = 8
-        COST_LAYER_2 = 6
-        COST_LAYER_3 = 4
-        COST_INTERSECTION = 10
-        COST_NEIGHBORS = 2
-
         # Get the coordinates of step and goal
-        step_coords = step.xcoord, step.ycoord, step.zcoord
-        goal_coords = goal.xcoord, step.ycoord, step.zcoord
-
-        cost = 0
+        step_coords = self.graph.get_coords(step)
+        goal_coords = self.graph.get_coords(goal)[0], step_coords[1], step_coords[2]
 
         # Get Manhatten distance between the current step and the 
         # goal coordinate
@@ -981,28 +996,11 @@ class GreedyCosts(Greedy):
 
         # Only add extra costs if step is not goal
         if step_coords != goal_coords and dist > 4:
-            
-            # Add costs according to the layer on which the step lies (zcoord)
-            if step.zcoord == 0:
-                cost += COST_LAYER_0
-            elif step.zcoord == 1:
-                cost += COST_LAYER_1
-            elif step.zcoord == 2:
-                cost += COST_LAYER_2
-            elif step.zcoord == 3:
-                cost += COST_LAYER_3
-
-            # Increment the costs for intersections
-            if step.intersection > 0:
-                cost += COST_INTERSECTION
-
-            # Increment the costs with 2 per neighbor of the step who is 
-            # alread wired
-            for neighbor in step.neighbors:
-                if neighbor.intersection > 0:
-                    cost += COST_NEIGHBORS
-
-        return cost
+
+            # Costs of the layer of the step, its intersection and its wired neighbors
+            return self.get_cost_field().get_cost(step)
+
+        return 0
 
     def compute_total_costs(self, position, step, goal):
         """
@@ -1056,10 +1054,10 @@ class GreedyCosts(Greedy):
         mdist = []
 
         # Iterate over neighbors current position
-        for neighbor in position.neighbors:
+        for neighbor in self.graph.get_neighbors(position):
 
             # If move is allowed compute and append Manhattan Distance
-            if self.wire.check_collision(position, neighbor) and (neighbor.isgate is False or neighbor == goal):
+            if self.wire.check_collision(position, neighbor) and (not self.graph.is_gate(neighbor) or neighbor == goal):
                 dist = self.compute_total_costs(position, neighbor, goal)
                 mdist.append((neighbor, dist))
 
@@ -1091,93 +1089,34 @@ class GreedyLookAheadCosts(GreedyLookAhead):
     -----
     The cost assigned to the step are higher if the step remaings on the lower 4 layers
     of the chip and if the step and its neighbors already are wired, in order to avoid 
-    these places on the grid. 
+    these places on the grid. The weights are the COST_ class attributes and the costs
+    per node are kept in a CostField. 
     """
 
-    def next_position(self, position, goal):
-        """
-        Returns next position according to 4 steps look ahead.
+    # The costs depend on the intersections, which change when the wire is extended
+    REUSE_COSTS = False
 
-        Parameters
-        ----------
-        position: a Node object
-                A Node object representing the current position of the wire.
+    # Weights of the wire costs, see CostField
+    COST_LAYER_0 = 10
+    COST_LAYER_1 = 8
+    COST_LAYER_2 = 6
+    COST_LAYER_3 = 4
+    COST_INTERSECTION = 10
+    COST_NEIGHBORS = 2
+
+    def get_cost_field(self):
+        """
+        Returns the CostField of the graph with the weights of the algorithm.
 
-        goal: a Node object
-                A Node object representing the goal position.
-        
         Returns
         -------
-        Node object
-                The Node object that will be the new position of the wire.
+        CostField object
+                The cost field that holds the wire costs of a step per node.
         """
 
-        DEPTH = 4
-        stack = [[]]
-        paths = []
-
-        # Set first to True
-        first = True
+        layer_costs = (self.COST_LAYER_0, self.COST_LAYER_1, self.COST_LAYER_2, self.COST_LAYER_3)
 
-        # Iterate until the stack is empty
-        while len(stack) > 0:
-            state = stack.pop()
-
-            # Append the state to path if first iteration is false and it reached the goal 
-            # gate or if state length equals the depth
-            length = len(state)
-            if first is False and (length == DEPTH + 1 or state[length - 1] == goal):
-                paths.append(state)
-
-            # Only continue if len state does not exceed the depth
-            # depth + 1 >> because the current position is also added to the state in the
-            # first iteration, however, this should not be included as a depth level
-            elif len(state) < DEPTH + 1:
-                
-                # Assign next position according to first
-                if first:
-                    position_next = position
-                else:
-                    position_next = state[len(state) - 1]
-
-                # Iterate over neighbors of the current position
-                for neighbor in position_next.neighbors:
-     
-                    # Different approach for first iteration
-                    if first:
-                        child = [position_next.get_copy(), neighbor.get_copy()]
-
-                        # Return position if goal gate is reached and no collision is caused
-                        if (neighbor.xcoord, neighbor.ycoord, neighbor.zcoord) == (goal.xcoord, goal.ycoord, goal.zcoord) and self.wire.check_collision(position_next, neighbor):
-
-                            # Get corresponding position from original graph nodes
-                            position = self.graph.nodes[(neighbor.xcoord, neighbor.ycoord, neighbor.zcoord)]
-                            return position
-
-                        # Only append path if no collission occurs
-                        elif self.wire.check_collision(position_next, neighbor):
-                            stack.append(child)
-                    else:
-                        child = self.copy_nodes(state)
-
-                        # Only append if i is valid
-                        if self.path_check(child, position_next, neighbor) and self.valid_check(child, neighbor):
-                            child.append(neighbor)
-                            stack.append(child)
-
-                # Set first to False
-                first = False
-
-        # Generate list with all path distances
-        mdist = self.all_distances(paths, position, goal)
-
-        # Get next position 
-        position = self.get_random_min(mdist)
-
-        # Get corresponding position from orginal graph nodes
-        position = self.graph.nodes[(position.xcoord, position.ycoord, position.zcoord)]
-
-        return position
+        return self.graph.get_cost_field(layer_costs, self.COST_INTERSECTION, self.COST_NEIGHBORS)
 
     def compute_wire_costs(self, position, step, goal):
         """
@@ -1200,43 +1139,21 @@ class GreedyLookAheadCosts(GreedyLookAhead):
                 The wire costs of the step.
         """
         
-        # Magic numbers
-        COST_LAYER_0 = 10
-        COST_LAYER_1 = 8
-        COST_LAYER_2 = 6
-        COST_LAYER_3 = 4
-        COST_INTERSECTION = 10
-        COST_NEIGHBORS = 2
-
         # Get the coordinates of step and goal
-        step_coords = step.xcoord, step.ycoord, step.zcoord
-        goal_coords = goal.xcoord, step.ycoord, step.zcoord
-
-        cost = 0
+        step_coords = self.graph.get_coords(step)
+        goal_coords = self.graph.get_coords(goal)[0], step_coords[1], step_coords[2]
 
+        # Get Manhatten distance between the current step and the 
+        # goal coordinate
         dist = self.compute_manhattan_dist(step, goal)
 
         # Only add extra costs if step is not goal
         if step_coords != goal_coords and dist > 4:
-            if step.zcoord == 0:
-                cost += COST_LAYER_0
-            elif step.zcoord == 1:
-                cost += COST_LAYER_1
-            elif step.zcoord == 2:
-                cost += COST_LAYER_2
-            elif step.zcoord == 3:
-                cost += COST_LAYER_3
-
-            # Increment the costs for intersections
-            if step.intersection > 0:
-                cost += COST_INTERSECTION
-
-            # Increment the costs with 2 per neighbor of the step who is alread wired
-            for neighbor in step.neighbors:
-                if neighbor.intersection > 0:
-                    cost += COST_NEIGHBORS
-
-        return cost
+
+            # Costs of the layer of the step, its intersection and its wired neighbors
+            return self.get_cost_field().get_cost(step)
+
+        return 0
 
     def compute_total_costs(self, position, step, goal):
         """
@@ -1268,62 +1185,28 @@ class GreedyLookAheadCosts(GreedyLookAhead):
 
         return mdist + wire_cost
 
-    def all_distances(self, paths, position, goal):
+    def step_cost(self, position, step, goal):
         """
-        Returns the list with all distances and their corresponding total distance.
-        
-        Parameters
-        ----------
-        path: a list
-                A list containing all valid paths for a for step look ahead.
-
-        position: a Node object
-                A Node object representing the current position of the wire.
+        Returns the costs of a step of a look ahead path.
 
-        goal: a Node object
-                A Node object repesenting the goal position on the grid.
-
-        Returns 
-        -------
-                A list with tuples. First element of tuple is the neighbor and the 
-                second element is the Manhattan distance. 
-        """
-
-        mdist = []
-
-        for path in paths:
-            total_dist = self.path_distance(path, position, goal)
-            mdist.append((path[1], total_dist))
-
-        return mdist
-
-    def path_distance(self, path, position, goal):
-        """
-        Returns the total costs of the total path.
-        
         Parameters
         ----------
-        path: a list
-                A list of Nodes representing a wire path.
-
         position: a Node object
-                A Node object representing the current position of the wire.
+                A Node object representing the position from which is looked ahead.
+
+        step: a Node object
+                A Node object representing a step of the path.
 
         goal: a Node object
                 A Node object repesenting the goal position on the grid.
 
-        Returns 
+        Returns
         -------
         int
-                The costs of the total path.
+                The costs of the step.
         """
-        
-        dist = 0
-        for i, step in enumerate(path):
-            if i > 0:
-                dist += self.compute_total_costs(position, step, goal)
 
-        return dist
+        return self.compute_total_costs(position, step, goal)
 
     
 class GreedyWireJam(Greedy):
@@ -1362,13 +1245,19 @@ class GreedyWireJam(Greedy):
 
         CROWDED_COST = 3
 
+        # The wire units within two steps of the position are counted, as the recursion did
+        RADIUS = 2
+
         # Compute Manhattan Distance for each dimension
-        x_dist = abs(position.xcoord - goal.xcoord)
-        y_dist = abs(position.ycoord - goal.ycoord)
-        z_dist = abs(position.zcoord - goal.zcoord)
+        position_x, position_y, position_z = self.graph.get_coords(position)
+        goal_x, goal_y, goal_z = self.graph.get_coords(goal)
+
+        x_dist = abs(position_x - goal_x)
+        y_dist = abs(position_y - goal_y)
+        z_dist = abs(position_z - goal_z)
 
         # Compute the number of wires surrounding the current position
-        surrounding_wires = position.get_wire_density(position, self.wire.path)
+        surrounding_wires = self.graph.get_wire_density(position, self.wire, RADIUS)
 
         # Return heuristic score of the current position
         return x_dist + y_dist + z_dist + CROWDED_COST * surrounding_wires
@@ -1390,6 +1279,9 @@ class GreedyLookAheadWireJam(GreedyLookAhead):
     respective step.
     """
 
+    # The costs depend on the wire around a step, which changes when the wire is extended
+    REUSE_COSTS = False
+
     def compute_manhattan_dist(self, position, goal):
         """
         Returns the heuristic cost of going to the current position
@@ -1410,13 +1302,19 @@ class GreedyLookAheadWireJam(GreedyLookAhead):
 
         CROWDED_COST = 3
 
+        # The wire units within two steps of the position are counted, as the recursion did
+        RADIUS = 2
+
         # Compute Manhattan Distance for each dimension
-        x_dist = abs(position.xcoord - goal.xcoord)
-        y_dist = abs(position.ycoord - goal.ycoord)
-        z_dist = abs(position.zcoord - goal.zcoord)
+        position_x, position_y, position_z = self.graph.get_coords(position)
+        goal_x, goal_y, goal_z = self.graph.get_coords(goal)
+
+        x_dist = abs(position_x - goal_x)
+        y_dist = abs(position_y - goal_y)
+        z_dist = abs(position_z - goal_z)
 
         # Compute the number of wires surrounding the current position
-        surrounding_wires = position.get_wire_density(position, self.wire.path)
+        surrounding_wires = self.graph.get_wire_density(position, self.wire, RADIUS)
 
         # Return heuristic score of the current position
         return x_dist + y_dist + z_dist + CROWDED_COST * surrounding_wires
\ No newline at end of file
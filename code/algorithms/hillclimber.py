@@ -2,17 +2,18 @@
 # -*- coding: utf-8 -*-
 
 # Built-in/Generic Imports
+import contextlib
+import io
+import multiprocessing
 import random
 import os
 import math
 
-# Libs
-import matplotlib.pyplot as plt
-
 # Own modules
-from code.classes import Graph
-from code.algorithms import Random, GreedyLookAhead
-from code.visualization import ChipVisualization
+from code.classes import Graph, Journal, Wire
+from code.algorithms import GreedyLookAhead
+from code.algorithms.controller import RunController
+from code.algorithms.startstate import RandomStartState
 
 __author__ = 'Eline van Groningen, Mimoun Boulfich, Syrka van Kuppenveld'
 __copyright__ = 'Copyright 2020, Chips & Circuits'
@@ -30,13 +31,53 @@ Code for Hillclimber algorithm.
 This module contains the code for the hillclimber algorithm. 
 """
 
+
+def run_climber(task):
+    """
+    Runs one climber of the Restart Hillclimber and returns its results.
+
+    Runs in a worker process, so the climber gets its own Graph, built from the 
+    files, and its own seed.
+
+    Parameters
+    ----------
+    task: a tuple
+            The Graph class, print file, netlist file and layers of the chip, the 
+            seed of the random generator, the number of the climber, the run 
+            controller of the climb, the provider of the start state and the 
+            seed of the start state, None if the climbers are not seeded.
+
+    Returns
+    -------
+    tuple
+            The wire path of the start state, the costs per iteration, the best 
+            costs and the best wire path of the climber.
+    """
+
+    graph_class, print_file, netlist_file, layers, seed, i, controller, start_state, start_seed = task
+
+    random.seed(seed)
+    graph = graph_class(print_file, netlist_file, layers)
+    climber = HillClimber(graph, 1, (False, False), (False, False), None, None, processes=1, controller=controller, start_state=start_state)
+
+    # Silence the progress messages of the workers
+    with contextlib.redirect_stdout(io.StringIO()):
+        climber.get_start_state(i, start_seed)
+        start_wire_path = dict(climber.wire_path)
+        climber.climb()
+
+    return start_wire_path, climber.climbers_costs, climber.best_cost, climber.best_wire_path
+
+
 class HillClimber(GreedyLookAhead):
     """ 
     Provide Object to perform the (stochastic) Hillclimber algorithm with.
     
     Start State
     ---------
-    The algorithm starts with a Random start State. 
+    The algorithm starts with a Random start State, or the start state of the 
+    given StartState provider: a Greedy algorithm or a solution file. With a seed, 
+    climber i builds its start state with seed + i, which the provider can cache.
 
     Random adjustments
     ------------------
@@ -45,9 +86,25 @@ class HillClimber(GreedyLookAhead):
     New path
     --------
     The new path will be build with the use of the Greedy LookaHead algorithm.
+
+    Undo
+    ----
+    The edits of an adjustment are recorded in a Journal and undone if the 
+    adjustment is rejected, so the current state is always the best state.
+
+    Restarts
+    --------
+    The climbers of the Restart Hillclimber are independent, so they run in a 
+    process pool, each with its own Graph and seed.
+
+    Stopping
+    --------
+    A climb stops once ITERATIONS - 1 adjustments in a row did not improve the 
+    state, or on the limits of the given RunController.
     """
 
-    def __init__(self, graph, frequency, start_state_flow, conversion_flow, chip, netlist):
+    def __init__(self, graph, frequency, start_state_flow, conversion_flow, chip, netlist, processes=None, controller=None, 
+                 start_state=None, seed=None):
         """ 
         Initializes the states of the algorithm.
 
@@ -70,6 +127,23 @@ class HillClimber(GreedyLookAhead):
 
         netlist: an int
                 The number of the used netlist.
+
+        processes: an int
+                The number of worker processes of the Restart Hillclimber, None uses 
+                all cores and 1 runs the climbers one after another.
+
+        controller: a RunController object
+                Stops every climb on its time budget, iteration budget or patience, 
+                None stops a climb after ITERATIONS - 1 adjustments in a row 
+                without improvement.
+
+        start_state: a StartState object
+                Provides the start state of every climb, None builds it with the 
+                Random algorithm.
+
+        seed: an int
+                The seed of the first climber, climber i uses seed + i. None does 
+                not seed the climbers.
         """
 
         # Empirically chosen number of iterations
@@ -88,6 +162,16 @@ class HillClimber(GreedyLookAhead):
         # Frequency of restarts entered by user
         self.frequency = int(frequency)
 
+        # Number of climbers that run at once
+        self.processes = os.cpu_count() if processes is None else processes
+
+        # Stops the climbs
+        self.controller = controller
+
+        # Provides the start states and their seeds
+        self.start_state = RandomStartState() if start_state is None else start_state
+        self.seed = seed
+
         # Visualization of the start state
         self.visualization = None
 
@@ -103,36 +187,74 @@ class HillClimber(GreedyLookAhead):
         self.best_wire_path = None
         self.best_cost = None
 
+        # Records the edits of the current adjustment
+        self.journal = Journal()
+
         # Keeps track of best cost and wire path built by the Hillclimbers
         self.overall_best_wire_path = None
         self.overall_best_cost = math.inf
 
-        # Used to check on conversion
-        self.improvements = [True]
-
         # Keep track of the HillClimbers' cost
         self.climbers_costs = []
         self.restart_climbers_costs = []
         self.iteration = []
     
-    def get_random_start_state(self, i):
+    def get_seed(self, i):
+        """
+        Returns the seed of a climber.
+
+        Parameters
+        ----------
+        i: an int
+                The number of the climber.
+
+        Returns
+        -------
+        int
+                The seed of the climber, None if the climbers are not seeded.
+        """
+
+        if self.seed is None:
+            return None
+
+        return self.seed + i
+
+    def get_start_state(self, i, seed=None):
+        """
+        Lays the start state of the provider on the empty grid.
+
+        Parameters
+        ----------
+        i: an int
+                The number of the climber.
+
+        seed: an int
+                The seed of the start state, None does not seed it.
+        """
         
         # Update user on which climber is running if multiple
         if self.frequency > 1:
             print(f"Hillclimber no. : {i}")
         
-        print(f"Computing random start state...")
+        print(f"Computing {self.start_state.get_name()} start state...")
+
+        # Start from an empty grid, the previous climber may have left wire on it
+        self.graph.journal = None
+        self.graph.clear_graph()
         
-        # Get random Start State
-        algo = Random(self.best_graph)
-        self.wire_path = algo.run()
+        # Get the Start State and lay it on a new Wire, the cached ones were built on another grid
+        self.wire_path = self.start_state.get(self.graph, seed)
+        self.lay_wire_path(self.wire_path)
         self.best_wire_path = self.wire_path
-        self.wire = algo.wire
-        self.best_wire = algo.wire
-        self.cost = algo.wire.compute_costs()
-        self.best_cost = algo.wire.compute_costs()
+        self.best_wire = self.wire
+        self.cost = self.wire.compute_costs()
+        self.best_cost = self.cost
+
+        # Record all further edits of the wire and graph
+        self.wire.journal = self.journal
+        self.graph.journal = self.journal
         
-        print("Random start state found")
+        print("Start state found")
         print("Running Hillclimber algorithm...")
     
     def get_random_connection(self):
@@ -177,20 +299,21 @@ class HillClimber(GreedyLookAhead):
 
             # Remove old path coordinates from the coordinate storage of the Wire Object
             # Gates can never be an intersection and thus will not be taken into account
-            node = self.graph.nodes[coordinates]
-            if node.isgate is False:
+            node = self.graph.get_node(coordinates)
+            if not self.graph.is_gate(node):
 
                 # Remove node from coordinate storage
-                self.wire.coords.remove(node)
+                self.wire.remove_coords(node)
 
-                # Correct intersection-count of the Node object of the current coordinate
-                node.decrement_intersection()
+                # Correct intersection-count of the node of the current coordinate
+                self.graph.decrement_intersection(node)
         
         # Remove old wire units from the path storage of the Wire Object
         for i in range(len(connection_path)):
             if i > 0:
-                combination = tuple(sorted((connection_path[i - 1], connection_path[i])))
-                self.wire.path.remove(combination)
+                position = self.graph.get_node(connection_path[i - 1])
+                step = self.graph.get_node(connection_path[i])
+                self.wire.remove_path(position, step)
 
     def apply_random_adjustment(self, connection, gates):
         """
@@ -212,14 +335,17 @@ class HillClimber(GreedyLookAhead):
 
         # Repeat until a path is correctly built
         while not_found:
+                mark = self.journal.mark()
                 try:
                         # Construct a new path via a function inherited from the Greedy LookAhead algorithm  
                         new_path = self.make_connection(gate_a, gate_b)
                         not_found = False
-                except:
-                        pass
+                except ValueError:
+                        # Undo the partially built path
+                        self.journal.rollback(mark)
  
         # Update wire_path
+        self.journal.record(self.wire_path.__setitem__, connection, self.wire_path[connection])
         self.wire_path[connection] = new_path
 
     def check_improvement(self):
@@ -236,7 +362,8 @@ class HillClimber(GreedyLookAhead):
 
     def confirm_improvement(self, improvement):
         """
-        Update best found state if the adjusted state was an improvement.
+        Update best found state if the adjusted state was an improvement, otherwise
+        undo the adjustment.
 
         Paramters
         ---------
@@ -248,11 +375,17 @@ class HillClimber(GreedyLookAhead):
         if improvement:
 
             # Confirm adjustment
+            self.journal.commit()
             self.best_cost = self.cost
             self.best_graph = self.graph
             self.best_wire = self.wire
             self.best_wire_path = self.wire_path
 
+        # Otherwise return to the best state
+        else:
+            self.journal.rollback()
+            self.cost = self.best_cost
+
     def check_overall_improvement(self):
         """ 
         Checks if the current Hillclimber generated a solution with the lowest
@@ -265,20 +398,15 @@ class HillClimber(GreedyLookAhead):
         """
         return self.best_cost < self.overall_best_cost
     
-    def track_iterations(self):
-        """
-        Tracks previous iterations.
-        """
-        
-        # Keep track of the past N iterations
-        if len(self.improvements) == self.ITERATIONS:
-            # Make room for next iteration
-            self.improvements.pop(0)
-    
     def handle_start_state_visualization(self, i):
         """
         Handles the showing and saving of the start state visualization.
         """
+
+        # Only build the visualization if it is shown or saved
+        if not self.show_start_state and not self.save_start_state:
+            return
+
         # Construct visualisation of the start state
         start_state_visualisation = self.visualize_chip()
 
@@ -301,6 +429,10 @@ class HillClimber(GreedyLookAhead):
         fig
                 A matplotlib figure of the start state of the chip.
         """
+
+        # The plotting libraries are only imported when a plot is requested
+        from code.visualization import ChipVisualization
+
         self.visualization = ChipVisualization(self.graph.gates, self.wire_path)
         start_state_visualisation = self.visualization.run(False)
         
@@ -376,6 +508,10 @@ class HillClimber(GreedyLookAhead):
         Handles the showing and saving of the conversion plot of the hillclimber(s).
         """
 
+        # Only build the conversion plot if it is shown or saved
+        if not self.show_conversion_plot and not self.save_conversion_plot:
+            return
+
         # Construct conversion plot
         conversion_plot_visualisation = self.visualize_conversion()
 
@@ -398,6 +534,9 @@ class HillClimber(GreedyLookAhead):
                 A matplotlib figure of the Conversion plot.
         """
 
+        # The plotting libraries are only imported when a plot is requested
+        import matplotlib.pyplot as plt
+
         # Initialize figure
         fig, ax = plt.subplots() 
 
@@ -479,80 +618,160 @@ class HillClimber(GreedyLookAhead):
 
         return return_path
 
-    def run(self):
+    def get_controller(self):
         """
-        Runs the HillClimber algorithm a number of times, the frequency is given by user.
+        Returns the run controller of a climb.
 
         Returns
         -------
+        RunController object
+                The given controller, or one that stops after ITERATIONS - 1 
+                adjustments in a row without improvement.
+        """
 
-        dict
-                A dict with connections as key and the wire path as value.
+        if self.controller is not None:
+            return self.controller
+
+        return RunController(patience=self.ITERATIONS - 1)
+
+    def climb(self):
         """
+        Climbs from the current state until the climber has converged, i.e. none of 
+        the last ITERATIONS - 1 adjustments was an improvement, or a limit of the 
+        controller is reached.
+        """
+
+        reset_iter = 0
+
+        # The state of the climber is always its best state
+        controller = self.get_controller()
+        controller.start(self.best_cost, self.best_wire_path)
 
-        hillclimber_count = 0
-        iteration = 0
+        # Repeat until conversion has occured
+        while not controller.is_done():
 
-        for i in range(self.frequency):  
+            # Update user on progress 
+            print(f"Iteration: {reset_iter}")
+            reset_iter += 1
 
-            # Get random start state
-            self.get_random_start_state(i)
+            # Keep track of the HillClimbers' costs, counting on from the previous climbers
+            self.climbers_costs.append(self.best_cost)
+            self.iteration.append(len(self.iteration))
+            
+            # Apply random adjustment
+            # Get random net
+            connection, gates = self.get_random_connection()
 
-            # Handle the visualization of the start state
-            self.handle_start_state_visualization(i)
+            # Remove old net path form wire object
+            self.remove_connection(connection, gates)
 
-            reset_iter = 0
+            # Apply random adjustment on net
+            self.apply_random_adjustment(connection, gates)
 
-            # Repeat until conversion has occured
-            while True in self.improvements:
+            # Compute cost of adjusted state
+            self.cost = self.wire.compute_costs()
 
-                # Update user on progress 
-                print(f"Iteration: {reset_iter}")
-                reset_iter += 1
+            # Check is adjustment resulted in an improved state
+            improvement = self.check_improvement()
 
-                # Keep track of the HillClimbers' costs
-                self.climbers_costs.append(self.best_cost)
-                self.iteration.append(iteration)
-                iteration += 1
-                
-                # Apply random adjustment
-                # Get random net
-                connection, gates = self.get_random_connection()
+            # Confirm adjustment if state improved
+            self.confirm_improvement(improvement)
 
-                # Remove old net path form wire object
-                self.remove_connection(connection, gates)
+            # Count the iteration, the patience is reset on an improvement
+            controller.update(self.best_cost, self.best_wire_path)
+        
+        # Notify user on conversion of algorithm
+        if controller.stop_reason == 'patience':
+            print("Algorithm converged\n")
+        else:
+            print(f"Algorithm stopped, the {controller.stop_reason} budget ran out\n")
 
-                # Apply random adjustment on net
-                self.apply_random_adjustment(connection, gates)
+    def lay_wire_path(self, wire_path):
+        """
+        Lays a wire path on the graph and a new Wire object.
 
-                # Compute cost of adjusted state
-                self.cost = self.wire.compute_costs()
+        Parameters
+        ----------
+        wire_path: a dict
+                A dict with connections as key and the wire path as value.
+        """
 
-                # Check is adjustment resulted in an improved state
-                improvement = self.check_improvement()
+        self.graph.journal = None
+        self.graph.clear_graph()
+        self.wire = Wire(self.graph)
 
-                # Confirm adjustment if state improved
-                self.confirm_improvement(improvement)
+        for path in wire_path.values():
+            self.wire.lay_path(path)
 
-                # Update improvements list
-                self.improvements.append(improvement)
+    def run_climbers(self):
+        """
+        Runs the climbers of the Restart Hillclimber in a process pool and collects 
+        their results in the order of the climbers.
+        """
 
-                # Keep track of the past N iterations of all climbs if multiple
-                self.track_iterations()
+        # Every climber gets its own seed, drawn from the random generator of this process if not given
+        graph = self.graph
+        seeds = [random.getrandbits(32) if self.seed is None else self.get_seed(i) for i in range(self.frequency)]
+        tasks = [(type(graph), graph.print_file, graph.netlist_file, graph.layers, seeds[i], i, self.controller, self.start_state, self.get_seed(i)) for i in range(self.frequency)]
 
-                # Update count of current hillclibmer
-                hillclimber_count += 1
-            
-            # Notify user on conversion of algorithm
-            print("Algorithm converged\n")
+        print(f"Running {self.frequency} Hillclimbers on {min(self.processes, self.frequency)} processes...")
+
+        with multiprocessing.Pool(min(self.processes, self.frequency)) as pool:
+            for i, result in enumerate(pool.imap(run_climber, tasks)):
+                start_wire_path, costs, self.best_cost, self.best_wire_path = result
+                print(f"Hillclimber no. : {i} converged")
+
+                # Handle the visualization of the start state
+                self.wire_path = start_wire_path
+                self.handle_start_state_visualization(i)
+
+                # Append the costs of the climber to the conversion plot
+                self.iteration.extend(range(len(self.iteration), len(self.iteration) + len(costs)))
+                self.climbers_costs.extend(costs)
 
-            # If a restart hillclimber is run:
-            if self.frequency != 1:
                 # Handle the tracking of the best costs and wire path of the Restart Hillclimber
                 self.track_restart()
-            
-            # Reset conversion status
-            self.improvements = [True]
+
+        # Lay the overall best wire path, so the wire of the algorithm is the best one
+        self.wire_path = self.overall_best_wire_path
+        self.lay_wire_path(self.overall_best_wire_path)
+
+    def run(self):
+        """
+        Runs the HillClimber algorithm a number of times, the frequency is given by user.
+
+        Returns
+        -------
+
+        dict
+                A dict with connections as key and the wire path as value.
+        """
+
+        # Run the climbers of the Restart Hillclimber at once
+        if self.frequency > 1 and self.processes > 1:
+            self.run_climbers()
+
+        else:
+            for i in range(self.frequency):  
+
+                # Get the start state
+                self.get_start_state(i, self.get_seed(i))
+
+                # Handle the visualization of the start state
+                self.handle_start_state_visualization(i)
+
+                # Climb until conversion has occured
+                self.climb()
+
+                # If a restart hillclimber is run:
+                if self.frequency != 1:
+                    # Handle the tracking of the best costs and wire path of the Restart Hillclimber
+                    self.track_restart()
+
+            # Lay the overall best wire path, as run_climbers does
+            if self.frequency > 1:
+                self.wire_path = self.overall_best_wire_path
+                self.lay_wire_path(self.overall_best_wire_path)
 
         # Notify user on conversion and costs
         self.notify_user()
@@ -563,4 +782,4 @@ class HillClimber(GreedyLookAhead):
         # Determine path to return
         return_path = self.get_return_path()
 
-        return return_path
\ No newline at end of file
+        return return_path
@@ -0,0 +1,265 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+
+# Built-in/Generic Imports
+import contextlib
+import io
+import itertools
+import multiprocessing
+import os
+import random
+import time
+
+# Own modules
+from code.classes import Graph, Wire
+from code.algorithms.greedy import Greedy, GreedyLookAhead, GreedyCosts, GreedyLookAheadCosts, GreedyWireJam
+from code.algorithms.astar import AStar
+
+__author__ = 'Eline van Groningen, Mimoun Boulfich, Syrka van Kuppenveld'
+__copyright__ = 'Copyright 2020, Chips & Circuits'
+__credits__ = ['Eline van Groningen, Mimoun Boulfich, Syrka van Kuppenveld']
+__license__ = 'GNU GPL 3.0'
+__version__ = '0.1.0'
+__maintainer__ = 'Eline van Groningen, Mimoun Boulfich, Syrka van Kuppenveld'
+__email__ = 'elinevangroningen@gmail.com, mimounboulfich@live.nl, syrkavankuppenveld@gmail.com'
+__status__ = 'Dev'
+
+"""
+Code for the Portfolio runner.
+
+
+This module contains the code for running many configurations of the Greedy
+algorithms at once in a process pool and keeping the cheapest solution.
+"""
+
+
+def get_order(graph, heuristic, descending, density_radius):
+    """
+    Returns the order of the connections or gates for an ordering heuristic, and the
+    run approach that goes with it.
+
+    Parameters
+    ----------
+    graph: a Graph object
+            A Graph object representing the chip grid.
+
+    heuristic: a string
+            'netlist' (the order of the netlist), 'social_map' (gate density) or
+            'distance' (connection distance).
+
+    descending: a bool
+            True if the order is from max to min, False if it is from min to max.
+            Not used by the 'netlist' heuristic.
+
+    density_radius: an int
+            The radius of the gate density of the 'social_map' heuristic.
+
+    Returns
+    -------
+    list
+            A list of connections or gateIDs.
+
+    bool
+            True if the list contains connections, False if it contains gates.
+    """
+
+    if heuristic == 'social_map':
+        return graph.get_gate_densities(descending, density_radius), False
+    elif heuristic == 'distance':
+        return graph.get_connection_distance(descending), True
+    elif heuristic == 'netlist':
+        return list(graph.netlist), True
+
+    raise ValueError(f"unknown heuristic: {heuristic}")
+
+
+def run_configuration(task):
+    """
+    Runs one configuration of the portfolio and returns its result.
+
+    Runs in a worker process, so the Graph is built from the files.
+
+    Parameters
+    ----------
+    task: a tuple
+            The print file, the netlist file, the density radius and the
+            configuration, a dict with the algorithm, heuristic, descending and
+            seed.
+
+    Returns
+    -------
+    tuple
+            The costs, the configuration and the route of the solution.
+    """
+
+    print_file, netlist_file, density_radius, configuration = task
+
+    random.seed(configuration['seed'])
+    graph = Graph(print_file, netlist_file)
+    order, approach = get_order(graph, configuration['heuristic'], configuration['descending'], density_radius)
+    algo = configuration['algorithm'](graph, order, approach)
+
+    # Silence the restart messages of the workers
+    with contextlib.redirect_stdout(io.StringIO()):
+        route = algo.run()
+
+    return algo.wire.compute_costs(), configuration, route
+
+
+class Portfolio():
+    """
+    Runs every combination of algorithm, ordering heuristic, sort direction and
+    seed in a process pool, and keeps the cheapest solution.
+
+    Which algorithm and order work best depends on the netlist, so instead of
+    choosing one the portfolio tries them all at once, on all cores by default.
+
+    Time budget
+    -----------
+    Once the time budget runs out, all workers are stopped and the cheapest
+    solution found thusfar is kept. Configurations that did not finish in time
+    are left out.
+    """
+
+    ALGORITHMS = (Greedy, GreedyLookAhead, GreedyCosts, GreedyLookAheadCosts, GreedyWireJam, AStar)
+    HEURISTICS = ('netlist', 'social_map', 'distance')
+
+    def __init__(self, print_file, netlist_file, algorithms=None, heuristics=None, seeds=range(4), time_budget=60, processes=None, density_radius=3):
+        """
+        Initializes a Portfolio object.
+
+        Parameters
+        ----------
+        print_file: a string
+                The path to the print file.
+
+        netlist_file: a string
+                The path to the netlist file.
+
+        algorithms: a tuple
+                The algorithm classes to run, all Greedy algorithms and AStar take
+                an order. Defaults to ALGORITHMS.
+
+        heuristics: a tuple
+                The ordering heuristics to run, see get_order. Defaults to
+                HEURISTICS.
+
+        seeds: an iterable
+                The seeds of the random generator to run.
+
+        time_budget: a float
+                The number of seconds after which the workers are stopped, None
+                waits for all configurations.
+
+        processes: an int
+                The number of worker processes, None uses all cores.
+
+        density_radius: an int
+                The radius of the gate density of the 'social_map' heuristic.
+        """
+
+        self.print_file = print_file
+        self.netlist_file = netlist_file
+        self.algorithms = self.ALGORITHMS if algorithms is None else tuple(algorithms)
+        self.heuristics = self.HEURISTICS if heuristics is None else tuple(heuristics)
+        self.seeds = list(seeds)
+        self.time_budget = time_budget
+        self.processes = os.cpu_count() if processes is None else processes
+        self.density_radius = density_radius
+
+        # The Graph and Wire of the best solution, rebuilt in this process
+        self.graph = Graph(print_file, netlist_file)
+        self.wire = Wire(self.graph)
+
+        # Results of the finished configurations and the best one
+        self.results = []
+        self.best_costs = None
+        self.best_configuration = None
+
+    def get_configurations(self):
+        """
+        Returns all configurations of the portfolio.
+
+        Returns
+        -------
+        list
+                A list of dicts with the algorithm, heuristic, descending and seed.
+        """
+
+        configurations = []
+
+        for algorithm, heuristic, descending, seed in itertools.product(self.algorithms, self.heuristics, (True, False), self.seeds):
+
+            # The order of the netlist has no direction
+            if heuristic == 'netlist' and not descending:
+                continue
+
+            configurations.append({'algorithm': algorithm, 'heuristic': heuristic, 'descending': descending, 'seed': seed})
+
+        return configurations
+
+    def lay_route(self, route):
+        """
+        Lays the wire of a route on the graph and the wire of the portfolio.
+
+        Parameters
+        ----------
+        route: a dict
+                A dictionary containing the route of the wire per connection.
+        """
+
+        self.graph.clear_graph()
+        self.wire = Wire(self.graph)
+
+        for path in route.values():
+            self.wire.lay_path(path)
+
+    def run(self):
+        """
+        Returns the cheapest route found by the configurations of the portfolio.
+
+        Returns
+        -------
+        dict
+                A dictionary containing the route of the wire per connection.
+        """
+
+        tasks = [(self.print_file, self.netlist_file, self.density_radius, configuration) for configuration in self.get_configurations()]
+
+        deadline = None
+        if self.time_budget is not None:
+            deadline = time.perf_counter() + self.time_budget
+
+        best_route = None
+        self.results = []
+        self.best_costs = None
+        self.best_configuration = None
+
+        # Leaving the pool terminates the workers that are still running
+        with multiprocessing.Pool(self.processes) as pool:
+            results = pool.imap_unordered(run_configuration, tasks)
+
+            while len(self.results) < len(tasks):
+                timeout = None
+                if deadline is not None:
+                    timeout = deadline - time.perf_counter()
+                    if timeout <= 0:
+                        break
+
+                try:
+                    costs, configuration, route = results.next(timeout)
+                except multiprocessing.TimeoutError:
+                    break
+
+                self.results.append((costs, configuration))
+                if self.best_costs is None or costs < self.best_costs:
+                    self.best_costs = costs
+                    self.best_configuration = configuration
+                    best_route = route
+
+        if best_route is None:
+            raise ValueError("no configuration finished within the time budget")
+
+        self.lay_route(best_route)
+
+        return best_route
@@ -33,9 +33,20 @@ class Random():
     --------------
     * The order of the connections is generated randomly.
     * The next position is generated randomly.
+
+    Bounded walk
+    ------------
+    If max_steps is given, a net is walked for at most max_steps steps, which step
+    towards the goal with probability goal_bias and never through another gate. A
+    walk that returns to a node it visited erases the loop, so the path never
+    crosses itself. The path is only laid once the goal is reached, a failed walk
+    is retried up to net_retries times before the netlist is restarted.
     """
 
-    def __init__(self, graph):
+    # Run controller that limits the run, None runs until a solution is found
+    controller = None
+
+    def __init__(self, graph, max_steps=None, goal_bias=0.5, net_retries=3):
         """
         Initializes the Random Greedy Net algorithm.
         
@@ -43,10 +54,26 @@ class Random():
         ----------
         graph: a Graph object
                 A Graph object representing the chip grid.
+
+        max_steps: an int
+                The maximum number of steps of the walk of a net, None walks until 
+                the goal is reached without the bounded walk.
+
+        goal_bias: a float
+                The probability that a step of the bounded walk moves towards the goal.
+
+        net_retries: an int
+                The number of times a net of the bounded walk is walked again before 
+                the netlist is restarted.
         """
         
         self.graph = graph
-        self.wire = Wire()   
+        self.wire = Wire(self.graph)
+
+        # Settings of the bounded walk
+        self.max_steps = max_steps
+        self.goal_bias = goal_bias
+        self.net_retries = net_retries
 
     def get_next_connection(self, connections):
         """
@@ -100,7 +127,21 @@ class Random():
                 The Node object that will be the new position of the wire.
         """
 
-        neighbors = list(position.neighbors)
+        neighbors = list(self.graph.get_neighbors(position))
+
+        # The bounded walk never passes through another gate
+        if self.max_steps is not None:
+            neighbors = [neighbor for neighbor in neighbors if not self.graph.is_gate(neighbor) or neighbor == goal]
+
+            # Step towards the goal if possible with probability goal_bias
+            if random.random() < self.goal_bias:
+                distance = self.compute_manhattan_dist(position, goal)
+                closer = [neighbor for neighbor in neighbors if self.compute_manhattan_dist(neighbor, goal) < distance]
+
+                while closer:
+                    neighbor = self.get_next_neighbor(closer)
+                    if self.wire.check_collision(position, neighbor):
+                        return neighbor
 
         while neighbors:
             # Get a random next neighbour
@@ -111,6 +152,110 @@ class Random():
 
         raise ValueError
 
+    def compute_manhattan_dist(self, position, goal):
+        """
+        Returns the Manhattan Distance between position and goal.
+
+        Parameters
+        ----------
+        position: a Node object
+                A Node object representing the current position of the wire.
+
+        goal: a Node object
+                A Node object representing the goal position.
+
+        Returns
+        -------
+        int
+                The Manhattan Distance.
+        """
+
+        position_x, position_y, position_z = self.graph.get_coords(position)
+        goal_x, goal_y, goal_z = self.graph.get_coords(goal)
+
+        return abs(position_x - goal_x) + abs(position_y - goal_y) + abs(position_z - goal_z)
+
+    def walk(self, gate_a, gate_b):
+        """
+        Returns the nodes of a loop-erased walk from gate_a to gate_b of at most 
+        max_steps steps, without laying it.
+
+        Raises a ValueError if the walk gets stuck or runs out of steps.
+
+        Parameters
+        ----------
+        gate_a: a Gate object
+                The gate the walk starts at.
+
+        gate_b: a Gate object
+                The gate the walk ends at.
+
+        Returns
+        -------
+        list
+                The nodes of the path, from gate_a to gate_b.
+        """
+
+        position = self.graph.get_gate_node(gate_a)
+        goal = self.graph.get_gate_node(gate_b)
+
+        # The path and the index of every node on it
+        path = [position]
+        indices = {position: 0}
+
+        for _ in range(self.max_steps):
+
+            # The walk has not laid its own path yet, so it may step back onto it
+            position = self.next_position(position, goal)
+
+            # Erase the loop if the walk returns to its path
+            if position in indices:
+                for node in path[indices[position] + 1:]:
+                    del indices[node]
+                del path[indices[position] + 1:]
+            else:
+                indices[position] = len(path)
+                path.append(position)
+
+            if position == goal:
+                return path
+
+        raise ValueError(f"no path within {self.max_steps} steps")
+
+    def make_bounded_connection(self, gate_a, gate_b):
+        """
+        Returns a tuple with the wire path of a bounded walk between gate_a and 
+        gate_b, walking the net again up to net_retries times if it fails.
+
+        Parameters
+        ----------
+        gate_a: a Gate object
+                The gate the wire starts at.
+
+        gate_b: a Gate object
+                The gate the wire ends at.
+
+        Returns
+        -------
+        tuple
+                A tuple containing the wire path to connect gate_a and gate_b.
+        """
+
+        for retry in range(self.net_retries + 1):
+            try:
+                path = self.walk(gate_a, gate_b)
+                break
+            except ValueError:
+                if retry == self.net_retries:
+                    raise
+
+        # Lay the path
+        for i in range(1, len(path)):
+            self.wire.update_path(path[i - 1], path[i])
+            self.wire.update_coords(path[i])
+
+        return tuple(self.graph.get_coords(node) for node in path)
+
     def make_connection(self, gate_a, gate_b):
         """
         Returns a set with the wire path between gate_a and gate_b.
@@ -128,15 +273,18 @@ class Random():
         tuple
                 A tuple containing the wire path to connect gate_a and gate_b.
         """
+
+        if self.max_steps is not None:
+            return self.make_bounded_connection(gate_a, gate_b)
         
         wire_path = []
 
         # Get correspoding nodes for position(gate_a) and goal(gate_b)
-        position = self.graph.nodes[(gate_a.xcoord, gate_a.ycoord, gate_a.zcoord)]
-        goal = self.graph.nodes[(gate_b.xcoord, gate_b.ycoord, gate_b.zcoord)]
+        position = self.graph.get_gate_node(gate_a)
+        goal = self.graph.get_gate_node(gate_b)
 
         # Add start position to wire path
-        wire_path.append((position.xcoord, position.ycoord, position.zcoord))
+        wire_path.append(self.graph.get_coords(position))
 
         # Iterate until connection has been made
         while position != goal:
@@ -151,10 +299,47 @@ class Random():
             self.wire.update_coords(position)
 
             # Append step to wire path
-            wire_path.append((position.xcoord, position.ycoord, position.zcoord))
+            wire_path.append(self.graph.get_coords(position))
         
         return tuple(wire_path)
    
+    def build_route(self):
+        """
+        Returns dict with the wire route of one attempt to connect all gates
+        according to netlist.
+
+        Raises a ValueError if the wire gets stuck.
+
+        Returns
+        -------
+        dict 
+                A dictionary containing the route of the wire per connection in netlist.
+        """
+
+        route = {}
+
+        # Make deep copy of netlist
+        netlist = copy.deepcopy(list(self.graph.netlist))
+
+        # Iterate until netlist is empyt
+        while netlist:
+
+            # Stop the attempt if the budget of the controller ran out
+            if self.controller is not None:
+                self.controller.check()
+
+            # Get random connection 
+            connection = netlist.pop(random.randrange(0, len(netlist)))
+
+            # Get corresponding Gate objects
+            a, b = connection[0], connection[1]
+            gate_a, gate_b = self.graph.gates[a], self.graph.gates[b]
+
+            # Generate the connection between gate a and b
+            route[(a, b)] = self.make_connection(gate_a, gate_b)
+
+        return route
+
     def run(self):
         """
         Returns dict with the wire route to connect all gates according to netlist.
@@ -165,44 +350,32 @@ class Random():
                 A dictionary containing the route of the wire per connection in netlist.
         """
 
-        run_counter = 1
+        # Keep the cheapest route of the attempts within the limits of the controller
+        if self.controller is not None:
+            route = self.controller.run(self)
+            self.restarts = self.controller.failures
 
-        route = {}
+            return route
+
+        run_counter = 1
 
         # Run algorithm until solution is found
         not_found = True
         while not_found:
             try:
-                # Make deep copy of netlist
-                netlist = copy.deepcopy(list(self.graph.netlist))
-
-                # Iterate until netlist is empyt
-                while netlist:
-
-                    # Get random connection 
-                    connection = netlist.pop(random.randrange(0, len(netlist)))
-
-                    # Get corresponding Gate objects
-                    a, b = connection[0], connection[1]
-                    gate_a, gate_b = self.graph.gates[a], self.graph.gates[b]
-
-                    # Generate the connection between gate a and b
-                    route[(a, b)] = self.make_connection(gate_a, gate_b)
-
+                route = self.build_route()
                 not_found = False
             except ValueError:
 
-                # Clear graph, wire and route
+                # Clear graph and wire
                 self.graph.clear_graph()
-                self.wire = Wire()
-                route = {}
+                self.wire = Wire(self.graph)
 
                 # Print restart
                 print(f"Restart {run_counter}...")
                 run_counter += 1
         
-        return route
-
-
-
+        # Number of restarts needed to find a solution
+        self.restarts = run_counter - 1
 
+        return route
@@ -0,0 +1,447 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+
+# Built-in/Generic Imports
+import collections
+import random
+
+# Own modules
+from code.classes import Journal, Wire
+from code.algorithms.greedy import Greedy, GreedyLookAhead, GreedyNoIntersect, GreedyNoIntersectLookAhead, GreedyCosts, GreedyLookAheadCosts, GreedyWireJam, GreedyLookAheadWireJam
+from code.algorithms.random import Random
+
+__author__ = 'Eline van Groningen, Mimoun Boulfich, Syrka van Kuppenveld'
+__copyright__ = 'Copyright 2020, Chips & Circuits'
+__credits__ = ['Eline van Groningen, Mimoun Boulfich, Syrka van Kuppenveld']
+__license__ = 'GNU GPL 3.0'
+__version__ = '0.1.0'
+__maintainer__ = 'Eline van Groningen, Mimoun Boulfich, Syrka van Kuppenveld'
+__email__ = 'elinevangroningen@gmail.com, mimounboulfich@live.nl, syrkavankuppenveld@gmail.com'
+__status__ = 'Dev'
+
+"""
+Code for the rip-up and reroute recovery.
+
+
+This module contains the code for recovering from a dead end by ripping up only
+the nets that block the failed net, instead of restarting the whole netlist.
+These are:
+* RipUp: the recovery, to be combined with an algorithm that builds nets step by step.
+* RandomRipUp: the Random algorithm with rip-up and reroute.
+* GreedyRipUp: the Greedy algorithm with rip-up and reroute.
+* GreedyLookAheadRipUp: the Greedy LookAhead algorithm with rip-up and reroute.
+* GreedyNoIntersectRipUp: the Greedy No Intersect algorithm with rip-up and reroute.
+* GreedyNoIntersectLookAheadRipUp: the Greedy No Intersect LookAhead algorithm with rip-up and reroute.
+* GreedyCostsRipUp: the Greedy Costs algorithm with rip-up and reroute.
+* GreedyLookAheadCostsRipUp: the Greedy LookAhead Costs algorithm with rip-up and reroute.
+* GreedyWireJamRipUp: the Greedy Wire Jam algorithm with rip-up and reroute.
+* GreedyLookAheadWireJamRipUp: the Greedy LookAhead Wire Jam algorithm with rip-up and reroute.
+"""
+
+
+class DeadEnd(ValueError):
+    """
+    Raised when a wire reaches a position from which it cannot move any further.
+
+    Since it is a ValueError, the algorithms without recovery still restart on it.
+    """
+
+    def __init__(self, position):
+        """
+        Initializes a DeadEnd exception.
+
+        Parameters
+        ----------
+        position: a node
+                The node at which the wire got stuck.
+        """
+
+        super().__init__("dead end")
+        self.position = position
+
+
+class RipUp():
+    """
+    Recovers from a dead end by ripping up the nets that block the failed net.
+
+    Must be listed before the algorithm in the bases, e.g.
+    class GreedyCostsRipUp(RipUp, GreedyCosts), so that it can take over run.
+
+    Recovery
+    --------
+    When a net gets stuck, its partial path is undone and the net is built again,
+    up to RIPUP_RETRIES times. After that, the nets that have wire within
+    RIPUP_RADIUS steps of the dead end are ranked by the number of wire units there,
+    and at most RIPUP_NETS of them are removed. The failed net is built again first,
+    the ripped up nets are put at the back of the queue.
+
+    Restart
+    -------
+    Only if the number of failed nets exceeds RIPUP_LIMIT times the number of nets,
+    the whole netlist is restarted.
+    """
+
+    RIPUP_RADIUS = 1
+    RIPUP_MAX_RADIUS = 3
+    RIPUP_NETS = 2
+    RIPUP_RETRIES = 2
+    RIPUP_LIMIT = 20
+
+    def next_position(self, position, goal):
+        """
+        Returns the next position of the algorithm, raising a DeadEnd at the position
+        where the wire cannot move any further.
+
+        Parameters
+        ----------
+        position: a node
+                A node representing the current position of the wire.
+
+        goal: a node
+                A node representing the goal position on the grid.
+
+        Returns
+        -------
+        node
+                The node that will be the new position of the wire.
+        """
+
+        try:
+            return super().next_position(position, goal)
+        except ValueError:
+            raise DeadEnd(position) from None
+
+    def walk(self, gate_a, gate_b):
+        """
+        Returns the nodes of a bounded walk of the Random algorithm, raising a 
+        DeadEnd at the goal if the walk runs out of steps, since the nets that keep
+        it from the goal are most likely around the goal.
+
+        Parameters
+        ----------
+        gate_a: a Gate object
+                The gate the walk starts at.
+
+        gate_b: a Gate object
+                The gate the walk ends at.
+
+        Returns
+        -------
+        list
+                The nodes of the path, from gate_a to gate_b.
+        """
+
+        try:
+            return super().walk(gate_a, gate_b)
+        except DeadEnd:
+            raise
+        except ValueError:
+            raise DeadEnd(self.graph.get_gate_node(gate_b)) from None
+
+    def get_connection_order(self):
+        """
+        Returns the connections in the order in which they are built.
+
+        Returns
+        -------
+        list
+                A list of tuples with the gateIDs of the connections.
+        """
+
+        # The order is a list of connections
+        if self.approach is True:
+            return [(connection[0], connection[1]) for connection in self.order]
+
+        # The order is a list of gates, expand it as Greedy.run does
+        order = []
+        completed = set()
+        for gateID in self.order:
+            gate_a = self.graph.gates[gateID]
+            for gate_b in self.graph.connections.get(gate_a, ()):
+                connection = tuple(sorted((gate_a.gateID, gate_b.gateID)))
+                if connection not in completed:
+                    order.append((gate_a.gateID, gate_b.gateID))
+                    completed.add(connection)
+
+        return order
+
+    def get_edges(self, path):
+        """
+        Returns the edges of a wire path.
+
+        Parameters
+        ----------
+        path: a list
+                A list of coordinates representing a wire path.
+
+        Returns
+        -------
+        list
+                A list of edges.
+        """
+
+        nodes = [self.graph.get_node(coords) for coords in path]
+
+        return [self.graph.get_edge(nodes[i - 1], nodes[i]) for i in range(1, len(nodes))]
+
+    def get_blocking_connections(self, position, radius):
+        """
+        Returns the connections to rip up for a dead end at position.
+
+        Parameters
+        ----------
+        position: a node
+                The node at which the wire got stuck.
+
+        radius: an int
+                The number of steps around the dead end that are searched for wire.
+
+        Returns
+        -------
+        list
+                A list of at most RIPUP_NETS connections, most wire units first.
+        """
+
+        # Collect the nodes within radius steps of the dead end
+        region = {position}
+        frontier = [position]
+        for _ in range(radius):
+            frontier = [neighbor for node in frontier for neighbor in self.graph.get_neighbors(node) if neighbor not in region]
+            region.update(frontier)
+
+        # Count the wire units per connection on the edges of the region
+        units = collections.Counter()
+        for edge in {self.graph.get_edge(node, neighbor) for node in region for neighbor in self.graph.get_neighbors(node)}:
+            if edge in self.owners:
+                units[self.owners[edge]] += 1
+
+        # Most wire units first, ties are broken randomly
+        connections = list(units)
+        random.shuffle(connections)
+        connections.sort(key=lambda connection: units[connection], reverse=True)
+
+        return connections[:self.RIPUP_NETS]
+
+    def rip_up(self, connection, route):
+        """
+        Removes the path of a connection from the wire and the graph.
+
+        Parameters
+        ----------
+        connection: a tuple
+                A tuple with the gateIDs of the connection.
+
+        route: a dict
+                A dictionary containing the route of the wire per connection.
+        """
+
+        path = route.pop(connection)
+        nodes = [self.graph.get_node(coords) for coords in path]
+
+        for i in range(1, len(nodes)):
+            self.wire.remove_path(nodes[i - 1], nodes[i])
+            self.wire.remove_coords(nodes[i])
+
+            # Only algorithms that count intersections on the graph incremented them
+            if not self.graph.is_gate(nodes[i]) and self.graph.get_intersection(nodes[i]) > 0:
+                self.graph.decrement_intersection(nodes[i])
+
+        for edge in self.get_edges(path):
+            del self.owners[edge]
+
+    def restart(self):
+        """
+        Clears the graph and the wire for a restart of the whole netlist.
+        """
+
+        self.graph.journal = None
+        self.graph.clear_graph()
+        self.wire = Wire(self.graph)
+        self.owners = {}
+
+        self.restarts += 1
+        print(f"Restart {self.restarts}...")
+
+    def run(self):
+        """
+        Returns a dictionary with the wire route that connects all gates according
+        to the netlist.
+
+        Returns
+        -------
+        dict
+                A dictionary containing the route of the wire per connection.
+        """
+
+        self.ripups = 0
+        self.restarts = 0
+
+        # Keep the cheapest route of the attempts within the limits of the controller,
+        # the restarts within the attempts are counted by build_route
+        if self.controller is not None:
+            return self.controller.run(self)
+
+        return self.build_route()
+
+    def build_route(self):
+        """
+        Returns a dictionary with the wire route that connects all gates according
+        to the netlist, recovering from dead ends with rip-up and reroute.
+
+        Raises BudgetExhausted if the budget of the controller runs out.
+
+        Returns
+        -------
+        dict
+                A dictionary containing the route of the wire per connection.
+        """
+
+        self.owners = {}
+
+        order = self.get_connection_order()
+        queue = collections.deque(order)
+        route = {}
+
+        # Records the edits of the net that is built, to undo a partial path
+        journal = Journal()
+
+        # Failed attempts per net since its last rip-up, and in total since the last restart
+        retries = collections.Counter()
+        failures = 0
+
+        while queue:
+
+            # Stop if the budget of the controller ran out
+            if self.controller is not None:
+                self.controller.check()
+
+            connection = queue.popleft()
+            gate_a, gate_b = self.graph.gates[connection[0]], self.graph.gates[connection[1]]
+
+            self.wire.journal = journal
+            self.graph.journal = journal
+            journal.commit()
+
+            try:
+                route[connection] = self.make_connection(gate_a, gate_b)
+                for edge in self.get_edges(route[connection]):
+                    self.owners[edge] = connection
+                continue
+
+            except DeadEnd as dead_end:
+                journal.rollback()
+                position = dead_end.position
+
+            # Restart the whole netlist if the recovery gets nowhere
+            failures += 1
+            if failures > self.RIPUP_LIMIT * len(order):
+                self.restart()
+                queue = collections.deque(order)
+                route = {}
+                retries = collections.Counter()
+                failures = 0
+                continue
+
+            # Retry the net on its own first, since it may only have trapped itself
+            retries[connection] += 1
+            if retries[connection] <= self.RIPUP_RETRIES:
+                queue.appendleft(connection)
+                continue
+            retries[connection] = 0
+
+            # Widen the search around the dead end until blocking nets are found
+            radius = self.RIPUP_RADIUS
+            blocking = self.get_blocking_connections(position, radius)
+            while not blocking and radius < self.RIPUP_MAX_RADIUS:
+                radius += 1
+                blocking = self.get_blocking_connections(position, radius)
+
+            # Rip up the blocking nets, build the failed net first and the others after
+            for ripped in blocking:
+                self.rip_up(ripped, route)
+                queue.append(ripped)
+            queue.appendleft(connection)
+
+            self.ripups += len(blocking)
+
+        self.wire.journal = None
+        self.graph.journal = None
+
+        # Return the routes in the order of the connections
+        return {connection: route[connection] for connection in order}
+
+
+class RandomRipUp(RipUp, Random):
+    """
+    The Random algorithm, which recovers from a dead end with rip-up and reroute.
+    """
+
+    def get_connection_order(self):
+        """
+        Returns the connections of the netlist in a random order.
+
+        Returns
+        -------
+        list
+                A list of tuples with the gateIDs of the connections.
+        """
+
+        connections = [(connection[0], connection[1]) for connection in self.graph.netlist]
+        random.shuffle(connections)
+
+        return connections
+
+
+class GreedyRipUp(RipUp, Greedy):
+    """
+    The Greedy algorithm, which recovers from a dead end with rip-up and reroute.
+    """
+
+
+class GreedyLookAheadRipUp(RipUp, GreedyLookAhead):
+    """
+    The Greedy LookAhead algorithm, which recovers from a dead end with rip-up and
+    reroute.
+    """
+
+
+class GreedyCostsRipUp(RipUp, GreedyCosts):
+    """
+    The Greedy Costs algorithm, which recovers from a dead end with rip-up and
+    reroute.
+    """
+
+
+class GreedyNoIntersectRipUp(RipUp, GreedyNoIntersect):
+    """
+    The Greedy No Intersect algorithm, which recovers from a dead end with rip-up
+    and reroute.
+    """
+
+
+class GreedyNoIntersectLookAheadRipUp(RipUp, GreedyNoIntersectLookAhead):
+    """
+    The Greedy No Intersect LookAhead algorithm, which recovers from a dead end with
+    rip-up and reroute.
+    """
+
+
+class GreedyLookAheadCostsRipUp(RipUp, GreedyLookAheadCosts):
+    """
+    The Greedy LookAhead Costs algorithm, which recovers from a dead end with rip-up
+    and reroute.
+    """
+
+
+class GreedyWireJamRipUp(RipUp, GreedyWireJam):
+    """
+    The Greedy Wire Jam algorithm, which recovers from a dead end with rip-up and
+    reroute.
+    """
+
+
+class GreedyLookAheadWireJamRipUp(RipUp, GreedyLookAheadWireJam):
+    """
+    The Greedy LookAhead Wire Jam algorithm, which recovers from a dead end with
+    rip-up and reroute.
+    """
@@ -0,0 +1,455 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+
+# Built-in/Generic Imports
+import abc
+import contextlib
+import csv
+import io
+import json
+import os
+import random
+import re
+
+# Own modules
+from code.algorithms.random import Random
+from code.algorithms.greedy import Greedy
+
+__author__ = 'Eline van Groningen, Mimoun Boulfich, Syrka van Kuppenveld'
+__copyright__ = 'Copyright 2020, Chips & Circuits'
+__credits__ = ['Eline van Groningen, Mimoun Boulfich, Syrka van Kuppenveld']
+__license__ = 'GNU GPL 3.0'
+__version__ = '0.1.0'
+__maintainer__ = 'Eline van Groningen, Mimoun Boulfich, Syrka van Kuppenveld'
+__email__ = 'elinevangroningen@gmail.com, mimounboulfich@live.nl, syrkavankuppenveld@gmail.com'
+__status__ = 'Dev'
+
+"""
+Code for the start states of the HillClimber.
+
+
+This module contains the code for the providers of the start state of the
+HillClimber and the Simulated Annealing: the Random algorithm, a Greedy algorithm
+or a solution file, and for caching the start states on disk.
+"""
+
+
+class StartState(abc.ABC):
+    """
+    Provides the start state of a climb, built by an algorithm on an empty grid.
+    A provider implements get_name and build.
+
+    Cache
+    -----
+    If a cache directory is given, a start state that is built with a seed is saved
+    as JSON per chip, netlist, provider and seed, and loaded from there the next
+    time, so repeated climbs and the climbers of the Restart Hillclimber skip the
+    building. A start state without a seed is never cached.
+    """
+
+    def __init__(self, cache=None):
+        """
+        Initializes a StartState object.
+
+        Parameters
+        ----------
+        cache: a string
+                The directory of the cached start states, None does not cache.
+        """
+
+        self.cache = cache
+
+    @abc.abstractmethod
+    def get_name(self):
+        """
+        Returns the name of the provider, used in the names of the cached files.
+
+        Returns
+        -------
+        string
+                The name of the provider.
+        """
+
+    @abc.abstractmethod
+    def build(self, graph):
+        """
+        Builds a start state on the empty graph and returns its wire path.
+
+        Parameters
+        ----------
+        graph: a Graph object
+                The empty graph of the chip and netlist.
+
+        Returns
+        -------
+        dict
+                A dict with connections as key and the wire path as value.
+        """
+
+    def get_filename(self, graph, seed):
+        """
+        Returns the path of the cached start state.
+
+        Parameters
+        ----------
+        graph: a Graph object
+                The graph of the chip and netlist.
+
+        seed: an int
+                The seed of the start state.
+
+        Returns
+        -------
+        string
+                The path of the JSON file.
+        """
+
+        chip = os.path.splitext(os.path.basename(graph.print_file))[0]
+        netlist = os.path.splitext(os.path.basename(graph.netlist_file))[0]
+
+        return os.path.join(self.cache, f"{chip}_{netlist}_{graph.layers}_{self.get_name()}_{seed}.json")
+
+    def load(self, filename):
+        """
+        Returns the wire path of a cached start state.
+
+        Parameters
+        ----------
+        filename: a string
+                The path of the JSON file.
+
+        Returns
+        -------
+        dict
+                A dict with connections as key and the wire path as value.
+        """
+
+        with open(filename) as cache_file:
+            nets = json.load(cache_file)
+
+        return {(a, b): tuple(tuple(coords) for coords in path) for a, b, path in nets}
+
+    def save(self, filename, wire_path):
+        """
+        Saves the wire path of a start state, a climber that reads the file while
+        it is written never sees half a file.
+
+        Parameters
+        ----------
+        filename: a string
+                The path of the JSON file.
+
+        wire_path: a dict
+                A dict with connections as key and the wire path as value.
+        """
+
+        os.makedirs(os.path.dirname(filename), exist_ok=True)
+
+        nets = [[a, b, [list(coords) for coords in path]] for (a, b), path in wire_path.items()]
+
+        tmp_filename = f"{filename}.{os.getpid()}.tmp"
+        with open(tmp_filename, 'w') as cache_file:
+            json.dump(nets, cache_file)
+        os.replace(tmp_filename, filename)
+
+    def get(self, graph, seed=None):
+        """
+        Returns the wire path of the start state from the cache, or builds it on the
+        empty graph.
+
+        Parameters
+        ----------
+        graph: a Graph object
+                The empty graph of the chip and netlist.
+
+        seed: an int
+                The seed of the random generator, None does not seed it.
+
+        Returns
+        -------
+        dict
+                A dict with connections as key and the wire path as value.
+        """
+
+        filename = None
+        if self.cache is not None and seed is not None:
+            filename = self.get_filename(graph, seed)
+
+            if os.path.exists(filename):
+                print(f"Start state loaded from '{filename}'")
+                return self.load(filename)
+
+        if seed is not None:
+            random.seed(seed)
+
+        wire_path = self.build(graph)
+
+        if filename is not None:
+            self.save(filename, wire_path)
+
+        return wire_path
+
+
+class RandomStartState(StartState):
+    """
+    Builds the start state with the Random algorithm, or its bounded walk.
+    """
+
+    def __init__(self, cache=None, **kwargs):
+        """
+        Initializes a RandomStartState object.
+
+        Parameters
+        ----------
+        cache: a string
+                The directory of the cached start states, None does not cache.
+
+        kwargs: keyword arguments
+                Passed on to the algorithm, e.g. max_steps for the bounded walk.
+        """
+
+        super().__init__(cache)
+
+        self.kwargs = kwargs
+
+    def get_name(self):
+        """
+        Returns the name of the provider and the arguments of the algorithm.
+
+        Returns
+        -------
+        string
+                The name of the provider.
+        """
+
+        name = 'random'
+        for key, value in sorted(self.kwargs.items()):
+            name += f"_{key}{value}"
+
+        return name
+
+    def build(self, graph):
+        """
+        Builds a start state with the Random algorithm and returns its wire path.
+
+        Parameters
+        ----------
+        graph: a Graph object
+                The empty graph of the chip and netlist.
+
+        Returns
+        -------
+        dict
+                A dict with connections as key and the wire path as value.
+        """
+
+        return Random(graph, **self.kwargs).run()
+
+
+class GreedyStartState(StartState):
+    """
+    Builds the start state with a Greedy algorithm, any variant, in the netlist
+    order or sorted by the Manhattan Distance of the connections.
+    """
+
+    def __init__(self, algorithm_class=Greedy, order=None, descending=False, cache=None, **kwargs):
+        """
+        Initializes a GreedyStartState object.
+
+        Parameters
+        ----------
+        algorithm_class: a class
+                Greedy or one of its subclasses.
+
+        order: a string
+                None (the netlist order) or 'distance'.
+
+        descending: a bool
+                True to sort the connections from max to min, False from min to max.
+
+        cache: a string
+                The directory of the cached start states, None does not cache.
+
+        kwargs: keyword arguments
+                Passed on to the algorithm, e.g. the depth of a look ahead.
+        """
+
+        super().__init__(cache)
+
+        if not issubclass(algorithm_class, Greedy):
+            raise ValueError(f"{algorithm_class.__name__} is not a Greedy algorithm")
+
+        if order not in (None, 'distance'):
+            raise ValueError(f"unknown order: {order}")
+
+        self.algorithm_class = algorithm_class
+        self.order = order
+        self.descending = descending
+        self.kwargs = kwargs
+
+    def get_name(self):
+        """
+        Returns the name of the provider, the algorithm, its order and its arguments.
+
+        Returns
+        -------
+        string
+                The name of the provider.
+        """
+
+        name = self.algorithm_class.__name__.lower()
+        if self.order is not None:
+            name += f"_{self.order}_{'descending' if self.descending else 'ascending'}"
+        for key, value in sorted(self.kwargs.items()):
+            name += f"_{key}{value}"
+
+        return name
+
+    def build(self, graph):
+        """
+        Builds a start state with the Greedy algorithm and returns its wire path.
+
+        Parameters
+        ----------
+        graph: a Graph object
+                The empty graph of the chip and netlist.
+
+        Returns
+        -------
+        dict
+                A dict with connections as key and the wire path as value.
+        """
+
+        if self.order == 'distance':
+            connections = graph.get_connection_distance(self.descending)
+        else:
+            connections = list(graph.netlist)
+
+        algo = self.algorithm_class(graph, connections, True, **self.kwargs)
+
+        # Silence the progress messages of the algorithm
+        with contextlib.redirect_stdout(io.StringIO()):
+            return algo.run()
+
+
+class FileStartState(StartState):
+    """
+    Loads the start state from a solution file in the format of output.csv, which is
+    never cached and does not depend on the seed.
+    """
+
+    def __init__(self, filename):
+        """
+        Initializes a FileStartState object.
+
+        Parameters
+        ----------
+        filename: a string
+                The path of the solution file.
+        """
+
+        super().__init__(None)
+
+        self.filename = filename
+
+    def get_name(self):
+        """
+        Returns the name of the provider.
+
+        Returns
+        -------
+        string
+                The name of the provider.
+        """
+
+        return 'file'
+
+    def build(self, graph):
+        """
+        Reads the solution file and returns its wire path.
+
+        Raises a ValueError if the file is not a solution of the netlist of the graph.
+
+        Parameters
+        ----------
+        graph: a Graph object
+                The empty graph of the chip and netlist.
+
+        Returns
+        -------
+        dict
+                A dict with connections as key and the wire path as value.
+        """
+
+        wire_path = {}
+
+        with open(self.filename) as solution_file:
+            for row in csv.DictReader(solution_file):
+
+                # The last row holds the chip, netlist and costs
+                if not row['net'].startswith('('):
+                    continue
+
+                # The numbers of the gates and the coordinates, whatever the brackets
+                a, b = (int(number) for number in re.findall(r'-?\d+', row['net']))
+                numbers = [int(number) for number in re.findall(r'-?\d+', row['wires'])]
+                if len(numbers) % 3 != 0:
+                    raise ValueError(f"the path of {(a, b)} in '{self.filename}' has a coordinate without three numbers")
+
+                path = tuple(tuple(numbers[j:j + 3]) for j in range(0, len(numbers), 3))
+
+                # A run in the order of the gates saves a net from either gate, turn it
+                # around to the order of the netlist
+                if (a, b) not in graph.netlist and (b, a) in graph.netlist:
+                    a, b = b, a
+                    path = path[::-1]
+
+                if (a, b) in wire_path:
+                    raise ValueError(f"'{self.filename}' connects {(a, b)} twice")
+
+                wire_path[(a, b)] = path
+
+        self.check(graph, wire_path)
+
+        return wire_path
+
+    def check(self, graph, wire_path):
+        """
+        Raises a ValueError if the wire path does not connect the netlist of the
+        graph: a path that does not run from its gate a to its gate b, leaves the
+        grid, makes a step to a point that is not a neighbor, or shares a wire unit
+        with another path.
+
+        Parameters
+        ----------
+        graph: a Graph object
+                The graph of the chip and netlist.
+
+        wire_path: a dict
+                A dict with connections as key and the wire path as value.
+        """
+
+        # The nets are compared as pairs of gates, in either order
+        if {frozenset(net) for net in wire_path} != {frozenset(net) for net in graph.netlist}:
+            raise ValueError(f"'{self.filename}' does not connect the netlist of '{graph.netlist_file}'")
+
+        units = set()
+        for (a, b), path in wire_path.items():
+            ends = (graph.get_coords(graph.get_gate_node(graph.gates[a])), graph.get_coords(graph.get_gate_node(graph.gates[b])))
+            if len(path) < 2 or (path[0], path[-1]) != ends:
+                raise ValueError(f"the path of {(a, b)} in '{self.filename}' does not run from gate {a} to gate {b}")
+
+            for coords in path:
+                if coords not in graph.nodes:
+                    raise ValueError(f"the path of {(a, b)} in '{self.filename}' leaves the grid at {coords}")
+
+            # Every step goes to a neighbor over a wire unit no other step uses
+            nodes = [graph.get_node(coords) for coords in path]
+            for i in range(1, len(nodes)):
+                if nodes[i] not in graph.get_neighbors(nodes[i - 1]):
+                    raise ValueError(f"the path of {(a, b)} in '{self.filename}' steps from {path[i - 1]} to {path[i]}, which is not a neighbor")
+
+                edge = graph.get_edge(nodes[i - 1], nodes[i])
+                if edge in units:
+                    raise ValueError(f"the path of {(a, b)} in '{self.filename}' uses the wire unit from {path[i - 1]} to {path[i]} twice")
+                units.add(edge)
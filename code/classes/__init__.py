@@ -3,13 +3,25 @@ Datastructure chips&circuits case.
 
 This module contains the datastructure for the chips&circuits case.
 Also see:
+        pydoc classes.costfield
+        pydoc classes.density
         pydoc classes.graph
         pydoc classes.gate
+        pydoc classes.gateindex
+        pydoc classes.instrumentation
+        pydoc classes.journal
+        pydoc classes.lattice
         pydoc classes.node
         pydoc classes.wire
 """
 
 from code.classes.graph import Graph
 from code.classes.gates import Gate
+from code.classes.gateindex import GateIndex
+from code.classes.instrumentation import Instrumentation
+from code.classes.journal import Journal
+from code.classes.lattice import Lattice
 from code.classes.node import Node
-from code.classes.wire import Wire
\ No newline at end of file
+from code.classes.wire import Wire
+from code.classes.costfield import CostField
+from code.classes.density import CongestionGrid, WireDensity
\ No newline at end of file
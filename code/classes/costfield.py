@@ -0,0 +1,112 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+
+__author__ = 'Eline van Groningen, Mimoun Boulfich, Syrka van Kuppenveld'
+__copyright__ = 'Copyright 2020, Chips & Circuits'
+__credits__ = ['Eline van Groningen, Mimoun Boulfich, Syrka van Kuppenveld']
+__license__ = 'GNU GPL 3.0'
+__version__ = '0.1.0'
+__maintainer__ = 'Eline van Groningen, Mimoun Boulfich, Syrka van Kuppenveld'
+__email__ = 'elinevangroningen@gmail.com, mimounboulfich@live.nl, syrkavankuppenveld@gmail.com'
+__status__ = 'Dev'
+
+"""
+Code for the CostField class.
+
+
+This module contains the code for the CostField class.
+"""
+
+
+class CostField():
+    """
+    Keeps the wire costs of a step to every point of the chip, so that the costs
+    of a step are a single lookup.
+
+    The costs of a point are the costs of its layer, plus cost_intersection if the
+    point is wired and cost_neighbors per wired neighbor. A point is wired if its
+    intersection count is above 0.
+
+    The layer costs never change. The field listens to the Graph and only updates
+    the point and its neighbors when a point becomes wired or unwired.
+    """
+
+    def __init__(self, graph, layer_costs, cost_intersection, cost_neighbors):
+        """
+        Initializes a CostField object and attaches it to the graph.
+
+        Parameters
+        ----------
+        graph: a Graph object
+                A Graph (or Lattice) object representing the chip grid.
+
+        layer_costs: a tuple
+                The costs per layer, starting at layer 0. Layers above the last
+                one cost nothing.
+
+        cost_intersection: an int
+                The costs of a point that is already wired.
+
+        cost_neighbors: an int
+                The costs per neighbor that is already wired.
+        """
+
+        self.graph = graph
+        self.cost_intersection = cost_intersection
+        self.cost_neighbors = cost_neighbors
+
+        # Static costs of the layer per flat index
+        self.layer_costs = [0] * graph.size
+        for coords, node in graph.nodes.items():
+            if coords[2] < len(layer_costs):
+                self.layer_costs[graph.get_index(node)] = layer_costs[coords[2]]
+
+        # Start from the points that are wired thusfar
+        self.costs = list(self.layer_costs)
+        for node in graph.nodes.values():
+            if graph.get_intersection(node) > 0:
+                self.update_wired(node, 1)
+
+        graph.listeners.append(self)
+
+    def update_wired(self, node, change):
+        """
+        Updates the costs of a point and its neighbors.
+
+        Parameters
+        ----------
+        node: a node
+                The node that became wired or unwired.
+
+        change: an int
+                1 if the node became wired, -1 if it became unwired.
+        """
+
+        self.costs[self.graph.get_index(node)] += change * self.cost_intersection
+
+        for neighbor in self.graph.get_neighbors(node):
+            self.costs[self.graph.get_index(neighbor)] += change * self.cost_neighbors
+
+    def clear(self):
+        """
+        Resets the costs after all points are unwired, see Graph.clear_graph.
+        """
+
+        self.costs = list(self.layer_costs)
+
+    def get_cost(self, node):
+        """
+        Returns the wire costs of a step to the node.
+
+        Parameters
+        ----------
+        node: a node
+                A node on the grid.
+
+        Returns
+        -------
+        int
+                The wire costs of the step.
+        """
+
+        return self.costs[self.graph.get_index(node)]
@@ -0,0 +1,228 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+
+# Built-in/Generic Imports
+import itertools
+
+# Libs
+import numpy as np
+
+__author__ = 'Eline van Groningen, Mimoun Boulfich, Syrka van Kuppenveld'
+__copyright__ = 'Copyright 2020, Chips & Circuits'
+__credits__ = ['Eline van Groningen, Mimoun Boulfich, Syrka van Kuppenveld']
+__license__ = 'GNU GPL 3.0'
+__version__ = '0.1.0'
+__maintainer__ = 'Eline van Groningen, Mimoun Boulfich, Syrka van Kuppenveld'
+__email__ = 'elinevangroningen@gmail.com, mimounboulfich@live.nl, syrkavankuppenveld@gmail.com'
+__status__ = 'Dev'
+
+"""
+Code for the WireDensity and CongestionGrid classes.
+
+
+This module contains the code for the WireDensity class, which computes the wire
+density of the whole chip at once, and the CongestionGrid class, which keeps it up
+to date while a wire is laid.
+"""
+
+
+class WireDensity():
+    """
+    Computes the wire density of every point of the chip in one pass.
+
+    The wire density of a point is the number of wire units that lie within the
+    radius (in steps) of the point, i.e. both ends of the unit are at most radius
+    steps away. With the default radius of 2 these are the units that start at the
+    point or at one of its neighbors.
+
+    The wire units of a Wire are viewed as an (x, y, z, axis) array, see
+    Graph.get_edge, and the density is the sum of this array shifted over every
+    offset of a unit within the radius.
+    """
+
+    def __init__(self, graph, radius=2):
+        """
+        Initializes a WireDensity object.
+
+        Parameters
+        ----------
+        graph: a Graph object
+                A Graph (or Lattice) object representing the chip grid.
+
+        radius: an int
+                The number of steps around a point in which wire units are counted.
+        """
+
+        self.graph = graph
+        self.radius = radius
+        self.shape = (graph.x_max + 1, graph.y_max + 1, graph.z_max + 1)
+        self.offsets = self.get_offsets(radius)
+
+        # The field of the last computed wire, and the number of edits it was
+        # computed at
+        self.wire = None
+        self.edits = None
+        self.field = None
+
+    def get_offsets(self, radius):
+        """
+        Returns the offsets of the wire units that lie within the radius of a point,
+        per axis.
+
+        Parameters
+        ----------
+        radius: an int
+                The number of steps around a point in which wire units are counted.
+
+        Returns
+        -------
+        list
+                A list with per axis a list of the (x, y, z) offsets at which a unit
+                along that axis starts.
+        """
+
+        steps = range(-radius, radius + 1)
+        offsets = []
+
+        for axis in range(3):
+            axis_offsets = []
+            for offset in itertools.product(steps, steps, steps):
+                end = [offset[0], offset[1], offset[2]]
+                end[axis] += 1
+
+                # Both ends of the unit must lie within the radius
+                if sum(abs(i) for i in offset) <= radius and sum(abs(i) for i in end) <= radius:
+                    axis_offsets.append(offset)
+
+            offsets.append(axis_offsets)
+
+        return offsets
+
+    def compute(self, wire):
+        """
+        Returns the wire density of every point of the chip.
+
+        The field is only computed again if the wire units changed since the last
+        call.
+
+        Parameters
+        ----------
+        wire: a Wire object
+                A Wire object holding the wire units laid thusfar.
+
+        Returns
+        -------
+        numpy array
+                A 3D array with the wire density per (x, y, z) coordinate.
+        """
+
+        if wire is self.wire and wire.edits == self.edits:
+            return self.field
+
+        radius = self.radius
+        size_x, size_y, size_z = self.shape
+
+        # Pad the units, so that the shifted views never leave the chip
+        units = np.frombuffer(wire.units, dtype=np.uint8).reshape(self.shape + (3,))
+        padded = np.pad(units, ((radius, radius), (radius, radius), (radius, radius), (0, 0)))
+
+        field = np.zeros(self.shape, dtype=np.int32)
+        for axis, offsets in enumerate(self.offsets):
+            for x, y, z in offsets:
+                field += padded[radius + x:radius + x + size_x, radius + y:radius + y + size_y, radius + z:radius + z + size_z, axis]
+
+        self.wire = wire
+        self.edits = wire.edits
+        self.field = field
+
+        return field
+
+
+class CongestionGrid():
+    """
+    Keeps the wire density of every point of the chip up to date while a Wire is
+    laid, so that the density of a point is a single lookup.
+
+    The grid listens to the Wire: every laid or removed wire unit only changes the
+    density of the points within the radius of the unit. The densities are the same
+    as those of WireDensity.
+    """
+
+    def __init__(self, wire, radius=2):
+        """
+        Initializes a CongestionGrid object and attaches it to the wire.
+
+        Parameters
+        ----------
+        wire: a Wire object
+                The Wire object whose units are followed.
+
+        radius: an int
+                The number of steps around a point in which wire units are counted.
+        """
+
+        self.wire = wire
+        self.graph = wire.graph
+        self.radius = radius
+
+        # Start from the density of the units laid thusfar, in flat index order
+        density = WireDensity(self.graph, radius)
+        self.shape = density.shape
+        self.density = density.compute(wire).reshape(-1).tolist()
+
+        # Per axis the offsets of the points whose density a unit changes, with
+        # their difference in flat index
+        stride_x, stride_y, stride_z = self.graph.strides
+        self.offsets = [[(x, y, z, x * stride_x + y * stride_y + z * stride_z) for x, y, z in offsets] for offsets in density.offsets]
+
+        wire.listeners.append(self)
+
+    def update_unit(self, edge, change):
+        """
+        Updates the density of the points around a wire unit.
+
+        Parameters
+        ----------
+        edge: an int
+                The edge ID of the wire unit, see Graph.get_edge.
+
+        change: an int
+                1 if the unit is laid, -1 if it is removed.
+        """
+
+        index, axis = divmod(edge, 3)
+
+        # Coordinates of the lower end of the unit
+        stride_x, stride_y, stride_z = self.graph.strides
+        x, rest = divmod(index, stride_x)
+        y, z = divmod(rest, stride_y)
+
+        # A unit starting at point + offset lies within the radius of point
+        size_x, size_y, size_z = self.shape
+        for offset_x, offset_y, offset_z, offset in self.offsets[axis]:
+            if 0 <= x - offset_x < size_x and 0 <= y - offset_y < size_y and 0 <= z - offset_z < size_z:
+                self.density[index - offset] += change
+
+    def get_density(self, node):
+        """
+        Returns the number of wire units within the radius of the node.
+
+        Parameters
+        ----------
+        node: a node
+                A node on the grid.
+
+        Returns
+        -------
+        int
+                The number of wire units surrounding the node.
+        """
+
+        return self.density[self.graph.get_index(node)]
+
+    def detach(self):
+        """
+        Stops following the wire.
+        """
+
+        self.wire.listeners.remove(self)
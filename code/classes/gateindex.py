@@ -0,0 +1,99 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+
+__author__ = 'Eline van Groningen, Mimoun Boulfich, Syrka van Kuppenveld'
+__copyright__ = 'Copyright 2020, Chips & Circuits'
+__credits__ = ['Eline van Groningen, Mimoun Boulfich, Syrka van Kuppenveld']
+__license__ = 'GNU GPL 3.0'
+__version__ = '0.1.0'
+__maintainer__ = 'Eline van Groningen, Mimoun Boulfich, Syrka van Kuppenveld'
+__email__ = 'elinevangroningen@gmail.com, mimounboulfich@live.nl, syrkavankuppenveld@gmail.com'
+__status__ = 'Dev'
+
+"""
+Code for the GateIndex class.
+
+
+This module contains the code for the GateIndex class.
+"""
+
+
+class GateIndex():
+    """
+    A spatial index over the coordinates of the gates.
+
+    The gates are put in buckets of cell_size x cell_size x cell_size points. A gate
+    within Manhattan radius r of a point lies at most r points away along each axis,
+    so with a cell size of r only the bucket of the point and the buckets directly
+    around it have to be searched.
+    """
+
+    def __init__(self, gates, cell_size):
+        """
+        Initializes a GateIndex object.
+
+        Parameters
+        ----------
+        gates: a dict
+                A dictionary with the gateIDs as keys and the Gate objects as values.
+
+        cell_size: an int
+                The size of a bucket along each axis, preferably the radius of the
+                searches.
+        """
+
+        self.cell_size = max(cell_size, 1)
+        self.buckets = {}
+
+        for gate in gates.values():
+            coords = gate.xcoord, gate.ycoord, gate.zcoord
+            self.buckets.setdefault(self.get_bucket(coords), []).append((coords, gate))
+
+    def get_bucket(self, coords):
+        """
+        Returns the key of the bucket that contains the coordinates.
+
+        Parameters
+        ----------
+        coords: a tuple
+                The (x, y, z) coordinates of a point.
+
+        Returns
+        -------
+        tuple
+                The key of the bucket.
+        """
+
+        return tuple(i // self.cell_size for i in coords)
+
+    def get_gates_within(self, coords, radius):
+        """
+        Returns the gates within Manhattan radius of the coordinates.
+
+        Parameters
+        ----------
+        coords: a tuple
+                The (x, y, z) coordinates of a point.
+
+        radius: an int
+                The maximum Manhattan distance of a gate to the point.
+
+        Returns
+        -------
+        list
+                A list of Gate objects, including a gate at the point itself.
+        """
+
+        # Number of buckets to search on each side of the bucket of the point
+        reach = -(-radius // self.cell_size)
+        bucket_x, bucket_y, bucket_z = self.get_bucket(coords)
+
+        gates = []
+        for x in range(bucket_x - reach, bucket_x + reach + 1):
+            for y in range(bucket_y - reach, bucket_y + reach + 1):
+                for z in range(bucket_z - reach, bucket_z + reach + 1):
+                    for gate_coords, gate in self.buckets.get((x, y, z), ()):
+                        if sum(abs(a - b) for a, b in zip(gate_coords, coords)) <= radius:
+                            gates.append(gate)
+
+        return gates
@@ -23,6 +23,8 @@ class Gate():
     Represents a gate on the grid.
     """
 
+    __slots__ = ('gateID', 'xcoord', 'ycoord', 'zcoord')
+
     def __init__(self, gateID, xcoord, ycoord):
         """
         Initialize Gate object.
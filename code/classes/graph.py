@@ -6,7 +6,10 @@ import csv
 import itertools
 
 # Own modules
+from code.classes.costfield import CostField
+from code.classes.density import CongestionGrid
 from code.classes.gates import Gate
+from code.classes.gateindex import GateIndex
 from code.classes.node import Node
 
 __author__ = 'Eline van Groningen, Mimoun Boulfich, Syrka van Kuppenveld'
@@ -53,10 +56,26 @@ class Graph():
         self.gates = self.load_gates(print_file)
         self.connections, self.netlist = self.load_connections(netlist_file)
         self.x_max, self.y_max, self.z_max = self.grid_coords(layers)
+        self.size, self.strides = self.grid_size()
         self.nodes = self.generate_nodes()
         self.generate_neighbors()
         self.set_gate_status()
 
+        # Nodes whose intersection count has been changed since the last clear
+        self.touched = set()
+
+        # Records the edits if set, see Journal
+        self.journal = None
+
+        # Congestion grids per radius, attached to a wire on first use
+        self.congestion = {}
+
+        # Objects that follow the wired nodes, see CostField
+        self.listeners = []
+
+        # Cost fields per set of weights, created on first use
+        self.cost_fields = {}
+
     def load_gates(self, print_file):
         """
         Returns dictionary with all gate objects.
@@ -145,6 +164,29 @@ class Graph():
 
         return x_max, y_max, z_max
 
+    def grid_size(self):
+        """
+        Returns the number of points in the grid and the strides of the flat index.
+
+        The flat index of a coordinate follows the order in which the coordinates 
+        are generated: index = x * stride_x + y * stride_y + z.
+
+        Returns
+        -------
+        int
+                The number of points in the grid.
+
+        tuple
+                A tuple containing the x-, y- and z-stride of the flat index.
+        """
+
+        stride_z = 1
+        stride_y = (self.z_max + 1) * stride_z
+        stride_x = (self.y_max + 1) * stride_y
+        size = (self.x_max + 1) * stride_x
+
+        return size, (stride_x, stride_y, stride_z)
+
     def generate_nodes(self):
         """
         Returns dict with all nodes present in the 3D grid.
@@ -159,9 +201,8 @@ class Graph():
         nodes = {}
 
         # Generate all possible coordinates and create dict entry with coord as key
-        for x, y, z in itertools.product(range(self.x_max + 1), range(self.y_max + 1), range(self.z_max + 1)):
-            coords = x, y, z
-            nodes[coords] = Node(coords)
+        for index, coords in enumerate(itertools.product(range(self.x_max + 1), range(self.y_max + 1), range(self.z_max + 1))):
+            nodes[coords] = Node(coords, index)
 
         return nodes
 
@@ -185,6 +226,10 @@ class Graph():
                 diff_total = diff_x + diff_y + diff_z
                 if neighbor in self.nodes and diff_total == 1 and diff_x < 2 and diff_y < 2 and diff_z < 2:
                     self.nodes[node].add_neighbor(self.nodes[neighbor])
+
+        # The neighbors never change after this point
+        for node in self.nodes.values():
+            node.freeze_neighbors()
                 
     def set_gate_status(self):
         """
@@ -195,50 +240,6 @@ class Graph():
             coords = self.gates[gate].xcoord, self.gates[gate].ycoord, self.gates[gate].zcoord 
             self.nodes[coords].set_isgate()
 
-    def get_gate_neighbours(self, density, node, count, radius):
-        """
-        Recursively looks at all neighbors within a given radius of the respective gate 
-        gate (="node"), and returns theneighbors that are a gate in a set.
-    
-        Parameters
-        ----------
-        density: a set
-                A set that is to be filled with neighbouring gates.
-
-        node: a Node Object
-                A Node Object of the gate-coordinate whose neighboring gates are to be retrieved.
-
-        count: an int
-                An integers that keeps track of the recursion depth.
-                
-        radius: an int
-                An integer that specifies the depth of the recursion.
-
-        Returns
-        -------
-        set
-            A set of neighboring gates that lie within the given radius.
-
-        """
-        
-        densitySet = density
-
-        # Recursively get neighboring gates within radius distance
-        if count < radius:
-            count += 1
-            # Check if neighbours are gates, if True append them to the density set
-            for neighbor in node.neighbors:
-                if neighbor.isgate:
-                    densitySet.add(neighbor)
-                    return densitySet
-                
-                # Update the node and resume recursion
-                node = neighbor
-                self.get_gate_neighbours(densitySet, node, count, radius)
-        
-        return densitySet
-
-
     def get_gate_densities(self, order, radius):
         """
         Returns list with connection ordered based on the gate density.
@@ -249,7 +250,8 @@ class Graph():
                 True if order is from max to min, False if order is from min to max.
 
         radius: a int
-                The radius on for which the density is computed.
+                The Manhattan distance within which other gates are counted, any
+                integer.
 
         Returns
         -------
@@ -259,21 +261,14 @@ class Graph():
 
         gate_densities = []
 
-        for gate in self.gates:
+        # Index the gates once, so that every gate only searches the gates around it
+        index = GateIndex(self.gates, radius)
 
-            # Get corresponding node of the gate
+        for gate in self.gates:
             coords = self.gates[gate].xcoord, self.gates[gate].ycoord, self.gates[gate].zcoord
-            node = self.nodes[coords]
-
-            # Store gates that are within the pre-specified radius of the current gate
-            density = set()
-
-            # Determine radius (recursion depth)
-            count = 0
 
-            # Get gate-density of the current gate and append it to the gate_den
-            density = self.get_gate_neighbours(density, node, count, radius)
-            len_density = len(density) - 1
+            # Count the other gates within the radius of the current gate
+            len_density = len(index.get_gates_within(coords, radius)) - 1
 
             # Append gate and density to list
             gate_densities.append((gate, len_density))
@@ -325,16 +320,297 @@ class Graph():
     def clear_graph(self):
         """
         Cleans a Graph Object.
+
+        The topology of the chip (gates, nodes and neighbors) never changes, so only 
+        the intersection counts of the nodes that were touched are reset.
         """
 
-        self.gates = self.load_gates(self.print_file)
-        self.connections, self.netlist = self.load_connections(self.netlist_file)
-        self.x_max, self.y_max, self.z_max = self.grid_coords(self.layers)
-        self.nodes = self.generate_nodes()
-        self.generate_neighbors()
-        self.set_gate_status()
+        for node in self.touched:
+            node.intersection = 0
 
+        self.touched = set()
 
+        for listener in self.listeners:
+            listener.clear()
 
-        
+    # The methods below form the node API that the algorithms use to walk the grid.
+    # A node is whatever the backend uses to represent a grid point: a Node object
+    # for the Graph, a flat integer index for the Lattice.
+
+    def get_node(self, coords):
+        """
+        Returns the node at the given coordinates.
+
+        Parameters
+        ----------
+        coords: a tuple
+                A tuple containing the x-, y- and z-coordinates of the grid.
+
+        Returns
+        -------
+        Node object
+                The Node object at the given coordinates.
+        """
+
+        return self.nodes[coords]
+
+    def get_gate_node(self, gate):
+        """
+        Returns the node on which the given gate lies.
+
+        Parameters
+        ----------
+        gate: a Gate object
+                A Gate object of the chip.
+
+        Returns
+        -------
+        Node object
+                The Node object of the gate.
+        """
+
+        return self.get_node((gate.xcoord, gate.ycoord, gate.zcoord))
+
+    def get_coords(self, node):
+        """
+        Returns the coordinates of the node.
+
+        Parameters
+        ----------
+        node: a Node object
+                A Node object of the grid.
+
+        Returns
+        -------
+        tuple
+                A tuple containing the x-, y- and z-coordinates of the node.
+        """
+
+        return node.xcoord, node.ycoord, node.zcoord
+
+    def get_index(self, node):
+        """
+        Returns the flat index of the node.
+
+        Parameters
+        ----------
+        node: a Node object
+                A Node object of the grid.
+
+        Returns
+        -------
+        int
+                The flat index of the node.
+        """
+
+        return node.index
+
+    def get_neighbors(self, node):
+        """
+        Returns the neighbors of the node.
+
+        Parameters
+        ----------
+        node: a Node object
+                A Node object of the grid.
+
+        Returns
+        -------
+        iterable
+                The neighboring Node objects.
+        """
+
+        return node.neighbors
+
+    def is_gate(self, node):
+        """
+        Returns True if the node contains a gate, otherwise False.
+
+        Parameters
+        ----------
+        node: a Node object
+                A Node object of the grid.
+
+        Returns
+        -------
+        bool
+                True if the node contains a gate, otherwise False.
+        """
+
+        return node.isgate
+
+    def get_intersection(self, node):
+        """
+        Returns the number of times the wire passed the node.
+
+        Parameters
+        ----------
+        node: a Node object
+                A Node object of the grid.
+
+        Returns
+        -------
+        int
+                The intersection count of the node.
+        """
+
+        return node.intersection
+
+    def increment_intersection(self, node):
+        """
+        Increments the intersection count of the node with 1.
+
+        Parameters
+        ----------
+        node: a Node object
+                A Node object of the grid.
+        """
+
+        node.increment_intersection()
+        self.touched.add(node)
+
+        # The node became wired
+        if node.intersection == 1:
+            for listener in self.listeners:
+                listener.update_wired(node, 1)
+
+        if self.journal is not None:
+            self.journal.record(self.decrement_intersection, node)
+
+    def decrement_intersection(self, node):
+        """
+        Decrements the intersection count of the node with 1.
+
+        Parameters
+        ----------
+        node: a Node object
+                A Node object of the grid.
+        """
+
+        node.decrement_intersection()
+
+        # The node became unwired
+        if node.intersection == 0:
+            for listener in self.listeners:
+                listener.update_wired(node, -1)
+
+        if self.journal is not None:
+            self.journal.record(self.increment_intersection, node)
+
+    def get_edge(self, position, step):
+        """
+        Returns the edge ID of the wire unit between two neighboring nodes.
+
+        The edge ID is the flat index of the lowest node times 3 plus the axis 
+        (0 = x, 1 = y, 2 = z) along which the unit runs.
+
+        Parameters
+        ----------
+        position: a node
+                A node representing the current position of the wire.
+
+        step: a node
+                A node representing the next position of the wire.
+
+        Returns
+        -------
+        int
+                The edge ID of the wire unit.
+        """
+
+        index_a = self.get_index(position)
+        index_b = self.get_index(step)
+
+        # Order the indices, the difference tells the axis
+        if index_a > index_b:
+            index_a, index_b = index_b, index_a
+        diff = index_b - index_a
+
+        if diff == 1:
+            axis = 2
+        elif diff == self.strides[1]:
+            axis = 1
+        else:
+            axis = 0
+
+        return index_a * 3 + axis
+
+    def update_occupancy(self, edge, value):
+        """
+        Marks a wire unit as occupied (1) or free (0).
+
+        The Graph keeps no occupancy of its own, the wire path is the only record
+        of the laid wire units. The Lattice overrides this method.
+
+        Parameters
+        ----------
+        edge: an int
+                The edge ID of the wire unit.
+
+        value: an int
+                1 if the unit is laid, 0 if it is removed.
+        """
+
+        pass
+
+    def get_wire_density(self, node, wire, radius=2):
+        """
+        Returns the number of wire units within radius steps of the node, see 
+        WireDensity. The density is looked up in a CongestionGrid that follows the
+        wire.
+
+        Parameters
+        ----------
+        node: a node
+                A node representing the current position of the wire.
+
+        wire: a Wire object
+                A Wire object holding the wire units laid thusfar.
+
+        radius: an int
+                The number of steps around the node in which wire units are counted.
+
+        Returns
+        -------
+        int
+                The number of wires surrounding the node.
+        """
+
+        # The grid is built once per wire and then updated with every wire unit
+        grid = self.congestion.get(radius)
+        if grid is None or grid.wire is not wire:
+            if grid is not None:
+                grid.detach()
+            grid = self.congestion[radius] = CongestionGrid(wire, radius)
+
+        return grid.get_density(node)
+
+    def get_cost_field(self, layer_costs, cost_intersection, cost_neighbors):
+        """
+        Returns the CostField with the given weights, which follows the wired nodes
+        of the graph.
+
+        Parameters
+        ----------
+        layer_costs: a tuple
+                The costs per layer, starting at layer 0.
+
+        cost_intersection: an int
+                The costs of a node that is already wired.
+
+        cost_neighbors: an int
+                The costs per neighbor that is already wired.
+
+        Returns
+        -------
+        CostField object
+                The cost field of the graph.
+        """
+
+        # The field is built once per set of weights and then updated with every
+        # wired node
+        key = (tuple(layer_costs), cost_intersection, cost_neighbors)
+        if key not in self.cost_fields:
+            self.cost_fields[key] = CostField(self, layer_costs, cost_intersection, cost_neighbors)
 
+        return self.cost_fields[key]
@@ -0,0 +1,351 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+
+# Built-in/Generic Imports
+import collections
+import contextlib
+import json
+import time
+
+__author__ = 'Eline van Groningen, Mimoun Boulfich, Syrka van Kuppenveld'
+__copyright__ = 'Copyright 2020, Chips & Circuits'
+__credits__ = ['Eline van Groningen, Mimoun Boulfich, Syrka van Kuppenveld']
+__license__ = 'GNU GPL 3.0'
+__version__ = '0.1.0'
+__maintainer__ = 'Eline van Groningen, Mimoun Boulfich, Syrka van Kuppenveld'
+__email__ = 'elinevangroningen@gmail.com, mimounboulfich@live.nl, syrkavankuppenveld@gmail.com'
+__status__ = 'Dev'
+
+"""
+Code for the Instrumentation class.
+
+
+This module contains the code for the Instrumentation class, which counts the calls
+of the routing primitives and times the phases of a run.
+"""
+
+COUNTERS = ('check_collision', 'next_position', 'lookahead_nodes', 'restarts', 'hillclimber_iterations')
+PHASES = ('graph_build', 'routing', 'costing', 'plotting')
+
+# The enabled Instrumentation object, None when the instrumentation is disabled
+active = None
+
+
+def phase(name):
+    """
+    Returns a context manager that times a phase with the enabled instrumentation,
+    or does nothing when it is disabled.
+
+    Parameters
+    ----------
+    name: a string
+            One of PHASES.
+
+    Returns
+    -------
+    context manager
+            The timer of the phase.
+    """
+
+    if active is None:
+        return contextlib.nullcontext()
+
+    return active.phase(name)
+
+
+class Instrumentation():
+    """
+    Counts the calls of the routing primitives and times the phases of the runs.
+
+    Enabling the instrumentation wraps the methods it measures in the classes and
+    disabling it puts the originals back, so the algorithms run their own code
+    without any check when it is disabled.
+
+    Counters
+    --------
+    check_collision: the calls of Wire.check_collision.
+    next_position: the steps the algorithms tried to take.
+    lookahead_nodes: the nodes expanded by the look ahead searches.
+    restarts: the restarts after a ValueError, of all runs.
+    hillclimber_iterations: the iterations of the HillClimber runs.
+
+    Phases
+    ------
+    graph_build, routing, costing and plotting, in seconds. Costing is also counted
+    in routing when the algorithm computes costs while it runs.
+
+    Only the work of this process is measured, the workers of the process pools of
+    the Restart Hillclimber and the Portfolio are not.
+    """
+
+    def __init__(self):
+        """
+        Initializes an Instrumentation object.
+        """
+
+        self.counters = collections.Counter({name: 0 for name in COUNTERS})
+        self.timers = collections.Counter({name: 0.0 for name in PHASES})
+
+        # The restarts, iterations and time of every run of an algorithm
+        self.runs = []
+
+        # Number of nested calls per counter and phase, only the outermost one counts
+        self.depth = collections.Counter()
+
+        # The (class, name, original) of every wrapped method
+        self.patches = []
+
+    @contextlib.contextmanager
+    def phase(self, name):
+        """
+        Times a phase, a phase that is entered again from within is timed once.
+
+        Parameters
+        ----------
+        name: a string
+                One of PHASES.
+        """
+
+        self.depth[name] += 1
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.depth[name] -= 1
+            if self.depth[name] == 0:
+                self.timers[name] += time.perf_counter() - start
+
+    def counted(self, name, method):
+        """
+        Returns the method that counts its calls, a call from within an override of
+        the method is not counted again.
+
+        Parameters
+        ----------
+        name: a string
+                The name of the counter.
+
+        method: a function
+                The method to count.
+
+        Returns
+        -------
+        function
+                The counting method.
+        """
+
+        counters = self.counters
+        depth = self.depth
+
+        def counting_method(*args, **kwargs):
+            depth[name] += 1
+            try:
+                return method(*args, **kwargs)
+            finally:
+                depth[name] -= 1
+                if depth[name] == 0:
+                    counters[name] += 1
+
+        return counting_method
+
+    def timed(self, name, method):
+        """
+        Returns the method that times its calls as a phase.
+
+        Parameters
+        ----------
+        name: a string
+                One of PHASES.
+
+        method: a function
+                The method to time.
+
+        Returns
+        -------
+        function
+                The timed method.
+        """
+
+        def timed_method(*args, **kwargs):
+            with self.phase(name):
+                return method(*args, **kwargs)
+
+        return timed_method
+
+    def searched(self, method):
+        """
+        Returns the look ahead search that counts the nodes it expands.
+
+        Parameters
+        ----------
+        method: a function
+                The search method of GreedyLookAhead.
+
+        Returns
+        -------
+        function
+                The counting search method.
+        """
+
+        counters = self.counters
+
+        def counting_search(algo, *args, **kwargs):
+            tried = algo.tried
+            try:
+                return method(algo, *args, **kwargs)
+            finally:
+                counters['lookahead_nodes'] += algo.tried - tried
+
+        return counting_search
+
+    def recorded(self, method):
+        """
+        Returns the run method that times the routing and records the restarts and
+        iterations of the run.
+
+        Parameters
+        ----------
+        method: a function
+                The run method of an algorithm.
+
+        Returns
+        -------
+        function
+                The recording run method.
+        """
+
+        def recording_run(algo, *args, **kwargs):
+            start = time.perf_counter()
+            with self.phase('routing'):
+                result = method(algo, *args, **kwargs)
+
+            record = {'algorithm': type(algo).__name__, 'seconds': time.perf_counter() - start}
+
+            # Restarts after a ValueError, rip-ups and climbs are kept by the algorithms
+            if getattr(algo, 'restarts', None) is not None:
+                record['restarts'] = algo.restarts
+                self.counters['restarts'] += algo.restarts
+            if getattr(algo, 'ripups', None) is not None:
+                record['ripups'] = algo.ripups
+            if isinstance(getattr(algo, 'iteration', None), list):
+                record['iterations'] = len(algo.iteration)
+                self.counters['hillclimber_iterations'] += len(algo.iteration)
+
+            self.runs.append(record)
+
+            return result
+
+        return recording_run
+
+    def patch(self, owner, name, wrapper):
+        """
+        Replaces a method of a class by its wrapped method.
+
+        Parameters
+        ----------
+        owner: a class
+                The class that defines the method.
+
+        name: a string
+                The name of the method.
+
+        wrapper: a function
+                Returns the wrapped method of the method.
+        """
+
+        original = owner.__dict__[name]
+        self.patches.append((owner, name, original))
+        setattr(owner, name, wrapper(original))
+
+    def enable(self):
+        """
+        Wraps the measured methods and makes this the active instrumentation.
+        """
+
+        global active
+
+        if active is not None:
+            raise RuntimeError("the instrumentation is already enabled")
+
+        # The algorithms import the classes, so they are imported here
+        import code.algorithms as alg
+        from code.classes.graph import Graph
+        from code.classes.wire import Wire
+
+        self.patch(Graph, '__init__', lambda method: self.timed('graph_build', method))
+        self.patch(Wire, 'check_collision', lambda method: self.counted('check_collision', method))
+        self.patch(Wire, 'compute_costs', lambda method: self.timed('costing', method))
+        self.patch(alg.GreedyLookAhead, 'search', self.searched)
+
+        # The algorithms, not the RunController and Portfolio that run them
+        algorithms = (alg.Random, alg.Greedy, alg.GreedyLookAhead, alg.GreedyNoIntersect, alg.GreedyNoIntersectLookAhead,
+                      alg.GreedyCosts, alg.GreedyLookAheadCosts, alg.GreedyWireJam, alg.GreedyLookAheadWireJam, alg.AStar,
+                      alg.RandomRipUp, alg.GreedyRipUp, alg.GreedyLookAheadRipUp, alg.GreedyNoIntersectRipUp,
+                      alg.GreedyNoIntersectLookAheadRipUp, alg.GreedyCostsRipUp, alg.GreedyLookAheadCostsRipUp,
+                      alg.GreedyWireJamRipUp, alg.GreedyLookAheadWireJamRipUp, alg.HillClimber, alg.SimulatedAnnealing)
+
+        # Every class of the algorithms that defines a measured method, bases included
+        classes = set()
+        for algorithm in algorithms:
+            classes.update(algorithm.__mro__)
+
+        for owner in sorted(classes, key=lambda owner: owner.__qualname__):
+            if 'next_position' in owner.__dict__:
+                self.patch(owner, 'next_position', lambda method: self.counted('next_position', method))
+            if 'compute_wire_costs' in owner.__dict__:
+                self.patch(owner, 'compute_wire_costs', lambda method: self.timed('costing', method))
+            if 'run' in owner.__dict__:
+                self.patch(owner, 'run', self.recorded)
+
+        for name in ('handle_start_state_visualization', 'handle_conversion_plot_visualization'):
+            self.patch(alg.HillClimber, name, lambda method: self.timed('plotting', method))
+
+        active = self
+
+    def disable(self):
+        """
+        Puts the original methods back.
+        """
+
+        global active
+
+        for owner, name, original in reversed(self.patches):
+            setattr(owner, name, original)
+
+        self.patches = []
+        active = None
+
+    def get_report(self):
+        """
+        Returns the report of the counters, phases and runs.
+
+        Returns
+        -------
+        dict
+                The counters, the seconds per phase and the runs.
+        """
+
+        return {
+            'counters': dict(self.counters),
+            'seconds': dict(self.timers),
+            'runs': list(self.runs),
+        }
+
+    def save(self, filename, **info):
+        """
+        Saves the report as JSON.
+
+        Parameters
+        ----------
+        filename: a string
+                The path of the JSON file.
+
+        info: keyword arguments
+                The configuration of the run(s), added to the report.
+        """
+
+        report = dict(info)
+        report.update(self.get_report())
+
+        with open(filename, 'w') as output_file:
+            json.dump(report, output_file, indent=4)
@@ -0,0 +1,94 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+
+__author__ = 'Eline van Groningen, Mimoun Boulfich, Syrka van Kuppenveld'
+__copyright__ = 'Copyright 2020, Chips & Circuits'
+__credits__ = ['Eline van Groningen, Mimoun Boulfich, Syrka van Kuppenveld']
+__license__ = 'GNU GPL 3.0'
+__version__ = '0.1.0'
+__maintainer__ = 'Eline van Groningen, Mimoun Boulfich, Syrka van Kuppenveld'
+__email__ = 'elinevangroningen@gmail.com, mimounboulfich@live.nl, syrkavankuppenveld@gmail.com'
+__status__ = 'Dev'
+
+"""
+Code for the Journal class.
+
+
+This module contains the code for the Journal class.
+"""
+
+
+class Journal():
+    """
+    Records the edits of a Wire and a Graph, so that they can be undone.
+
+    A Wire or Graph whose journal attribute is set records the inverse of every
+    edit it makes. Rolling back replays these inverses in reverse order, which
+    costs as much as the edits themselves and needs no copies of the state.
+    """
+
+    __slots__ = ('entries', 'recording')
+
+    def __init__(self):
+        """
+        Initializes a Journal object.
+        """
+
+        # Inverse edits as (function, arguments) tuples
+        self.entries = []
+
+        # False while rolling back, so the inverse edits are not recorded again
+        self.recording = True
+
+    def record(self, undo, *args):
+        """
+        Records the inverse of an edit.
+
+        Parameters
+        ----------
+        undo: a function
+                The function that undoes the edit.
+
+        args:
+                The arguments of the function.
+        """
+
+        if self.recording:
+            self.entries.append((undo, args))
+
+    def mark(self):
+        """
+        Returns a mark of the current position in the journal.
+
+        Returns
+        -------
+        int
+                The number of recorded edits.
+        """
+
+        return len(self.entries)
+
+    def commit(self):
+        """
+        Accepts all recorded edits.
+        """
+
+        self.entries = []
+
+    def rollback(self, mark=0):
+        """
+        Undoes the edits recorded after the given mark, latest first.
+
+        Parameters
+        ----------
+        mark: an int
+                A mark returned by Journal.mark, 0 undoes all recorded edits.
+        """
+
+        self.recording = False
+
+        while len(self.entries) > mark:
+            undo, args = self.entries.pop()
+            undo(*args)
+
+        self.recording = True
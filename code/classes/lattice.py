@@ -0,0 +1,316 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+
+# Built-in/Generic Imports
+import itertools
+
+# Libs
+import numpy as np
+
+# Own modules
+from code.classes.graph import Graph
+
+__author__ = 'Eline van Groningen, Mimoun Boulfich, Syrka van Kuppenveld'
+__copyright__ = 'Copyright 2020, Chips & Circuits'
+__credits__ = ['Eline van Groningen, Mimoun Boulfich, Syrka van Kuppenveld']
+__license__ = 'GNU GPL 3.0'
+__version__ = '0.1.0'
+__maintainer__ = 'Eline van Groningen, Mimoun Boulfich, Syrka van Kuppenveld'
+__email__ = 'elinevangroningen@gmail.com, mimounboulfich@live.nl, syrkavankuppenveld@gmail.com'
+__status__ = 'Dev'
+
+"""
+Code for the Lattice class.
+
+
+This module contains the code for the Lattice class, an array-backed alternative 
+for the Graph class. 
+"""
+
+
+class Lattice(Graph):
+    """
+    Creates a Lattice object that represents the chip grid as flat arrays instead 
+    of a dictionary of Node objects.
+
+    Every point of the grid is a flat integer index (see Graph.grid_size). The 
+    gate mask, the intersection counts and the occupancy of the wire units are 
+    stored in NumPy arrays and the neighbors in a precomputed (N, 6) index table.
+    The algorithms walk the Lattice through the node API of the Graph, so no Node 
+    objects are built.
+    """
+
+    # Offsets of the neighbors, in the order of the columns of the neighbor table
+    OFFSETS = ((-1, 0, 0), (1, 0, 0), (0, -1, 0), (0, 1, 0), (0, 0, -1), (0, 0, 1))
+
+    # Static topology per chip (print file and layers), built once and shared by 
+    # all Lattice objects of that chip
+    topologies = {}
+
+    def generate_nodes(self):
+        """
+        Returns dict with the flat index of all coordinates present in the 3D grid
+        and allocates the arrays of the mutable grid state.
+
+        The static topology (coordinates, neighbor table and gate mask) is taken from 
+        the cache, or built and cached if this is the first Lattice of the chip.
+
+        Returns
+        -------
+        dict
+                A dictionary containing the coordinates of the grid as keys and the 
+                flat indices as values.
+        """
+
+        key = (self.print_file, self.layers)
+        if key not in Lattice.topologies:
+            Lattice.topologies[key] = self.build_topology()
+
+        nodes, self.coordinates, self.neighbor_table, self.neighbor_lists, self.gate_mask = Lattice.topologies[key]
+
+        # Intersection count per node and occupancy per wire unit (node, axis)
+        self.intersection = np.zeros(self.size, dtype=np.int32)
+        self.occupancy = np.zeros((self.size, 3), dtype=np.uint8)
+        self.occupancy_units = self.occupancy.reshape(-1)
+
+        # Wire units whose occupancy has been set since the last clear
+        self.touched_units = set()
+
+        return nodes
+
+    def build_topology(self):
+        """
+        Returns the static topology of the chip.
+
+        Returns
+        -------
+        tuple
+                A tuple containing the dictionary of flat indices, the list of 
+                coordinates per flat index, the (N, 6) neighbor table (-1 marks a 
+                neighbor outside the grid), the neighbors per flat index as tuples 
+                and the gate mask.
+        """
+
+        # Coordinates per flat index, in the same order as the Graph
+        coordinates = list(itertools.product(range(self.x_max + 1), range(self.y_max + 1), range(self.z_max + 1)))
+        nodes = {coords: index for index, coords in enumerate(coordinates)}
+
+        coords = np.array(coordinates, dtype=np.int64)
+        dims = np.array((self.x_max + 1, self.y_max + 1, self.z_max + 1))
+        strides = np.array(self.strides)
+        indices = np.arange(self.size)
+
+        neighbor_table = np.full((self.size, len(self.OFFSETS)), -1, dtype=np.int64)
+
+        # Fill one column per direction for all nodes at once
+        for column, offset in enumerate(self.OFFSETS):
+            target = coords + offset
+            valid = np.all((target >= 0) & (target < dims), axis=1)
+            neighbor_table[valid, column] = indices[valid] + int(np.dot(offset, strides))
+
+        # Python tuples of the valid neighbors for fast iteration by the algorithms
+        neighbor_lists = [tuple(neighbor for neighbor in row if neighbor >= 0) for row in neighbor_table.tolist()]
+
+        gate_mask = np.zeros(self.size, dtype=bool)
+        for gate in self.gates.values():
+            gate_mask[self.get_gate_node(gate)] = True
+
+        # The topology is shared, so it must never be written to
+        neighbor_table.flags.writeable = False
+        gate_mask.flags.writeable = False
+
+        return nodes, coordinates, neighbor_table, neighbor_lists, gate_mask
+
+    def generate_neighbors(self):
+        """
+        The neighbor table is part of the topology, see build_topology.
+        """
+
+        pass
+
+    def set_gate_status(self):
+        """
+        The gate mask is part of the topology, see build_topology.
+        """
+
+        pass
+
+    def clear_graph(self):
+        """
+        Cleans a Lattice Object.
+
+        Only the intersection counts and the occupancy of the touched nodes and 
+        wire units are reset.
+        """
+
+        if self.touched:
+            self.intersection[list(self.touched)] = 0
+        if self.touched_units:
+            self.occupancy_units[list(self.touched_units)] = 0
+
+        self.touched = set()
+        self.touched_units = set()
+
+        for listener in self.listeners:
+            listener.clear()
+
+    def get_node(self, coords):
+        """
+        Returns the flat index of the given coordinates.
+
+        Parameters
+        ----------
+        coords: a tuple
+                A tuple containing the x-, y- and z-coordinates of the grid.
+
+        Returns
+        -------
+        int
+                The flat index of the coordinates.
+        """
+
+        stride_x, stride_y, stride_z = self.strides
+
+        return coords[0] * stride_x + coords[1] * stride_y + coords[2] * stride_z
+
+    def get_coords(self, node):
+        """
+        Returns the coordinates of the flat index.
+
+        Parameters
+        ----------
+        node: an int
+                The flat index of a grid point.
+
+        Returns
+        -------
+        tuple
+                A tuple containing the x-, y- and z-coordinates of the node.
+        """
+
+        return self.coordinates[node]
+
+    def get_index(self, node):
+        """
+        Returns the flat index of the node, which is the node itself.
+
+        Parameters
+        ----------
+        node: an int
+                The flat index of a grid point.
+
+        Returns
+        -------
+        int
+                The flat index of the node.
+        """
+
+        return node
+
+    def get_neighbors(self, node):
+        """
+        Returns the flat indices of the neighbors of the node.
+
+        Parameters
+        ----------
+        node: an int
+                The flat index of a grid point.
+
+        Returns
+        -------
+        tuple
+                The flat indices of the neighbors.
+        """
+
+        return self.neighbor_lists[node]
+
+    def is_gate(self, node):
+        """
+        Returns True if the node contains a gate, otherwise False.
+
+        Parameters
+        ----------
+        node: an int
+                The flat index of a grid point.
+
+        Returns
+        -------
+        bool
+                True if the node contains a gate, otherwise False.
+        """
+
+        return bool(self.gate_mask[node])
+
+    def get_intersection(self, node):
+        """
+        Returns the number of times the wire passed the node.
+
+        Parameters
+        ----------
+        node: an int
+                The flat index of a grid point.
+
+        Returns
+        -------
+        int
+                The intersection count of the node.
+        """
+
+        return int(self.intersection[node])
+
+    def increment_intersection(self, node):
+        """
+        Increments the intersection count of the node with 1.
+
+        Parameters
+        ----------
+        node: an int
+                The flat index of a grid point.
+        """
+
+        self.intersection[node] += 1
+        self.touched.add(node)
+
+        # The node became wired
+        if self.intersection[node] == 1:
+            for listener in self.listeners:
+                listener.update_wired(node, 1)
+
+        if self.journal is not None:
+            self.journal.record(self.decrement_intersection, node)
+
+    def decrement_intersection(self, node):
+        """
+        Decrements the intersection count of the node with 1.
+
+        Parameters
+        ----------
+        node: an int
+                The flat index of a grid point.
+        """
+
+        self.intersection[node] -= 1
+
+        # The node became unwired
+        if self.intersection[node] == 0:
+            for listener in self.listeners:
+                listener.update_wired(node, -1)
+
+        if self.journal is not None:
+            self.journal.record(self.increment_intersection, node)
+
+    def update_occupancy(self, edge, value):
+        """
+        Marks a wire unit as occupied (1) or free (0).
+
+        Parameters
+        ----------
+        edge: an int
+                The edge ID of the wire unit (see Graph.get_edge).
+
+        value: an int
+                1 if the unit is laid, 0 if it is removed.
+        """
+
+        self.occupancy_units[edge] = value
+        self.touched_units.add(edge)
@@ -21,9 +21,14 @@ This module contains the code for the Node class.
 class Node():
     """
     Creates a Node object which represents a coordinate on the grid.
+
+    The Node is slotted to keep the memory per grid point small, and its 
+    neighbors are frozen into a tuple once the Graph is built.
     """
 
-    def __init__(self, coords):
+    __slots__ = ('index', 'xcoord', 'ycoord', 'zcoord', 'neighbors', 'isgate', 'intersection')
+
+    def __init__(self, coords, index=None):
         """
         Initializes a Node object.
         
@@ -31,8 +36,12 @@ class Node():
         ----------
         coords: a tuple
                 A tuple containing the x-, y- and z-coordates of the grid.
+
+        index: an int
+                The flat index of the coordinate in the grid.
         """
 
+        self.index = index
         self.xcoord = coords[0]
         self.ycoord = coords[1]
         self.zcoord = coords[2]
@@ -52,6 +61,13 @@ class Node():
 
         self.neighbors.add(neighbor)
 
+    def freeze_neighbors(self):
+        """
+        Converts the set of neighbors into a tuple.
+        """
+
+        self.neighbors = tuple(self.neighbors)
+
     def set_isgate(self):
         """
         Set self.isgate to True.
@@ -84,7 +100,7 @@ class Node():
         """
 
         # Instantiate new node object with same coordinates
-        copy = Node((self.xcoord, self.ycoord, self.zcoord))
+        copy = Node((self.xcoord, self.ycoord, self.zcoord), self.index)
 
         # Set all attributes equal to self
         copy.neighbors = self.neighbors
@@ -93,88 +109,6 @@ class Node():
         
         return copy
 
-    def get_resursive_wire_density(self, node, surroundingWires, wirePath, count, radius):
-        """
-        Recursively looks at all neighbors within a given radius of the initial node 
-        and check how many wire-units are encountered on the way.
-
-        Parameters
-        ----------
-        node : a Node object
-                A Node Object whose directions are checked on having a path laid upon them.
-
-        surroundingWires : an int
-                A number representing the number of wire units encounters thus far.
-
-        wirePath : a set
-                A set of tuples representing the wire units laid by the algorithm (thus far).
-
-        count : an int
-                An integers that keeps track of the recursion depth.
-
-        radius : an int
-                An integer that specifies the depth of the recursion.
-
-        Returns
-        -------
-        list
-                A list of which the number of elements represent the number of wires 
-                encountered thusfar.
-
-        """
-
-        # Recurisively get the number of wire units within radius distance
-        if count < radius:
-            count += 1
-
-            # For each neighbor of the current node
-            for neighbor in node.neighbors:
-                neighborCoords = (neighbor.xcoord, neighbor.ycoord, neighbor.zcoord)
-                currentNodeCoords = (node.xcoord, node.ycoord, node.zcoord)
-                
-                # Check if a wire path has been placed on the path to the current neighbor 
-                wireToNeighbor = tuple(sorted((currentNodeCoords, neighborCoords))) 
-                if wireToNeighbor in wirePath:
-                    surroundingWires.append(1)
-                    return surroundingWires
-                
-                # Update the node and resume recursion
-                node = neighbor
-                self.get_resursive_wire_density(node, surroundingWires, wirePath, count, radius)
-        
-        return surroundingWires
-    
-    def get_wire_density(self, initialNode, wirePath):
-        """
-        Retrieves the number of wire lengths within a pre-specified radius surrounding the 
-        current neihbour in a pre-specified radius.
-
-        Parameters
-        ----------
-        initialNode : a Node object
-                A Node object representing the current Node
-        wirePath : set
-                A set af coordinate-combinations representing the wire-length units 
-                of the path laid thusfar
-
-        Returns
-        -------
-        int
-                The number of wires surrounding the current node
-        """
-        
-        node = initialNode
-        surroundingWires = []
-        
-        # Determine radius (recursion depth)
-        count = 0
-        radius = 2
-        
-        # Get the number of surrounding wires
-        surroundingWires = self.get_resursive_wire_density(node, surroundingWires, wirePath, count, radius)
-
-        return len(surroundingWires)
-    
     def __repr__(self):
         """Ensure that the object is printed properly if it is in a list/dict.
         
@@ -185,13 +119,3 @@ class Node():
         """
 
         return str((self.xcoord, self.ycoord, self.zcoord))
-
-    
-
-    
-
-    
-
-
-
-    
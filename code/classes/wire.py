@@ -24,39 +24,117 @@ This module contains the code for the Wire class.
 class Wire():
     """
     Represents wire of the chip.
+
+    The length and the number of intersections are kept as running totals, so 
+    computing the costs does not depend on the size of the wire. In debug mode 
+    the totals are cross-checked against a full recount every time the costs are 
+    computed.
     """
 
-    def __init__(self):
+    # Default for the debug mode of new Wire objects
+    DEBUG = False
+
+    __slots__ = ('graph', 'units', 'length', 'edits', 'visits', 'intersections', 'debug', 'coords', 'journal', 'listeners')
+
+    def __init__(self, graph, debug=None):
         """
         Initializes a Wire object.
+
+        Parameters
+        ----------
+        graph: a Graph object
+                A Graph (or Lattice) object representing the chip grid.
+
+        debug: a bool
+                True to cross-check the running totals against a full recount, 
+                defaults to Wire.DEBUG.
         """
 
-        # Keeps track of wire path for checking on collisions and computing costs
-        self.path = set() 
+        self.graph = graph
+
+        # Keeps track of the laid wire units for checking on collisions, one byte 
+        # per edge ID (see Graph.get_edge)
+        self.units = bytearray(3 * graph.size)
+
+        # Keeps track of the number of laid wire units
+        self.length = 0
 
-        # Keeps track of coordinates for counting itersections
+        # Counts the changes of the units, so that fields computed from them (see 
+        # WireDensity) can tell if they are up to date
+        self.edits = 0
+
+        # Keeps track of the number of visits per node for counting intersections
+        self.visits = [0] * graph.size
+        self.intersections = 0
+
+        # Keeps track of coordinates for the full recount in debug mode
+        self.debug = Wire.DEBUG if debug is None else debug
         self.coords = []
 
+        # Records the edits if set, see Journal
+        self.journal = None
+
+        # Objects that follow the laid wire units, see CongestionGrid
+        self.listeners = []
+
     def update_path(self, position, step):
         """
         Updates the wire path.
 
         Parameters
         ---------
-        position: a Node object
-                A node object representing the current position of the wire in the grid.
+        position: a node
+                A node representing the current position of the wire in the grid.
 
-        step: a Node object
-                A node object representing the next position of the wire in the grid.
+        step: a node
+                A node representing the next position of the wire in the grid.
         """
 
-        # Get position and step coordinates
-        position_coords = position.xcoord, position.ycoord, position.zcoord
-        step_coords =  step.xcoord, step.ycoord, step.zcoord
+        edge = self.graph.get_edge(position, step)
+
+        # A unit can only be laid once
+        if not self.units[edge]:
+            self.units[edge] = 1
+            self.length += 1
+            self.edits += 1
+
+            for listener in self.listeners:
+                listener.update_unit(edge, 1)
 
-        # Sort and convert to tuple to ensure consistent order
-        path = tuple(sorted((position_coords, step_coords)))
-        self.path.add(path)
+            # Keep the occupancy of the graph up to date
+            self.graph.update_occupancy(edge, 1)
+
+            if self.journal is not None:
+                self.journal.record(self.remove_path, position, step)
+
+    def remove_path(self, position, step):
+        """
+        Removes a wire unit from the wire path.
+
+        Parameters
+        ---------
+        position: a node
+                A node representing the one end of the wire unit.
+
+        step: a node
+                A node representing the other end of the wire unit.
+        """
+
+        edge = self.graph.get_edge(position, step)
+
+        if self.units[edge]:
+            self.units[edge] = 0
+            self.length -= 1
+            self.edits += 1
+
+            for listener in self.listeners:
+                listener.update_unit(edge, -1)
+
+            # Keep the occupancy of the graph up to date
+            self.graph.update_occupancy(edge, 0)
+
+            if self.journal is not None:
+                self.journal.record(self.update_path, position, step)
 
     def update_coords(self, position):
         """
@@ -67,12 +145,66 @@ class Wire():
         
         Parameters
         ----------
-        position: a Node object
-                A node object representing the current position of the wire in the grid.
+        position: a node
+                A node representing the current position of the wire in the grid.
+        """
+
+        if not self.graph.is_gate(position):
+            index = self.graph.get_index(position)
+
+            # Every visit after the first one is an intersection
+            if self.visits[index] > 0:
+                self.intersections += 1
+            self.visits[index] += 1
+
+            if self.debug:
+                self.coords.append(position)
+
+            if self.journal is not None:
+                self.journal.record(self.remove_coords, position)
+
+    def remove_coords(self, position):
+        """
+        Removes a visit of the wire from the wire coordinates, the counterpart of 
+        update_coords.
+
+        Parameters
+        ----------
+        position: a node
+                A node representing a position of the wire in the grid.
+        """
+
+        if not self.graph.is_gate(position):
+            index = self.graph.get_index(position)
+
+            self.visits[index] -= 1
+            if self.visits[index] > 0:
+                self.intersections -= 1
+
+            if self.debug:
+                self.coords.remove(position)
+
+            if self.journal is not None:
+                self.journal.record(self.update_coords, position)
+
+    def lay_path(self, path):
+        """
+        Lays the wire units of a path and counts its visits on the graph.
+
+        Parameters
+        ----------
+        path: a list
+                A list of coordinates representing a wire path, from gate to gate.
         """
 
-        if position.isgate is False:
-            self.coords.append(position)
+        nodes = [self.graph.get_node(coords) for coords in path]
+
+        for i in range(1, len(nodes)):
+            self.update_path(nodes[i - 1], nodes[i])
+            self.update_coords(nodes[i])
+
+            if not self.graph.is_gate(nodes[i]):
+                self.graph.increment_intersection(nodes[i])
 
     def check_collision(self, position, step):
         """
@@ -80,11 +212,11 @@ class Wire():
         
         Parameters
         ----------
-        position: a Node object
-                A node object representing the current position of the wire in the grid.
+        position: a node
+                A node representing the current position of the wire in the grid.
 
-        step: a Node object
-                A node object representing the next position of the wire in the grid.
+        step: a node
+                A node representing the next position of the wire in the grid.
 
         Returns
         -------
@@ -93,14 +225,7 @@ class Wire():
     
         """
 
-        # Get position and step coordinates
-        position_coords = position.xcoord, position.ycoord, position.zcoord
-        step_coords = step.xcoord, step.ycoord, step.zcoord
-
-        # Sort and convert to tuple to ensure consistent order
-        step = tuple(sorted((position_coords, step_coords)))
-
-        return step not in self.path
+        return not self.units[self.graph.get_edge(position, step)]
 
     def compute_length(self):
         """
@@ -112,7 +237,7 @@ class Wire():
                 The length of the wire.
         """
 
-        return len(self.path)
+        return self.length
 
     def compute_intersections(self):
         """
@@ -128,6 +253,23 @@ class Wire():
         int 
                 Number of intersections of the wire.
         """
+
+        return self.intersections
+
+    def recount(self):
+        """
+        Returns the length and the number of intersections of the wire, recounted 
+        from scratch.
+
+        Only available in debug mode, since the coordinates are only stored then.
+
+        Returns
+        -------
+        tuple
+                A tuple containing the length and the number of intersections.
+        """
+
+        length = self.units.count(1)
         
         # Counts occurences of coordinates
         counter = Counter(self.coords)
@@ -138,7 +280,7 @@ class Wire():
             if counter[coordinate] > 1:
                 intersections += counter[coordinate] - 1
 
-        return intersections
+        return length, intersections
 
     def compute_costs(self):
         """
@@ -153,6 +295,84 @@ class Wire():
         length = self.compute_length()
         intersections = self.compute_intersections()
 
+        # Cross-check the running totals
+        if self.debug and (length, intersections) != self.recount():
+            raise AssertionError(f"Running totals {(length, intersections)} do not match recount {self.recount()}")
+
+        return length + 300 * intersections
+
+    def compute_delta(self, old_path, new_path):
+        """
+        Returns the change in length and in intersections of the wire if the laid
+        path of a net is replaced by a new path, without changing the wire.
+
+        Only the visits of the nodes on both paths are needed, so the change is
+        computed in the length of the paths. A local search can thus reject a new
+        path before it is laid. A unit of the new path that is laid by another net
+        is not counted, as update_path does not lay it twice.
+
+        Parameters
+        ----------
+        old_path: a list
+                The coordinates of the path of the net that is laid.
+
+        new_path: a list
+                The coordinates of the new path of the net, not laid.
+
+        Returns
+        -------
+        tuple
+                A tuple containing the change in length and in intersections.
+        """
+
+        graph = self.graph
+        old_nodes = [graph.get_node(coords) for coords in old_path]
+        new_nodes = [graph.get_node(coords) for coords in new_path]
+
+        # Units of the old path are removed, units of the new path laid if free
+        old_edges = {graph.get_edge(old_nodes[i - 1], old_nodes[i]) for i in range(1, len(old_nodes))}
+        new_edges = {graph.get_edge(new_nodes[i - 1], new_nodes[i]) for i in range(1, len(new_nodes))}
+        length = sum(1 for edge in new_edges - old_edges if not self.units[edge]) - sum(1 for edge in old_edges - new_edges if self.units[edge])
+
+        # Change of the number of visits per node, gates are never an intersection
+        changes = Counter()
+        for node in old_nodes:
+            if not graph.is_gate(node):
+                changes[graph.get_index(node)] -= 1
+        for node in new_nodes:
+            if not graph.is_gate(node):
+                changes[graph.get_index(node)] += 1
+
+        # Every visit after the first one is an intersection
+        intersections = 0
+        for index, change in changes.items():
+            if change:
+                visits = self.visits[index]
+                intersections += max(visits + change - 1, 0) - max(visits - 1, 0)
+
+        return length, intersections
+
+    def compute_costs_delta(self, old_path, new_path):
+        """
+        Returns the change in costs of the wire if the laid path of a net is
+        replaced by a new path, without changing the wire. See compute_delta.
+
+        Parameters
+        ----------
+        old_path: a list
+                The coordinates of the path of the net that is laid.
+
+        new_path: a list
+                The coordinates of the new path of the net, not laid.
+
+        Returns
+        -------
+        int
+                The costs after the replacement minus the costs before.
+        """
+
+        length, intersections = self.compute_delta(old_path, new_path)
+
         return length + 300 * intersections
 
     
\ No newline at end of file
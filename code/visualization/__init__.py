@@ -1,9 +1,33 @@
 """
 Visualization results algorithms.
 
-This module contains the code for the visualization of the results. 
+This module contains the code for the visualization of the results. The 
+visualizations are imported on first use.
 Also see:
         pydoc visualization.visualize
 """
 
-from code.visualization.visualize import ChipVisualization, WireHeatmap
\ No newline at end of file
+# True on machines that never plot: the plotting libraries (matplotlib, pandas)
+# are then never imported
+HEADLESS = False
+
+
+def __getattr__(name):
+    """
+    Imports the visualizations on first use, so that the plotting libraries are only
+    imported when a plot is requested.
+
+    Parameters
+    ----------
+    name: a string
+            The name of the requested attribute.
+    """
+
+    if name in ('ChipVisualization', 'WireHeatmap'):
+        if HEADLESS:
+            raise RuntimeError("plotting is disabled in headless mode")
+
+        from code.visualization import visualize
+        return getattr(visualize, name)
+
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
\ No newline at end of file
@@ -9,6 +9,9 @@ import pandas as pd
 from pandas import DataFrame
 import numpy as np
 
+# Own modules
+from code.classes.density import WireDensity
+
 __author__ = 'Eline van Groningen, Mimoun Boulfich, Syrka van Kuppenveld'
 __copyright__ = 'Copyright 2020, Chips & Circuits'
 __credits__ = ['Eline van Groningen, Mimoun Boulfich, Syrka van Kuppenveld']
@@ -190,12 +193,14 @@ class WireHeatmap(ChipVisualization):
                 A Dataframe with the coordinates and wiredensities of the nodes
         """
 
+        # Compute the wire density of all nodes in one pass
+        densities = WireDensity(self.wire.graph).compute(self.wire)
+
         wireDensitiesList = []
 
         for coordinates in self.nodes:
-            node = self.nodes[coordinates]
-            wireDensity = node.get_wire_density(node, self.wire.path)
-            wireDensitiesList.append([node.xcoord, node.ycoord, node.zcoord, wireDensity])
+            wireDensity = densities[coordinates]
+            wireDensitiesList.append([coordinates[0], coordinates[1], coordinates[2], wireDensity])
 
         return pd.DataFrame(wireDensitiesList, columns=['x','y','z', 'wire density'])    
         
@@ -0,0 +1,68 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+
+# Built-in/Generic Imports
+import collections
+
+# Third party imports
+import pytest
+
+__author__ = 'Eline van Groningen, Mimoun Boulfich, Syrka van Kuppenveld'
+__copyright__ = 'Copyright 2020, Chips & Circuits'
+__credits__ = ['Eline van Groningen, Mimoun Boulfich, Syrka van Kuppenveld']
+__license__ = 'GNU GPL 3.0'
+__version__ = '0.1.0'
+__maintainer__ = 'Eline van Groningen, Mimoun Boulfich, Syrka van Kuppenveld'
+__email__ = 'elinevangroningen@gmail.com, mimounboulfich@live.nl, syrkavankuppenveld@gmail.com'
+__status__ = 'Dev'
+
+"""
+Fixtures of the tests.
+
+
+This module is found by pytest in the root of the repository, which puts the root on
+the path so the tests can import the code and helpers packages. Run the tests with:
+        python -m pytest -q
+"""
+
+
+def compute_path_costs(graph, wire_path):
+    """
+    Returns the costs of a wire path, counted from the coordinates alone.
+
+    Parameters
+    ----------
+    graph: a Graph object
+            The graph of the chip and netlist.
+
+    wire_path: a dict
+            A dict with connections as key and the wire path as value.
+
+    Returns
+    -------
+    int
+            The number of wire units plus 300 times the number of intersections.
+    """
+
+    gates = {graph.get_coords(graph.get_gate_node(gate)) for gate in graph.gates.values()}
+
+    units = set()
+    visits = collections.Counter()
+    for path in wire_path.values():
+        for i in range(1, len(path)):
+            units.add(frozenset((tuple(path[i - 1]), tuple(path[i]))))
+            if tuple(path[i]) not in gates:
+                visits[tuple(path[i])] += 1
+
+    intersections = sum(count - 1 for count in visits.values())
+
+    return len(units) + 300 * intersections
+
+
+@pytest.fixture
+def path_costs():
+    """
+    Returns the function that counts the costs of a wire path.
+    """
+
+    return compute_path_costs
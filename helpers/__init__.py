@@ -4,9 +4,15 @@ Code for interactive user interface.
 
 This module contains the code for the interactive user interface of the program.
 Also see:
+        pydoc helpers.batch
+        pydoc helpers.benchmark
+        pydoc helpers.memory_report
+        pydoc helpers.ripup_report
         pydoc helpers.save_csv
+        pydoc helpers.startup_report
         pydoc helpers.user_interface
 """
 
 from helpers.save_csv import save_csv
 import helpers.user_interface as uif
+import helpers.batch as batch
\ No newline at end of file
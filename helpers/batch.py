@@ -0,0 +1,510 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+
+# Built-in/Generic Imports
+import argparse
+import contextlib
+import io
+import itertools
+import os
+import random
+import time
+
+# Own modules
+import code.classes as cs
+import code.algorithms as alg
+import code.visualization as vs
+from helpers.save_csv import save_csv
+
+__author__ = 'Eline van Groningen, Mimoun Boulfich, Syrka van Kuppenveld'
+__copyright__ = 'Copyright 2020, Chips & Circuits'
+__credits__ = ['Eline van Groningen, Mimoun Boulfich, Syrka van Kuppenveld']
+__license__ = 'GNU GPL 3.0'
+__version__ = '0.1.0'
+__maintainer__ = 'Eline van Groningen, Mimoun Boulfich, Syrka van Kuppenveld'
+__email__ = 'elinevangroningen@gmail.com, mimounboulfich@live.nl, syrkavankuppenveld@gmail.com'
+__status__ = 'Dev'
+
+"""
+Batch interface.
+
+
+This module contains the code for running the algorithms without prompts or
+plotting, from Python with route() or from the command line with:
+        python main.py --chip 0 1 --algorithm greedy lookahead --heuristic sky_is_the_limit
+        python -m helpers.batch --help
+"""
+
+ALGORITHMS = ('random', 'greedy', 'lookahead', 'hillclimber', 'restart_hillclimber', 'annealing', 'astar', 'portfolio')
+HEURISTICS = ('sky_is_the_limit', 'cant_touch_this', 'wire_jam')
+ORDERS = ('social_map', 'distance')
+
+# Algorithm classes per algorithm and (cost) heuristic
+CLASSES = {
+    ('greedy', None): alg.Greedy,
+    ('greedy', 'sky_is_the_limit'): alg.GreedyCosts,
+    ('greedy', 'cant_touch_this'): alg.GreedyNoIntersect,
+    ('greedy', 'wire_jam'): alg.GreedyWireJam,
+    ('lookahead', None): alg.GreedyLookAhead,
+    ('lookahead', 'sky_is_the_limit'): alg.GreedyLookAheadCosts,
+    ('lookahead', 'cant_touch_this'): alg.GreedyNoIntersectLookAhead,
+    ('lookahead', 'wire_jam'): alg.GreedyLookAheadWireJam,
+    ('astar', None): alg.AStar,
+}
+
+# Algorithm classes with rip-up and reroute recovery
+RIPUP_CLASSES = {
+    alg.Greedy: alg.GreedyRipUp,
+    alg.GreedyLookAhead: alg.GreedyLookAheadRipUp,
+    alg.GreedyNoIntersect: alg.GreedyNoIntersectRipUp,
+    alg.GreedyNoIntersectLookAhead: alg.GreedyNoIntersectLookAheadRipUp,
+    alg.GreedyCosts: alg.GreedyCostsRipUp,
+    alg.GreedyLookAheadCosts: alg.GreedyLookAheadCostsRipUp,
+    alg.GreedyWireJam: alg.GreedyWireJamRipUp,
+    alg.GreedyLookAheadWireJam: alg.GreedyLookAheadWireJamRipUp,
+}
+
+# Parsed graphs per chip, netlist and backend, reused by all runs of a process
+graphs = {}
+
+
+class Solution():
+    """
+    The result of one run of an algorithm.
+    """
+
+    def __init__(self, chip, netlist, algorithm, heuristic, order, descending, seed, wire_path, costs, runtime, algo):
+        """
+        Initializes a Solution object.
+
+        Parameters
+        ----------
+        chip, netlist, algorithm, heuristic, order, descending, seed:
+                The configuration of the run, see route.
+
+        wire_path: a dict
+                A dictionary containing the route of the wire per connection.
+
+        costs: an int
+                The costs of the wire.
+
+        runtime: a float
+                The runtime of the algorithm in seconds.
+
+        algo: an algorithm object
+                The algorithm that found the solution, holding its wire.
+        """
+
+        self.chip = chip
+        self.netlist = netlist
+        self.algorithm = algorithm
+        self.heuristic = heuristic
+        self.order = order
+        self.descending = descending
+        self.seed = seed
+        self.wire_path = wire_path
+        self.costs = costs
+        self.runtime = runtime
+        self.algo = algo
+        self.restarts = getattr(algo, 'restarts', None)
+
+    def get_netlist_file(self):
+        """
+        Returns the path to the netlist file of the solution.
+
+        Returns
+        -------
+        string
+                The path to the netlist file.
+        """
+
+        return f"gates&netlists/chip_{self.chip}/netlist_{self.netlist}.csv"
+
+    def save_csv(self, filename):
+        """
+        Saves the solution in the output layout of check50.
+
+        Parameters
+        ----------
+        filename: a string
+                The path to the output file.
+        """
+
+        with open(filename, 'w', newline='') as output_file:
+            save_csv(self.get_netlist_file(), output_file, self.wire_path, self.costs)
+
+    def __str__(self):
+        """
+        Returns a one line summary of the solution.
+        """
+
+        direction = "max-min" if self.descending else "min-max"
+
+        return (f"chip {self.chip}, netlist {self.netlist}, {self.algorithm}, heuristic {self.heuristic}, "
+                f"order {self.order} {direction}, seed {self.seed}: costs {self.costs}, {self.runtime:.2f} s")
+
+
+def get_netlists(chip):
+    """
+    Returns the netlists of a chip.
+
+    Parameters
+    ----------
+    chip: an int
+            The number of the chip.
+
+    Returns
+    -------
+    list
+            The numbers of the netlists of the chip.
+    """
+
+    return [3 * chip + 1, 3 * chip + 2, 3 * chip + 3]
+
+
+def get_graph(chip, netlist, lattice=False):
+    """
+    Returns a clean Graph (or Lattice) of the chip and netlist, parsed once per process.
+
+    Parameters
+    ----------
+    chip: an int
+            The number of the chip.
+
+    netlist: an int
+            The number of the netlist.
+
+    lattice: a bool
+            True to use the array-backed Lattice instead of the Graph.
+
+    Returns
+    -------
+    Graph object
+            The graph of the chip and netlist without any wire.
+    """
+
+    key = (chip, netlist, lattice)
+
+    if key not in graphs:
+        if netlist not in get_netlists(chip):
+            raise ValueError(f"netlist {netlist} does not belong to chip {chip}")
+
+        print_file = f"gates&netlists/chip_{chip}/print_{chip}.csv"
+        netlist_file = f"gates&netlists/chip_{chip}/netlist_{netlist}.csv"
+        graphs[key] = (cs.Lattice if lattice else cs.Graph)(print_file, netlist_file)
+
+    # The previous run may have left wire on the graph
+    graph = graphs[key]
+    graph.journal = None
+    graph.clear_graph()
+
+    return graph
+
+
+def get_order(chip, graph, order, descending):
+    """
+    Returns the order of the connections or gates and the run approach, as the user
+    interface does.
+
+    Parameters
+    ----------
+    chip: an int
+            The number of the chip.
+
+    graph: a Graph object
+            The graph of the chip and netlist.
+
+    order: a string
+            None (the netlist order), 'social_map' or 'distance'.
+
+    descending: a bool
+            True if sorted from max to min, False if sorted from min to max.
+
+    Returns
+    -------
+    list
+            A list of connections or gateIDs.
+
+    bool
+            True if the list contains connections, False if it contains gates.
+    """
+
+    if order == 'social_map':
+        density_radius = 3 if chip == 0 else 5
+        return graph.get_gate_densities(descending, density_radius), False
+    elif order == 'distance':
+        return graph.get_connection_distance(descending), True
+    elif order is None:
+        return list(graph.netlist), True
+
+    raise ValueError(f"unknown order: {order}")
+
+
+def route(chip, netlist, algorithm='greedy', heuristic=None, order=None, seed=None, descending=False, ripup=False,
+          depth=4, frequency=5, processes=None, time_budget=60, lattice=False, verbose=False, controller=None,
+          start_state=None, max_steps=None, goal_bias=0.5, net_retries=3):
+    """
+    Runs an algorithm on a chip and netlist without prompts or plotting and returns
+    the solution.
+
+    Parameters
+    ----------
+    chip: an int
+            The number of the chip.
+
+    netlist: an int
+            The number of the netlist.
+
+    algorithm: a string
+            One of ALGORITHMS.
+
+    heuristic: a string
+            None or one of HEURISTICS, for the greedy and lookahead algorithms.
+
+    order: a string
+            None (the netlist order) or one of ORDERS.
+
+    seed: an int
+            The seed of the random generator, None does not seed it.
+
+    descending: a bool
+            True to sort the order from max to min, False from min to max.
+
+    ripup: a bool
+            True to recover from dead ends with rip-up and reroute.
+
+    depth: an int
+            The look ahead depth of the lookahead algorithms.
+
+    frequency: an int
+            The number of climbers of the restart hillclimber.
+
+    processes: an int
+            The number of worker processes of the restart hillclimber, None uses all
+            cores.
+
+    time_budget: a float
+            The time budget in seconds of the portfolio and the simulated annealing.
+
+    lattice: a bool
+            True to use the array-backed Lattice instead of the Graph.
+
+    verbose: a bool
+            True to show the progress messages of the algorithm.
+
+    controller: a RunController object
+            Limits the run of the random, greedy, lookahead and astar algorithms,
+            which then return the cheapest of their attempts, and every climb of
+            the hillclimbers. Not used by the portfolio and the simulated annealing,
+            which take the time budget.
+
+    start_state: a StartState object
+            Provides the start states of the hillclimbers and the simulated
+            annealing, None builds them with the random algorithm. The seed of the
+            run seeds the start states, so the provider can cache them.
+
+    max_steps: an int
+            The maximum number of steps per net of the bounded walk of the random
+            algorithm, None walks without a bound.
+
+    goal_bias: a float
+            The probability that a step of the bounded walk moves towards the goal.
+
+    net_retries: an int
+            The number of times a net of the bounded walk is walked again before
+            the random algorithm escalates.
+
+    Returns
+    -------
+    Solution object
+            The solution found by the algorithm.
+    """
+
+    if algorithm not in ALGORITHMS:
+        raise ValueError(f"unknown algorithm: {algorithm}")
+
+    if seed is not None:
+        random.seed(seed)
+
+    graph = get_graph(chip, netlist, lattice)
+
+    if algorithm == 'random':
+        algorithm_class = alg.RandomRipUp if ripup else alg.Random
+        algo = algorithm_class(graph, max_steps=max_steps, goal_bias=goal_bias, net_retries=net_retries)
+    elif algorithm in ('hillclimber', 'restart_hillclimber'):
+        climbers = frequency if algorithm == 'restart_hillclimber' else 1
+        algo = alg.HillClimber(graph, climbers, (False, False), (False, False), chip, netlist, processes=processes, controller=controller,
+                               start_state=start_state, seed=seed)
+    elif algorithm == 'annealing':
+        algo = alg.SimulatedAnnealing(graph, time_budget=time_budget, chip=chip, netlist=netlist, start_state=start_state, seed=seed)
+    elif algorithm == 'portfolio':
+        algo = alg.Portfolio(graph.print_file, graph.netlist_file, time_budget=time_budget, processes=processes)
+    else:
+        if (algorithm, heuristic) not in CLASSES:
+            raise ValueError(f"algorithm {algorithm} does not take heuristic {heuristic}")
+
+        algorithm_class = CLASSES[(algorithm, heuristic)]
+        if ripup:
+            if algorithm_class not in RIPUP_CLASSES:
+                raise ValueError(f"{algorithm_class.__name__} has no rip-up and reroute recovery")
+            algorithm_class = RIPUP_CLASSES[algorithm_class]
+
+        connections, approach = get_order(chip, graph, order, descending)
+
+        if algorithm == 'lookahead':
+            algo = algorithm_class(graph, connections, approach, depth=depth)
+        else:
+            algo = algorithm_class(graph, connections, approach)
+
+    # Limit the run, the hillclimbers got the controller above
+    if controller is not None and algorithm in ('random', 'greedy', 'lookahead', 'astar'):
+        algo.controller = controller
+
+    # Run the algorithm, silenced unless verbose
+    start = time.perf_counter()
+    output = contextlib.nullcontext() if verbose else contextlib.redirect_stdout(io.StringIO())
+    with output:
+        wire_path = algo.run()
+    runtime = time.perf_counter() - start
+
+    return Solution(chip, netlist, algorithm, heuristic, order, descending, seed, wire_path, algo.wire.compute_costs(), runtime, algo)
+
+
+def get_parser():
+    """
+    Returns the argument parser of the batch interface.
+
+    Returns
+    -------
+    ArgumentParser object
+            The parser of the command line arguments.
+    """
+
+    parser = argparse.ArgumentParser(description="Runs every combination of the given chips, netlists, algorithms, heuristics, orders and seeds.")
+    parser.add_argument('--chip', type=int, nargs='+', choices=(0, 1, 2), default=[0], help="the chips to run")
+    parser.add_argument('--netlist', type=int, nargs='+', help="the netlists to run, default all netlists of the chips")
+    parser.add_argument('--algorithm', nargs='+', choices=ALGORITHMS, default=['greedy'], help="the algorithms to run")
+    parser.add_argument('--heuristic', nargs='+', choices=('none',) + HEURISTICS, default=['none'], help="the cost heuristics to run")
+    parser.add_argument('--order', nargs='+', choices=('none',) + ORDERS, default=['none'], help="the order heuristics to run")
+    parser.add_argument('--descending', action='store_true', help="sort the orders from max to min")
+    parser.add_argument('--seed', type=int, nargs='+', default=[None], help="the seeds to run")
+    parser.add_argument('--ripup', action='store_true', help="recover from dead ends with rip-up and reroute")
+    parser.add_argument('--depth', type=int, default=4, help="the look ahead depth")
+    parser.add_argument('--frequency', type=int, default=5, help="the number of climbers of the restart hillclimber")
+    parser.add_argument('--processes', type=int, help="the number of worker processes, default all cores")
+    parser.add_argument('--time-budget', type=float, default=60, help="the time budget of the portfolio and the simulated annealing in seconds")
+    parser.add_argument('--budget', type=float, help="run the random, greedy, lookahead and astar algorithms for this many seconds and keep the cheapest solution, or stop a climb after it")
+    parser.add_argument('--iterations', type=int, help="the maximum number of attempts of those algorithms or adjustments of a climb")
+    parser.add_argument('--patience', type=int, help="the maximum number of attempts or adjustments in a row without a cheaper solution")
+    parser.add_argument('--max-steps', type=int, help="walk every net of the random algorithm and random start states for at most this many steps")
+    parser.add_argument('--goal-bias', type=float, default=0.5, help="the probability that a step of that bounded walk moves towards the goal")
+    parser.add_argument('--net-retries', type=int, default=3, help="the number of times a net of the bounded walk is walked again before restarting")
+    parser.add_argument('--start-state', choices=('random', 'greedy', 'lookahead', 'astar'), default='random', help="the algorithm that builds the start states of the hillclimbers and the simulated annealing")
+    parser.add_argument('--start-file', help="start the hillclimbers and the simulated annealing from this solution file instead")
+    parser.add_argument('--start-cache', help="directory to cache the seeded start states in")
+    parser.add_argument('--lattice', action='store_true', help="use the array-backed Lattice")
+    parser.add_argument('--output', help="directory to save the output csv of every run in")
+    parser.add_argument('--verbose', action='store_true', help="show the progress messages of the algorithms")
+    parser.add_argument('--instrument', action='store_true', help="count the calls and time the phases of the runs, saved in instrumentation.json")
+
+    return parser
+
+
+def main(argv=None):
+    """
+    Runs the matrix of configurations given on the command line in this process and
+    prints a summary per run.
+
+    Parameters
+    ----------
+    argv: a list
+            The command line arguments, None uses sys.argv.
+
+    Returns
+    -------
+    list
+            The Solution objects of the runs.
+    """
+
+    args = get_parser().parse_args(argv)
+
+    # The batch runs never plot, so the plotting libraries are never imported
+    vs.HEADLESS = True
+
+    if args.output is not None:
+        os.makedirs(args.output, exist_ok=True)
+
+    # Count and time all runs, the report is saved next to the output
+    instrumentation = None
+    if args.instrument:
+        instrumentation = cs.Instrumentation()
+        instrumentation.enable()
+
+    # The provider of the start states, shared by all runs so they share its cache
+    if args.start_file is not None:
+        start_state = alg.FileStartState(args.start_file)
+    elif args.start_state == 'random':
+        kwargs = {}
+        if args.max_steps is not None:
+            kwargs = {'max_steps': args.max_steps, 'goal_bias': args.goal_bias, 'net_retries': args.net_retries}
+        start_state = alg.RandomStartState(args.start_cache, **kwargs)
+    else:
+        kwargs = {'depth': args.depth} if args.start_state == 'lookahead' else {}
+        start_state = alg.GreedyStartState(CLASSES[(args.start_state, None)], cache=args.start_cache, **kwargs)
+
+    solutions = []
+
+    try:
+        for chip in args.chip:
+
+            # Only the netlists that belong to the chip
+            netlists = get_netlists(chip)
+            if args.netlist is not None:
+                netlists = [netlist for netlist in args.netlist if netlist in netlists]
+
+            for netlist, algorithm, heuristic, order, seed in itertools.product(netlists, args.algorithm, args.heuristic, args.order, args.seed):
+                heuristic = None if heuristic == 'none' else heuristic
+                order = None if order == 'none' else order
+
+                # Only the greedy and lookahead algorithms take a heuristic, and only those and A* an order
+                if heuristic is not None and algorithm not in ('greedy', 'lookahead'):
+                    continue
+                if order is not None and algorithm not in ('greedy', 'lookahead', 'astar'):
+                    continue
+
+                # Every run gets its own limits
+                controller = None
+                if args.budget is not None or args.iterations is not None or args.patience is not None:
+                    controller = alg.RunController(args.budget, args.iterations, args.patience)
+
+                first_run = len(instrumentation.runs) if instrumentation is not None else 0
+                solution = route(chip, netlist, algorithm, heuristic, order, seed, args.descending, args.ripup, args.depth,
+                                 args.frequency, args.processes, args.time_budget, args.lattice, args.verbose, controller,
+                                 start_state, args.max_steps, args.goal_bias, args.net_retries)
+                print(solution)
+
+                # Label the runs of the algorithm with the configuration
+                if instrumentation is not None:
+                    for record in instrumentation.runs[first_run:]:
+                        record.update(chip=chip, netlist=netlist, heuristic=heuristic, order=order, seed=seed)
+
+                if args.output is not None:
+                    filename = f"output_chip_{chip}_net_{netlist}_{algorithm}_{heuristic}_{order}_{seed}.csv"
+                    with contextlib.redirect_stdout(io.StringIO()):
+                        solution.save_csv(os.path.join(args.output, filename))
+
+                solutions.append(solution)
+
+    # The report is also saved when a run fails or is interrupted
+    finally:
+        if instrumentation is not None:
+            instrumentation.disable()
+            filename = os.path.join(args.output or "results", "instrumentation.json")
+            instrumentation.save(filename, backend='Lattice' if args.lattice else 'Graph')
+            print(f"For the instrumentation report see: '{filename}'.")
+
+    return solutions
+
+
+if __name__ == "__main__":
+    main()
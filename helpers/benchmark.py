@@ -0,0 +1,481 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+
+# Built-in/Generic Imports
+import argparse
+import contextlib
+import gc
+import io
+import json
+import os
+import platform
+import random
+import sys
+import time
+
+# Own modules
+from code.classes import Graph, Lattice, Journal
+from code.algorithms import AStar, Greedy, GreedyLookAhead, HillClimber
+
+__author__ = 'Eline van Groningen, Mimoun Boulfich, Syrka van Kuppenveld'
+__copyright__ = 'Copyright 2020, Chips & Circuits'
+__credits__ = ['Eline van Groningen, Mimoun Boulfich, Syrka van Kuppenveld']
+__license__ = 'GNU GPL 3.0'
+__version__ = '0.1.0'
+__maintainer__ = 'Eline van Groningen, Mimoun Boulfich, Syrka van Kuppenveld'
+__email__ = 'elinevangroningen@gmail.com, mimounboulfich@live.nl, syrkavankuppenveld@gmail.com'
+__status__ = 'Dev'
+
+"""
+Micro-benchmarks of the routing primitives.
+
+
+This module contains the code for timing the hot paths of the classes and algorithms
+on every chip and netlist, saving the timings as JSON and comparing them with a
+stored baseline. Run with:
+        python -m helpers.benchmark [--save-baseline] [--threshold 0.5]
+"""
+
+CHIPS = {0: (1, 2, 3), 1: (4, 5, 6), 2: (7, 8, 9)}
+
+# Number of different arguments per benchmark and number of rounds, the fastest round counts
+CALLS = 200
+ROUNDS = 7
+
+# Minimum duration of a round in seconds, a round repeats the calls until it lasts this long
+MIN_ROUND_TIME = 0.05
+
+# Difference in seconds per call below which a slower benchmark is timer noise, not a regression
+NOISE_FLOOR = 2e-7
+
+
+class State():
+    """
+    A routed chip to run the benchmarks on: the wire of an A* solution of the
+    netlist, which is always found.
+    """
+
+    def __init__(self, print_file, netlist_file, graph_class):
+        """
+        Initializes a State object.
+
+        Parameters
+        ----------
+        print_file: a string
+                The path to the print file.
+
+        netlist_file: a string
+                The path to the netlist file.
+
+        graph_class: a class
+                Graph or Lattice.
+        """
+
+        self.print_file = print_file
+        self.netlist_file = netlist_file
+        self.graph_class = graph_class
+        self.graph = graph_class(print_file, netlist_file)
+
+        # Route the netlist
+        random.seed(0)
+        algo = AStar(self.graph, sorted(self.graph.netlist), True)
+        with contextlib.redirect_stdout(io.StringIO()):
+            self.route = algo.run()
+        self.wire = algo.wire
+
+        # Random steps and positions, the same for every benchmark
+        nodes = list(self.graph.nodes.values())
+        self.steps = []
+        for _ in range(CALLS):
+            position = random.choice(nodes)
+            self.steps.append((position, random.choice(list(self.graph.get_neighbors(position)))))
+        self.positions = [step[0] for step in self.steps]
+
+        # Start and goal of every connection
+        self.connections = [(self.graph.get_gate_node(self.graph.gates[a]), self.graph.get_gate_node(self.graph.gates[b])) for a, b in self.route]
+
+
+def get_repeats(run_calls):
+    """
+    Returns the number of times the calls have to be repeated for a round to last at
+    least MIN_ROUND_TIME, as timeit.Timer.autorange does.
+
+    Parameters
+    ----------
+    run_calls: a function
+            Runs the calls of a round once.
+
+    Returns
+    -------
+    int
+            The number of repeats of a round.
+    """
+
+    # Try 1, 2, 5, 10, 20, 50, ... repeats
+    repeats = 1
+    while True:
+        for factor in (1, 2, 5):
+            start = time.perf_counter()
+            for _ in range(repeats * factor):
+                run_calls()
+            if time.perf_counter() - start >= MIN_ROUND_TIME:
+                return repeats * factor
+
+        repeats *= 10
+
+
+def time_calls(function, arguments, seeded=False):
+    """
+    Returns the time per call of the function, the fastest of ROUNDS rounds of at
+    least MIN_ROUND_TIME each.
+
+    Parameters
+    ----------
+    function: a function
+            The function to time.
+
+    arguments: a list
+            The argument tuples of the calls of a round.
+
+    seeded: a bool
+            True to seed the random generator before the calls, so a function that
+            breaks ties randomly does the same work in every round and every run.
+
+    Returns
+    -------
+    float
+            The time per call in seconds.
+    """
+
+    def run_calls():
+        if seeded:
+            random.seed(0)
+        for args in arguments:
+            function(*args)
+
+    repeats = get_repeats(run_calls)
+
+    # The garbage collector is off during the rounds, as in timeit
+    best = None
+    gc.disable()
+    try:
+        for _ in range(ROUNDS):
+            start = time.perf_counter()
+            for _ in range(repeats):
+                run_calls()
+            elapsed = time.perf_counter() - start
+
+            if best is None or elapsed < best:
+                best = elapsed
+    finally:
+        gc.enable()
+
+    return best / (repeats * len(arguments))
+
+
+def ignore_dead_ends(next_position):
+    """
+    Returns the next_position function of an algorithm that ignores the ValueError
+    of a gate that is walled in by the routed wire.
+
+    Parameters
+    ----------
+    next_position: a function
+            The next_position method of an algorithm.
+
+    Returns
+    -------
+    function
+            The function that is timed.
+    """
+
+    def timed_next_position(position, goal):
+        try:
+            next_position(position, goal)
+        except ValueError:
+            pass
+
+    return timed_next_position
+
+
+def bench_graph_init(state):
+    """
+    Times building the graph of the chip and netlist. The Lattice shares the
+    topology of a chip between its objects, so its cache is cleared before every
+    build: the timing is a full build, not a hit on the cache.
+    """
+
+    def build_graph():
+        if state.graph_class is Lattice:
+            Lattice.topologies.clear()
+        state.graph_class(state.print_file, state.netlist_file)
+
+    return time_calls(build_graph, [()])
+
+
+def bench_clear_graph(state):
+    """
+    Times clearing the graph after the netlist was routed.
+    """
+
+    graph = state.graph
+    touched = set(graph.touched)
+
+    def clear_graph():
+        graph.touched = set(touched)
+        graph.clear_graph()
+
+    result = time_calls(clear_graph, [()] * 20)
+
+    # Restore the intersections of the route
+    for path in state.route.values():
+        for coords in path[1:]:
+            node = graph.get_node(coords)
+            if not graph.is_gate(node):
+                graph.increment_intersection(node)
+
+    return result
+
+
+def bench_check_collision(state):
+    """
+    Times checking a step for collisions with the routed wire.
+    """
+
+    return time_calls(state.wire.check_collision, state.steps)
+
+
+def bench_compute_costs(state):
+    """
+    Times computing the costs of the routed wire.
+    """
+
+    return time_calls(state.wire.compute_costs, [()] * CALLS)
+
+
+def bench_greedy_next_position(state):
+    """
+    Times choosing the next step of the Greedy algorithm from the start of every
+    connection.
+    """
+
+    algo = Greedy(state.graph, [], True)
+    algo.wire = state.wire
+
+    return time_calls(ignore_dead_ends(algo.next_position), state.connections, seeded=True)
+
+
+def bench_lookahead_next_position(state):
+    """
+    Times choosing the next step of the Greedy LookAhead algorithm from the start of
+    every connection.
+    """
+
+    algo = GreedyLookAhead(state.graph, [], True)
+    algo.wire = state.wire
+
+    return time_calls(ignore_dead_ends(algo.next_position), state.connections[:20], seeded=True)
+
+
+def bench_wire_density(state):
+    """
+    Times the density lookup of the Wire Jam algorithms.
+    """
+
+    result = time_calls(state.graph.get_wire_density, [(position, state.wire, 2) for position in state.positions])
+
+    # Stop following the wire, so the congestion grid does not slow down the other benchmarks
+    for grid in state.graph.congestion.values():
+        grid.detach()
+    state.graph.congestion.clear()
+
+    return result
+
+
+def bench_remove_connection(state):
+    """
+    Times removing a connection in the HillClimber, the removal is undone after
+    every call.
+    """
+
+    climber = HillClimber(state.graph, 1, (False, False), (False, False), None, None, processes=1)
+    climber.wire = state.wire
+    climber.wire_path = state.route
+
+    journal = Journal()
+    state.wire.journal = journal
+    state.graph.journal = journal
+
+    # Only the removals are timed, a round repeats them until they last MIN_ROUND_TIME
+    best = None
+    for _ in range(ROUNDS):
+        elapsed = 0
+        calls = 0
+        while elapsed < MIN_ROUND_TIME:
+            for connection in state.route:
+                start = time.perf_counter()
+                climber.remove_connection(connection, None)
+                elapsed += time.perf_counter() - start
+                journal.rollback()
+            calls += len(state.route)
+
+        if best is None or elapsed / calls < best:
+            best = elapsed / calls
+
+    state.wire.journal = None
+    state.graph.journal = None
+
+    return best
+
+
+BENCHMARKS = {
+    'Graph.__init__': bench_graph_init,
+    'Graph.clear_graph': bench_clear_graph,
+    'Wire.check_collision': bench_check_collision,
+    'Wire.compute_costs': bench_compute_costs,
+    'Greedy.next_position': bench_greedy_next_position,
+    'GreedyLookAhead.next_position': bench_lookahead_next_position,
+    'WireJam density': bench_wire_density,
+    'HillClimber.remove_connection': bench_remove_connection,
+}
+
+
+def run_benchmarks(chips, graph_class):
+    """
+    Returns the time per call of every benchmark on every netlist of the chips.
+
+    Parameters
+    ----------
+    chips: a list
+            The numbers of the chips.
+
+    graph_class: a class
+            Graph or Lattice.
+
+    Returns
+    -------
+    dict
+            The times in seconds per benchmark, per 'chip_<chip>/netlist_<netlist>'.
+    """
+
+    results = {}
+
+    for chip in chips:
+        for netlist in CHIPS[chip]:
+            key = f"chip_{chip}/netlist_{netlist}"
+            state = State(f"gates&netlists/chip_{chip}/print_{chip}.csv", f"gates&netlists/{key}.csv", graph_class)
+
+            results[key] = {}
+            for name, benchmark in BENCHMARKS.items():
+                results[key][name] = benchmark(state)
+                print(f"{key} {name}: {results[key][name] * 1e6:.1f} us")
+
+    return results
+
+
+def compare(results, baseline, threshold, noise_floor=NOISE_FLOOR):
+    """
+    Prints the timings relative to the baseline and returns the regressions.
+
+    Parameters
+    ----------
+    results: a dict
+            The timings of this run, see run_benchmarks.
+
+    baseline: a dict
+            The timings of the baseline.
+
+    threshold: a float
+            The fraction a timing may be slower than the baseline, e.g. 0.5.
+
+    noise_floor: a float
+            The seconds per call a timing may be slower than the baseline in any
+            case, since a smaller difference is timer noise.
+
+    Returns
+    -------
+    list
+            The (netlist, benchmark, ratio) of every regression.
+    """
+
+    regressions = []
+
+    for key, timings in results.items():
+        for name, seconds in timings.items():
+            if name not in baseline.get(key, {}):
+                continue
+
+            ratio = seconds / baseline[key][name]
+            status = ""
+            if ratio > 1 + threshold and seconds - baseline[key][name] > noise_floor:
+                status = "REGRESSION"
+                regressions.append((key, name, ratio))
+            elif ratio < 1 / (1 + threshold):
+                status = "faster"
+
+            print(f"{key} {name}: {ratio:.2f}x baseline {status}")
+
+    return regressions
+
+
+def main(argv=None):
+    """
+    Runs the benchmarks, saves them as JSON and compares them with the baseline.
+
+    Parameters
+    ----------
+    argv: a list
+            The command line arguments, None uses sys.argv.
+
+    Returns
+    -------
+    int
+            1 if a benchmark regressed, otherwise 0.
+    """
+
+    parser = argparse.ArgumentParser(description="Times the routing primitives on every chip and netlist.")
+    parser.add_argument('--chip', type=int, nargs='+', choices=sorted(CHIPS), default=sorted(CHIPS), help="the chips to run")
+    parser.add_argument('--lattice', action='store_true', help="use the array-backed Lattice")
+    parser.add_argument('--output', default="results/benchmark.json", help="the JSON file of this run")
+    parser.add_argument('--baseline', default="results/benchmark_baseline.json", help="the JSON file of the baseline")
+    parser.add_argument('--save-baseline', action='store_true', help="store this run as the baseline")
+    parser.add_argument('--threshold', type=float, default=0.5, help="the fraction a benchmark may be slower than the baseline")
+    parser.add_argument('--noise-floor', type=float, default=NOISE_FLOOR, help="the seconds per call a benchmark may be slower than the baseline in any case")
+    args = parser.parse_args(argv)
+
+    graph_class = Lattice if args.lattice else Graph
+    report = {
+        'python': platform.python_version(),
+        'machine': platform.machine(),
+        'backend': graph_class.__name__,
+        'results': run_benchmarks(args.chip, graph_class),
+    }
+
+    with open(args.output, 'w') as output_file:
+        json.dump(report, output_file, indent=4)
+    print(f"For the timings see: '{args.output}'.")
+
+    if args.save_baseline:
+        with open(args.baseline, 'w') as baseline_file:
+            json.dump(report, baseline_file, indent=4)
+        print(f"Saved as baseline: '{args.baseline}'.")
+        return 0
+
+    if not os.path.exists(args.baseline):
+        print(f"No baseline found, store one with --save-baseline.")
+        return 0
+
+    with open(args.baseline) as baseline_file:
+        baseline = json.load(baseline_file)
+
+    if baseline.get('backend') != report['backend']:
+        print(f"The baseline was measured on the {baseline.get('backend')}, not on the {report['backend']}.")
+
+    regressions = compare(report['results'], baseline['results'], args.threshold, args.noise_floor)
+    print(f"{len(regressions)} regressions with a threshold of {args.threshold:.0%}")
+
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,180 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+
+# Built-in/Generic Imports
+import sys
+
+# Own modules
+from code.classes import Graph, Lattice
+
+__author__ = 'Eline van Groningen, Mimoun Boulfich, Syrka van Kuppenveld'
+__copyright__ = 'Copyright 2020, Chips & Circuits'
+__credits__ = ['Eline van Groningen, Mimoun Boulfich, Syrka van Kuppenveld']
+__license__ = 'GNU GPL 3.0'
+__version__ = '0.1.0'
+__maintainer__ = 'Eline van Groningen, Mimoun Boulfich, Syrka van Kuppenveld'
+__email__ = 'elinevangroningen@gmail.com, mimounboulfich@live.nl, syrkavankuppenveld@gmail.com'
+__status__ = 'Dev'
+
+"""
+Memory report of the chip grid.
+
+
+This module contains the code for reporting how many bytes per lattice point the
+grid representations cost. Run with:
+        python -m helpers.memory_report [chip] [netlist]
+"""
+
+
+class LegacyNode():
+    """
+    Mirrors the layout of the Node before it was slotted: a per-instance __dict__
+    and a set of neighbors.
+    """
+
+    def __init__(self, node):
+        """
+        Initializes a LegacyNode object with the attributes of the given Node.
+
+        Parameters
+        ----------
+        node: a Node object
+                The Node object whose layout is mirrored.
+        """
+
+        self.xcoord = node.xcoord
+        self.ycoord = node.ycoord
+        self.zcoord = node.zcoord
+        self.neighbors = set()
+        self.isgate = node.isgate
+        self.intersection = node.intersection
+
+
+def node_bytes(node):
+    """
+    Returns the number of bytes of a node, including its __dict__ (if any) and its
+    neighbor container.
+
+    Parameters
+    ----------
+    node: a Node or LegacyNode object
+            The node to measure.
+
+    Returns
+    -------
+    int
+            The number of bytes of the node.
+    """
+
+    size = sys.getsizeof(node) + sys.getsizeof(node.neighbors)
+    if hasattr(node, '__dict__'):
+        size += sys.getsizeof(node.__dict__)
+
+    return size
+
+
+def nodes_bytes(nodes):
+    """
+    Returns the number of bytes of a dictionary of nodes, including the coordinate
+    keys.
+
+    Parameters
+    ----------
+    nodes: a dict
+            A dictionary with coordinates as keys and nodes as values.
+
+    Returns
+    -------
+    int
+            The number of bytes of the nodes.
+    """
+
+    size = sys.getsizeof(nodes)
+    for coords, node in nodes.items():
+        size += sys.getsizeof(coords) + node_bytes(node)
+
+    return size
+
+
+def legacy_nodes(graph):
+    """
+    Returns the nodes of the graph in the layout from before the Node was slotted.
+
+    Parameters
+    ----------
+    graph: a Graph object
+            A Graph object representing the chip grid.
+
+    Returns
+    -------
+    dict
+            A dictionary with coordinates as keys and LegacyNode objects as values.
+    """
+
+    legacy = {coords: LegacyNode(node) for coords, node in graph.nodes.items()}
+    for coords, node in graph.nodes.items():
+        for neighbor in node.neighbors:
+            legacy[coords].neighbors.add(legacy[graph.get_coords(neighbor)])
+
+    return legacy
+
+
+def lattice_bytes(lattice):
+    """
+    Returns the number of bytes of the arrays and lookup tables of a Lattice.
+
+    Parameters
+    ----------
+    lattice: a Lattice object
+            A Lattice object representing the chip grid.
+
+    Returns
+    -------
+    int
+            The number of bytes of the Lattice.
+    """
+
+    size = lattice.gate_mask.nbytes + lattice.intersection.nbytes + lattice.occupancy.nbytes
+    size += lattice.neighbor_table.nbytes
+
+    # Python lookup tables for the node API
+    size += sys.getsizeof(lattice.neighbor_lists) + sum(sys.getsizeof(row) for row in lattice.neighbor_lists)
+    size += sys.getsizeof(lattice.coordinates) + sum(sys.getsizeof(coords) for coords in lattice.coordinates)
+    size += sys.getsizeof(lattice.nodes)
+
+    return size
+
+
+def memory_report(chip, netlist):
+    """
+    Prints the number of bytes per lattice point of the grid representations.
+
+    Parameters
+    ----------
+    chip: an int
+            The number of the chip.
+
+    netlist: an int
+            The number of the netlist.
+    """
+
+    print_file = f"gates&netlists/chip_{chip}/print_{chip}.csv"
+    netlist_file = f"gates&netlists/chip_{chip}/netlist_{netlist}.csv"
+
+    graph = Graph(print_file, netlist_file)
+    lattice = Lattice(print_file, netlist_file)
+
+    before = nodes_bytes(legacy_nodes(graph)) / graph.size
+    after = nodes_bytes(graph.nodes) / graph.size
+    arrays = lattice_bytes(lattice) / lattice.size
+
+    print(f"Memory per lattice point, chip {chip}, {graph.size} points")
+    print(f"Graph, __dict__ nodes with neighbor sets (before): {before:.0f} bytes")
+    print(f"Graph, slotted nodes with neighbor tuples (after): {after:.0f} bytes")
+    print(f"Lattice, arrays and lookup tables: {arrays:.0f} bytes")
+
+
+if __name__ == "__main__":
+    chip = int(sys.argv[1]) if len(sys.argv) > 1 else 2
+    netlist = int(sys.argv[2]) if len(sys.argv) > 2 else 3 * chip + 1
+    memory_report(chip, netlist)
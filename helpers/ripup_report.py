@@ -0,0 +1,113 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+
+# Built-in/Generic Imports
+import contextlib
+import io
+import random
+import sys
+import time
+
+# Own modules
+from code.classes import Graph
+from code.algorithms import Random, Greedy, GreedyLookAhead, GreedyCosts, RandomRipUp, GreedyRipUp, GreedyLookAheadRipUp, GreedyCostsRipUp
+
+__author__ = 'Eline van Groningen, Mimoun Boulfich, Syrka van Kuppenveld'
+__copyright__ = 'Copyright 2020, Chips & Circuits'
+__credits__ = ['Eline van Groningen, Mimoun Boulfich, Syrka van Kuppenveld']
+__license__ = 'GNU GPL 3.0'
+__version__ = '0.1.0'
+__maintainer__ = 'Eline van Groningen, Mimoun Boulfich, Syrka van Kuppenveld'
+__email__ = 'elinevangroningen@gmail.com, mimounboulfich@live.nl, syrkavankuppenveld@gmail.com'
+__status__ = 'Dev'
+
+"""
+Rip-up report of the algorithms.
+
+
+This module contains the code for reporting how many rip-ups the rip-up and reroute
+recovery needs, compared with how many restarts the algorithms need without it.
+Run with:
+        python -m helpers.ripup_report [chip] [netlist] [runs]
+"""
+
+# Pairs of algorithms without and with the recovery
+ALGORITHMS = [(Random, RandomRipUp), (Greedy, GreedyRipUp), (GreedyLookAhead, GreedyLookAheadRipUp),
+              (GreedyCosts, GreedyCostsRipUp)]
+
+
+def run_algorithm(algorithm, print_file, netlist_file, seed):
+    """
+    Returns the restarts, rip-ups, costs and runtime of one run of an algorithm.
+
+    Parameters
+    ----------
+    algorithm: a class
+            The algorithm to run.
+
+    print_file: a string
+            The path to the print file.
+
+    netlist_file: a string
+            The path to the netlist file.
+
+    seed: an int
+            The seed of the random generator.
+
+    Returns
+    -------
+    tuple
+            The number of restarts, the number of rip-ups, the costs and the runtime
+            in seconds.
+    """
+
+    random.seed(seed)
+    graph = Graph(print_file, netlist_file)
+
+    # The Random algorithm builds the netlist in a random order
+    if issubclass(algorithm, Random):
+        algo = algorithm(graph)
+    else:
+        algo = algorithm(graph, graph.get_connection_distance(False), True)
+
+    # Silence the restart messages
+    start = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):
+        algo.run()
+    runtime = time.perf_counter() - start
+
+    return algo.restarts, getattr(algo, 'ripups', 0), algo.wire.compute_costs(), runtime
+
+
+def ripup_report(chip, netlist, runs):
+    """
+    Prints the mean restarts, rip-ups, costs and runtime per algorithm.
+
+    Parameters
+    ----------
+    chip: an int
+            The number of the chip.
+
+    netlist: an int
+            The number of the netlist.
+
+    runs: an int
+            The number of runs per algorithm.
+    """
+
+    print_file = f"gates&netlists/chip_{chip}/print_{chip}.csv"
+    netlist_file = f"gates&netlists/chip_{chip}/netlist_{netlist}.csv"
+
+    print(f"Mean over {runs} runs, chip {chip}, netlist {netlist}")
+    for algorithms in ALGORITHMS:
+        for algorithm in algorithms:
+            results = [run_algorithm(algorithm, print_file, netlist_file, seed) for seed in range(runs)]
+            restarts, ripups, costs, runtime = [sum(column) / runs for column in zip(*results)]
+            print(f"{algorithm.__name__}: {restarts:.1f} restarts, {ripups:.1f} rip-ups, costs {costs:.0f}, {runtime:.2f} s")
+
+
+if __name__ == "__main__":
+    chip = int(sys.argv[1]) if len(sys.argv) > 1 else 0
+    netlist = int(sys.argv[2]) if len(sys.argv) > 2 else 1
+    runs = int(sys.argv[3]) if len(sys.argv) > 3 else 5
+    ripup_report(chip, netlist, runs)
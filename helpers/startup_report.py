@@ -0,0 +1,86 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+
+# Built-in/Generic Imports
+import subprocess
+import sys
+
+__author__ = 'Eline van Groningen, Mimoun Boulfich, Syrka van Kuppenveld'
+__copyright__ = 'Copyright 2020, Chips & Circuits'
+__credits__ = ['Eline van Groningen, Mimoun Boulfich, Syrka van Kuppenveld']
+__license__ = 'GNU GPL 3.0'
+__version__ = '0.1.0'
+__maintainer__ = 'Eline van Groningen, Mimoun Boulfich, Syrka van Kuppenveld'
+__email__ = 'elinevangroningen@gmail.com, mimounboulfich@live.nl, syrkavankuppenveld@gmail.com'
+__status__ = 'Dev'
+
+"""
+Startup time report.
+
+
+This module contains the code for reporting the import time of the algorithms, with
+and without the plotting libraries. Every import is measured in a fresh interpreter.
+Run with:
+        python -m helpers.startup_report [runs]
+"""
+
+# Imports to measure, the last one loads the plotting stack as every run did before
+IMPORTS = [
+    ("algorithms", "import code.algorithms"),
+    ("batch interface", "import helpers.batch"),
+    ("algorithms + plotting", "import code.algorithms; import code.visualization.visualize"),
+]
+
+# Measures the import in the child process and reports which plotting libraries it loaded
+MEASURE = """
+import sys, time
+start = time.perf_counter()
+{statement}
+print(time.perf_counter() - start, 'matplotlib' in sys.modules, 'pandas' in sys.modules)
+"""
+
+
+def measure_import(statement):
+    """
+    Returns the import time of the statement in a fresh interpreter and whether it
+    imported matplotlib and pandas.
+
+    Parameters
+    ----------
+    statement: a string
+            The import statement(s) to measure.
+
+    Returns
+    -------
+    tuple
+            The import time in seconds, and True if matplotlib and pandas were
+            imported.
+    """
+
+    output = subprocess.run([sys.executable, '-c', MEASURE.format(statement=statement)], capture_output=True, text=True, check=True).stdout
+    seconds, matplotlib, pandas = output.split()
+
+    return float(seconds), matplotlib == 'True', pandas == 'True'
+
+
+def startup_report(runs):
+    """
+    Prints the mean import time per import.
+
+    Parameters
+    ----------
+    runs: an int
+            The number of fresh interpreters per import.
+    """
+
+    print(f"Mean import time over {runs} runs")
+    for name, statement in IMPORTS:
+        results = [measure_import(statement) for _ in range(runs)]
+        seconds = sum(result[0] for result in results) / runs
+        _, matplotlib, pandas = results[-1]
+        print(f"{name}: {seconds * 1000:.0f} ms, matplotlib imported: {matplotlib}, pandas imported: {pandas}")
+
+
+if __name__ == "__main__":
+    runs = int(sys.argv[1]) if len(sys.argv) > 1 else 5
+    startup_report(runs)
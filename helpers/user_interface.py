@@ -7,8 +7,8 @@ import time
 
 # Own modules
 from main import main
+import code.classes as cs
 import code.visualization as vs
-import matplotlib.pyplot as plt
 
 __author__ = 'Eline van Groningen, Mimoun Boulfich, Syrka van Kuppenveld'
 __copyright__ = 'Copyright 2020, Chips & Circuits'
@@ -113,7 +113,7 @@ def algorithm_input(netlist):
             An integer corresponding with the chosen algorithm.
     """
 
-    options = {'0', '1', '2', '3', '4'}
+    options = {'0', '1', '2', '3', '4', '5', '6', '7'}
     
     correct = False
     while not correct:
@@ -121,7 +121,7 @@ def algorithm_input(netlist):
         # Prompt user for algorithm
         print("\033[1m""Which algorithm would you like to run?""\033[0m")
         print("For more information on the algorithms press 9 directly followed by the algorithm number.")
-        print("> 0 = Random\n> 1 = Greedy\n> 2 = Greedy Look Ahead\n> 3 = Hillclimber\n> 4 = Restart Hillclimber")
+        print("> 0 = Random\n> 1 = Greedy\n> 2 = Greedy Look Ahead\n> 3 = Hillclimber\n> 4 = Restart Hillclimber\n> 5 = A*\n> 6 = Portfolio\n> 7 = Simulated Annealing")
         algorithm = input()
         print()
 
@@ -181,6 +181,38 @@ def algorithm_input(netlist):
             time.sleep(5)
             print()
 
+        # Provide information on the A* algorithm
+        elif algorithm == '95':
+            print("\033[1m""INFORMATION A* ALGORITHM""\033[0m")
+            print("Creates a Wire object that connects the gates according to the netlist, routing every connection with an A* search.")
+            print()
+            print("Costs:\n* A step costs 1 per wire unit plus 300 per intersection, the Manhattan Distance is used as estimate.")
+            print()
+            print("The A* algorithm works with the following heuristics:")
+            print("* 'Social map'\n* 'Better a neighbor who is near than an brother far away?'")
+            time.sleep(5)
+            print()
+
+        # Provide information on the portfolio
+        elif algorithm == '96':
+            print("\033[1m""INFORMATION PORTFOLIO""\033[0m")
+            print("Runs the Greedy algorithms and A* with every heuristic, order and a number of seeds at once on all cores.")
+            print()
+            print("Time budget:\n* Once the time budget runs out, all runs are stopped and the cheapest solution found is kept.")
+            time.sleep(5)
+            print()
+
+        # Provide information on the simulated annealing algorithm
+        elif algorithm == '97':
+            print("\033[1m""INFORMATION SIMULATED ANNEALING ALGORITHM""\033[0m")
+            print("Makes the same adjustments as the Hillclimber, but also accepts worse states with a probability that drops as the temperature cools.")
+            print()
+            print("Start state:\n* Acquires a Random start state using the Random algorithm.")
+            print()
+            print("Time budget:\n* The temperature cools over the time budget, after which the cheapest solution found is kept.")
+            time.sleep(5)
+            print()
+
         # Continue if algorithm choice is valid
         if algorithm in options:
             correct = True
@@ -225,6 +257,32 @@ def hillclimber_restarts():
     return frequency
 
 
+def time_budget_input():
+    """
+    Prompts user for the time budget of the portfolio or the simulated annealing
+    and returns it.
+
+    Returns
+    -------
+    int
+            The number of seconds after which the algorithm is stopped.
+    """
+
+    correct = False
+    while not correct:
+
+        # Prompt user for the time budget
+        print("\033[1m""How many seconds may the algorithm run?""\033[0m")
+        time_budget = input()
+        print()
+
+        # Quit if user input is correct
+        if time_budget.isdigit() and int(time_budget) > 0:
+            correct = True
+
+    return int(time_budget)
+
+
 def get_flow(plot):
     """
     Asks user if the given plot needs to be shown and/or saved. Returns True or 
@@ -304,7 +362,8 @@ def get_hillclimber_flow(algorithm):
     Parameters
     ----------
     algorithm: an int
-            The algorithm that is chosen, 3 for Hillclimber, 4 for Restart Hillclimber
+            The algorithm that is chosen, 3 for Hillclimber, 4 for Restart Hillclimber,
+            7 for Simulated Annealing
 
     Returns
     -------
@@ -474,6 +533,35 @@ def heuristic_input(netlist, algorithm):
     return heuristic 
 
 
+def order_heuristic_input():
+    """
+    Returns the integer representing the order heuristic chosen by the user, for
+    algorithms that only take an order of the connections.
+
+    Returns
+    -------
+    int
+            An integer representing the chosen heuristic. 
+    """
+
+    options = {'0', '1', '2'}
+
+    correct = False
+    while not correct:
+
+        # Prompt user for heuristic 
+        print("\033[1m""Which heuristic would you like to implement?""\033[0m")
+        print("If none, order of connections is randomly generated.")
+        print("> 0 = none\n> 1 = 'Social Map'\n> 2 = 'Better a neighbor who is near than an brother far away?")
+        heuristic = input()
+
+        # Only continue if heuristic for correct input
+        if heuristic in options:
+            correct = True
+    
+    return int(heuristic)
+
+
 def heuristic_extention(chip, heuristic, graph):
     """
     Returns the correct connections list based on heuristic and the corresponding run approach.
@@ -537,7 +625,7 @@ def heuristic_extention(chip, heuristic, graph):
             # If usage is correct set correct to true and convert order to bool
             if order in order_options:
                 correct = True
-                order = bool(order)
+                order = order == '1'
 
         # Instantiate connection list based on heuristic, in correct order
         # and return correct approach
@@ -617,7 +705,7 @@ def heuristic_order_input(chip, netlist, algorithm, heuristic, graph):
             # If usage is correct set correct to true and convert order to bool
             if order in options:
                 correct = True
-                order = bool(order)
+                order = order == '1'
 
         # Instantiate connection list based on heuristic, correct order
         # and return correct approach
@@ -696,27 +784,28 @@ def visualize_save_results(graph, wire_path):
             correct = True
 
     # Show and save visualization based on user input
-    if show == 'y' and save == 'y':
+    with cs.instrumentation.phase('plotting'):
+        if show == 'y' and save == 'y':
 
-        # Visualize and save the results
-        visualisation = vs.ChipVisualization(graph.gates, wire_path)
-        plot = visualisation.run(True)
-        plot.savefig("results/visualization_algorithm.png")
-        print()
-        print("\033[34m""For saved visualization see: 'results/visualization_algorithm.png'.""\033[0m")
-    elif show == 'y' and save == 'n':
-
-        # Visualize the results
-        visualisation = vs.ChipVisualization(graph.gates, wire_path)
-        plot = visualisation.run(True)
-    elif show == 'n' and save == 'y':
-
-        # Save the visualization of the resutls
-        visualisation = vs.ChipVisualization(graph.gates, wire_path)
-        plot = visualisation.run(False)
-        plot.savefig("results/visualization_algorithm.png")
-        print()
-        print("\033[34m""For saved visualization see: 'results/visualization_algorithm.png'.""\033[0m")
+            # Visualize and save the results
+            visualisation = vs.ChipVisualization(graph.gates, wire_path)
+            plot = visualisation.run(True)
+            plot.savefig("results/visualization_algorithm.png")
+            print()
+            print("\033[34m""For saved visualization see: 'results/visualization_algorithm.png'.""\033[0m")
+        elif show == 'y' and save == 'n':
+
+            # Visualize the results
+            visualisation = vs.ChipVisualization(graph.gates, wire_path)
+            plot = visualisation.run(True)
+        elif show == 'n' and save == 'y':
+
+            # Save the visualization of the resutls
+            visualisation = vs.ChipVisualization(graph.gates, wire_path)
+            plot = visualisation.run(False)
+            plot.savefig("results/visualization_algorithm.png")
+            print()
+            print("\033[34m""For saved visualization see: 'results/visualization_algorithm.png'.""\033[0m")
 
 
 def heatmap_visualize_save(nodes, wire):
@@ -768,27 +857,28 @@ def heatmap_visualize_save(nodes, wire):
             correct = True
 
     # Show and save heatmap visualization based on user input
-    if show == 'y' and save == 'y':
+    with cs.instrumentation.phase('plotting'):
+        if show == 'y' and save == 'y':
 
-        # Visualize and save the heatmap
-        heatmap = vs.WireHeatmap(nodes, wire)
-        plot = heatmap.run(True)
-        plot.savefig("results/heatmap_algorithm.png")
-        print()
-        print("\033[34m""For saved visualization see: 'results/heatmap_algorithm.png'.""\033[0m")
-    elif show == 'y' and save == 'n':
-
-        # Visualize the heatmap
-        heatmap = vs.WireHeatmap(nodes, wire)
-        plot = heatmap.run(True)
-    elif show == 'n' and save == 'y':
-
-        # Save the visualization of the resutls
-        heatmap = vs.WireHeatmap(nodes, wire)
-        plot = heatmap.run(False)
-        plot.savefig("results/heatmap_algorithm.png")
-        print()
-        print("\033[34m""For saved visualization see: 'results/heatmap_algorithm.png'.""\033[0m")
+            # Visualize and save the heatmap
+            heatmap = vs.WireHeatmap(nodes, wire)
+            plot = heatmap.run(True)
+            plot.savefig("results/heatmap_algorithm.png")
+            print()
+            print("\033[34m""For saved visualization see: 'results/heatmap_algorithm.png'.""\033[0m")
+        elif show == 'y' and save == 'n':
+
+            # Visualize the heatmap
+            heatmap = vs.WireHeatmap(nodes, wire)
+            plot = heatmap.run(True)
+        elif show == 'n' and save == 'y':
+
+            # Save the visualization of the resutls
+            heatmap = vs.WireHeatmap(nodes, wire)
+            plot = heatmap.run(False)
+            plot.savefig("results/heatmap_algorithm.png")
+            print()
+            print("\033[34m""For saved visualization see: 'results/heatmap_algorithm.png'.""\033[0m")
 
 
 def restart_program():
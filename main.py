@@ -9,7 +9,6 @@ import sys
 # Own modules
 import code.classes as cs
 import code.algorithms as alg
-from code.visualization.visualize import ChipVisualization
 import helpers as hlp
 
 __author__ = 'Eline van Groningen, Mimoun Boulfich, Syrka van Kuppenveld'
@@ -25,7 +24,10 @@ __status__ = 'Dev'
 Run program.
 
 
-This module contains the code for running the program.
+This module contains the code for running the program. Without arguments the 
+interactive user interface is started, with arguments the batch interface is run,
+see python main.py --help. Run with INSTRUMENT=1 to save a report of the counted
+calls and timed phases of the run in results/instrumentation.json.
 """
 
 
@@ -49,21 +51,38 @@ def main():
     print_file = f"gates&netlists/chip_{chip}/print_{chip}.csv"
     netlist_file = f"gates&netlists/chip_{chip}/netlist_{netlist}.csv"
 
+    # Count and time the run if asked for with INSTRUMENT=1
+    instrumentation = None
+    if os.environ.get('INSTRUMENT') == '1':
+        instrumentation = cs.Instrumentation()
+        instrumentation.enable()
+
     # Instantiate Graph object
     graph = cs.Graph(print_file, netlist_file)
 
     # Prompt user for algorithm
     algorithm = hlp.uif.algorithm_input(netlist)
     
-    # If the Hillclimber algorithm is chosen, specify its workflow
+    # If the Hillclimber or Simulated Annealing algorithm is chosen, specify its workflow
     frequency = None
     start_state_flow = None 
     conversion_plot_flow = None
-    if algorithm == 3 or algorithm == 4:
+    if algorithm == 3 or algorithm == 4 or algorithm == 7:
         frequency, start_state_flow, conversion_plot_flow = hlp.uif.get_hillclimber_flow(algorithm)
 
+    # The portfolio (=6) tries all heuristics itself and the simulated annealing (=7)
+    # takes none, they only take a time budget
+    if algorithm == 6 or algorithm == 7:
+        time_budget = hlp.uif.time_budget_input()
+
+    # A* (=5) only takes an order of the connections
+    elif algorithm == 5:
+        heuristic = hlp.uif.order_heuristic_input()
+        print()
+        connections, run_approach = hlp.uif.heuristic_order_input(chip, netlist, algorithm, heuristic, graph)
+
     # Only prompt user for heuristics if algorithm is not random (=0) and no hillclimber (=3 & 4)
-    if algorithm != 0 and algorithm != 3 and algorithm != 4:
+    elif algorithm != 0 and algorithm != 3 and algorithm != 4:
         heuristic = hlp.uif.heuristic_input(netlist, algorithm)
         if heuristic < 3:
             print()
@@ -95,6 +114,12 @@ def main():
         algo = alg.GreedyLookAhead(graph, connections, run_approach)
     elif algorithm == 3 or algorithm == 4:
         algo = alg.HillClimber(graph, frequency, start_state_flow, conversion_plot_flow, chip, netlist)
+    elif algorithm == 5:
+        algo = alg.AStar(graph, connections, run_approach)
+    elif algorithm == 6:
+        algo = alg.Portfolio(print_file, netlist_file, time_budget=time_budget)
+    elif algorithm == 7:
+        algo = alg.SimulatedAnnealing(graph, time_budget=time_budget, start_state_flow=start_state_flow, conversion_flow=conversion_plot_flow, chip=chip, netlist=netlist)
 
     # Run algorithm
     print("Running Algorithm...")
@@ -103,13 +128,20 @@ def main():
     print("\033[0;32m""Algorithm completed!""\033[0m")
     print()
 
-    # Print wire costs if anything but a Hillclimber is run, since the Hillclimber
-    # handles its own costst
-    if algorithm < 3:
+    # Print wire costs if anything but a Hillclimber or Simulated Annealing is run,
+    # since those handle their own costst
+    if algorithm < 3 or algorithm == 5 or algorithm == 6:
         wire_costs = algo.wire.compute_costs()
         print("\033[33m"f"Wire costs = {wire_costs}""\033[0m")
         print()
 
+    # Print the configuration that won the portfolio
+    if algorithm == 6:
+        configuration = algo.best_configuration
+        print(f"Best configuration: {configuration['algorithm'].__name__}, heuristic {configuration['heuristic']}, descending {configuration['descending']}, seed {configuration['seed']}")
+        print(f"{len(algo.results)} configurations finished within the time budget")
+        print()
+
     # Visualize and or save algorithm results based on user's input
     hlp.uif.visualize_save_results(graph, wire_path)
     print()
@@ -124,6 +156,13 @@ def main():
         hlp.save_csv(netlist_file, output_file, wire_path, costs)
     print()
 
+    # Create instrumentation report
+    if instrumentation is not None:
+        instrumentation.disable()
+        instrumentation.save("results/instrumentation.json", chip=chip, netlist=netlist, algorithm=type(algo).__name__)
+        print("\033[34m""For the instrumentation report see: 'results/instrumentation.json'.""\033[0m")
+        print()
+
     # Restart or quit program
     print("\033[1m""Would you like to run another algorithm? (y/n)""\033[0m")
     rerun = input()
@@ -132,4 +171,7 @@ def main():
 
 # Run main
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    if len(sys.argv) > 1:
+        hlp.batch.main(sys.argv[1:])
+    else:
+        main()
\ No newline at end of file
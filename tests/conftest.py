@@ -0,0 +1,125 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+
+# Built-in/Generic Imports
+import contextlib
+import io
+import random
+
+# Third party imports
+import pytest
+
+# Own modules
+from code.classes import Graph, Lattice, Wire
+from code.algorithms import Greedy, HillClimber
+
+__author__ = 'Eline van Groningen, Mimoun Boulfich, Syrka van Kuppenveld'
+__copyright__ = 'Copyright 2020, Chips & Circuits'
+__credits__ = ['Eline van Groningen, Mimoun Boulfich, Syrka van Kuppenveld']
+__license__ = 'GNU GPL 3.0'
+__version__ = '0.1.0'
+__maintainer__ = 'Eline van Groningen, Mimoun Boulfich, Syrka van Kuppenveld'
+__email__ = 'elinevangroningen@gmail.com, mimounboulfich@live.nl, syrkavankuppenveld@gmail.com'
+__status__ = 'Dev'
+
+"""
+Fixtures of the tests of the core data structures.
+
+
+The tests route chip 0 netlist 2 with the Greedy algorithm and then rebuild random
+nets with the moves of the HillClimber, on both backends. Run the tests with:
+        python -m pytest -q
+"""
+
+PRINT_FILE = "gates&netlists/chip_0/print_0.csv"
+NETLIST_FILE = "gates&netlists/chip_0/netlist_2.csv"
+
+# Number of random moves per test
+MOVES = 120
+
+
+def rebuild_net(climber):
+    """
+    Rebuilds a random net as the HillClimber does.
+
+    Parameters
+    ----------
+    climber: a HillClimber object
+            The HillClimber on the routed chip.
+
+    Returns
+    -------
+    tuple
+            The connection, its old path and its new path.
+    """
+
+    connection, gates = climber.get_random_connection()
+    old_path = climber.wire_path[connection]
+    climber.remove_connection(connection, gates)
+    climber.apply_random_adjustment(connection, gates)
+
+    return connection, old_path, climber.wire_path[connection]
+
+
+def rebuild_nets(climber):
+    """
+    Rebuilds MOVES random nets, of which about half are undone with the Journal.
+
+    Parameters
+    ----------
+    climber: a HillClimber object
+            The HillClimber on the routed chip.
+    """
+
+    for _ in range(MOVES):
+        rebuild_net(climber)
+        if random.random() < 0.5:
+            climber.journal.rollback()
+        else:
+            climber.journal.commit()
+
+
+@pytest.fixture(params=[Graph, Lattice])
+def climber(request, monkeypatch):
+    """
+    Returns a HillClimber on the Greedy solution of chip 0 netlist 2, with a debug
+    Wire that stores its coordinates for the recount.
+    """
+
+    monkeypatch.setattr(Wire, 'DEBUG', True)
+    random.seed(0)
+
+    graph = request.param(PRINT_FILE, NETLIST_FILE)
+    algo = Greedy(graph, list(graph.netlist), True)
+
+    # Silence the progress messages of the algorithm
+    with contextlib.redirect_stdout(io.StringIO()):
+        wire_path = algo.run()
+
+    climber = HillClimber(graph, 1, (False, False), (False, False), 0, 2)
+    climber.wire = algo.wire
+    climber.wire_path = wire_path
+
+    # Record the edits of the moves, as the HillClimber does
+    climber.wire.journal = climber.journal
+    graph.journal = climber.journal
+
+    return climber
+
+
+@pytest.fixture
+def move():
+    """
+    Returns the function that rebuilds a random net.
+    """
+
+    return rebuild_net
+
+
+@pytest.fixture
+def moves():
+    """
+    Returns the function that rebuilds MOVES random nets.
+    """
+
+    return rebuild_nets
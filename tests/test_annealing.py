@@ -0,0 +1,42 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+
+# Built-in/Generic Imports
+import contextlib
+import io
+import random
+
+# Own modules
+from code.classes import Lattice
+from code.algorithms import SimulatedAnnealing, GreedyStartState, GreedyNoIntersectLookAhead
+
+__author__ = 'Eline van Groningen, Mimoun Boulfich, Syrka van Kuppenveld'
+__copyright__ = 'Copyright 2020, Chips & Circuits'
+__credits__ = ['Eline van Groningen, Mimoun Boulfich, Syrka van Kuppenveld']
+__license__ = 'GNU GPL 3.0'
+__version__ = '0.1.0'
+__maintainer__ = 'Eline van Groningen, Mimoun Boulfich, Syrka van Kuppenveld'
+__email__ = 'elinevangroningen@gmail.com, mimounboulfich@live.nl, syrkavankuppenveld@gmail.com'
+__status__ = 'Dev'
+
+"""
+Tests of the Simulated Annealing algorithm.
+"""
+
+
+def test_returns_best_state(path_costs):
+    """
+    The returned and laid state has the best costs, also when a hot run ends in a
+    worse state than the one it started from.
+    """
+
+    for netlist in (2, 3):
+        random.seed(0)
+        graph = Lattice("gates&netlists/chip_0/print_0.csv", f"gates&netlists/chip_0/netlist_{netlist}.csv")
+        algo = SimulatedAnnealing(graph, start_temperature=5000, iterations=40, start_state=GreedyStartState(GreedyNoIntersectLookAhead))
+
+        with contextlib.redirect_stdout(io.StringIO()):
+            wire_path = algo.run()
+
+        assert path_costs(graph, wire_path) == algo.best_cost
+        assert algo.wire.compute_costs() == algo.best_cost
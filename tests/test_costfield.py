@@ -0,0 +1,45 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+
+# Own modules
+from code.classes import CostField
+
+__author__ = 'Eline van Groningen, Mimoun Boulfich, Syrka van Kuppenveld'
+__copyright__ = 'Copyright 2020, Chips & Circuits'
+__credits__ = ['Eline van Groningen, Mimoun Boulfich, Syrka van Kuppenveld']
+__license__ = 'GNU GPL 3.0'
+__version__ = '0.1.0'
+__maintainer__ = 'Eline van Groningen, Mimoun Boulfich, Syrka van Kuppenveld'
+__email__ = 'elinevangroningen@gmail.com, mimounboulfich@live.nl, syrkavankuppenveld@gmail.com'
+__status__ = 'Dev'
+
+"""
+Tests of the CostField.
+"""
+
+# Weights of the cost field, as GreedyCosts uses them
+LAYER_COSTS = (7, 6, 5, 4, 3, 2, 1)
+COST_INTERSECTION = 300
+COST_NEIGHBORS = 2
+
+
+def test_cost_field(climber, moves):
+    """
+    The CostField that follows the moves equals a CostField built from scratch.
+    """
+
+    graph = climber.graph
+    cost_field = graph.get_cost_field(LAYER_COSTS, COST_INTERSECTION, COST_NEIGHBORS)
+    moves(climber)
+
+    assert cost_field.costs == CostField(graph, LAYER_COSTS, COST_INTERSECTION, COST_NEIGHBORS).costs
+
+
+def test_cached(climber):
+    """
+    The graph returns the same CostField for the same weights.
+    """
+
+    graph = climber.graph
+
+    assert graph.get_cost_field(LAYER_COSTS, COST_INTERSECTION, COST_NEIGHBORS) is graph.get_cost_field(LAYER_COSTS, COST_INTERSECTION, COST_NEIGHBORS)
@@ -0,0 +1,49 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+
+# Third party imports
+import pytest
+
+# Own modules
+from code.classes import CongestionGrid, WireDensity
+
+__author__ = 'Eline van Groningen, Mimoun Boulfich, Syrka van Kuppenveld'
+__copyright__ = 'Copyright 2020, Chips & Circuits'
+__credits__ = ['Eline van Groningen, Mimoun Boulfich, Syrka van Kuppenveld']
+__license__ = 'GNU GPL 3.0'
+__version__ = '0.1.0'
+__maintainer__ = 'Eline van Groningen, Mimoun Boulfich, Syrka van Kuppenveld'
+__email__ = 'elinevangroningen@gmail.com, mimounboulfich@live.nl, syrkavankuppenveld@gmail.com'
+__status__ = 'Dev'
+
+"""
+Tests of the wire density.
+"""
+
+
+@pytest.mark.parametrize('radius', [1, 2, 3])
+def test_congestion_grid(climber, moves, radius):
+    """
+    The CongestionGrid that follows the moves equals the WireDensity computed from
+    scratch.
+    """
+
+    grid = CongestionGrid(climber.wire, radius)
+    moves(climber)
+
+    field = WireDensity(climber.graph, radius).compute(climber.wire)
+
+    assert grid.density == field.reshape(-1).tolist()
+
+
+def test_detach(climber, move):
+    """
+    A detached CongestionGrid no longer follows the wire.
+    """
+
+    grid = CongestionGrid(climber.wire, 2)
+    density = list(grid.density)
+    grid.detach()
+    move(climber)
+
+    assert grid.density == density
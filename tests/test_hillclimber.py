@@ -0,0 +1,41 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+
+# Built-in/Generic Imports
+import contextlib
+import io
+
+# Own modules
+from code.classes import Lattice
+from code.algorithms import HillClimber, RandomStartState, RunController
+
+__author__ = 'Eline van Groningen, Mimoun Boulfich, Syrka van Kuppenveld'
+__copyright__ = 'Copyright 2020, Chips & Circuits'
+__credits__ = ['Eline van Groningen, Mimoun Boulfich, Syrka van Kuppenveld']
+__license__ = 'GNU GPL 3.0'
+__version__ = '0.1.0'
+__maintainer__ = 'Eline van Groningen, Mimoun Boulfich, Syrka van Kuppenveld'
+__email__ = 'elinevangroningen@gmail.com, mimounboulfich@live.nl, syrkavankuppenveld@gmail.com'
+__status__ = 'Dev'
+
+"""
+Tests of the HillClimber algorithm.
+"""
+
+
+def test_restart_lays_overall_best(path_costs):
+    """
+    The Restart Hillclimber that runs its climbers one after another leaves the wire
+    of the overall best climber, which it also returns.
+    """
+
+    for seed in (1, 2, 4):
+        graph = Lattice("gates&netlists/chip_0/print_0.csv", "gates&netlists/chip_0/netlist_2.csv")
+        algo = HillClimber(graph, 3, (False, False), (False, False), 0, 2, processes=1, controller=RunController(patience=30),
+                           start_state=RandomStartState(max_steps=500), seed=seed)
+
+        with contextlib.redirect_stdout(io.StringIO()):
+            wire_path = algo.run()
+
+        assert path_costs(graph, wire_path) == algo.overall_best_cost
+        assert algo.wire.compute_costs() == algo.overall_best_cost
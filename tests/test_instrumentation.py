@@ -0,0 +1,48 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+
+# Built-in/Generic Imports
+import contextlib
+import io
+import json
+
+# Third party imports
+import pytest
+
+# Own modules
+from code.classes import instrumentation
+from helpers.batch import main
+
+__author__ = 'Eline van Groningen, Mimoun Boulfich, Syrka van Kuppenveld'
+__copyright__ = 'Copyright 2020, Chips & Circuits'
+__credits__ = ['Eline van Groningen, Mimoun Boulfich, Syrka van Kuppenveld']
+__license__ = 'GNU GPL 3.0'
+__version__ = '0.1.0'
+__maintainer__ = 'Eline van Groningen, Mimoun Boulfich, Syrka van Kuppenveld'
+__email__ = 'elinevangroningen@gmail.com, mimounboulfich@live.nl, syrkavankuppenveld@gmail.com'
+__status__ = 'Dev'
+
+"""
+Tests of the instrumentation of the batch interface.
+"""
+
+
+@pytest.mark.parametrize('limit', [['--iterations', '3'], ['--patience', '3'], ['--budget', '0.5']])
+@pytest.mark.parametrize('algorithm', ['greedy', 'lookahead'])
+def test_instrument_with_controller(tmp_path, algorithm, limit):
+    """
+    The instrumentation records the runs of an algorithm that a RunController
+    limits, and is disabled afterwards.
+    """
+
+    argv = ['--chip', '0', '--netlist', '1', '--algorithm', algorithm, '--seed', '0', '--instrument', '--output', str(tmp_path)] + limit
+    with contextlib.redirect_stdout(io.StringIO()):
+        main(argv)
+
+    with open(tmp_path / "instrumentation.json") as report_file:
+        report = json.load(report_file)
+
+    assert instrumentation.active is None
+    assert [run['algorithm'] for run in report['runs']] == [{'greedy': 'Greedy', 'lookahead': 'GreedyLookAhead'}[algorithm]]
+    assert report['counters']['next_position'] > 0
+    assert report['counters']['hillclimber_iterations'] == 0
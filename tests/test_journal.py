@@ -0,0 +1,55 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+
+__author__ = 'Eline van Groningen, Mimoun Boulfich, Syrka van Kuppenveld'
+__copyright__ = 'Copyright 2020, Chips & Circuits'
+__credits__ = ['Eline van Groningen, Mimoun Boulfich, Syrka van Kuppenveld']
+__license__ = 'GNU GPL 3.0'
+__version__ = '0.1.0'
+__maintainer__ = 'Eline van Groningen, Mimoun Boulfich, Syrka van Kuppenveld'
+__email__ = 'elinevangroningen@gmail.com, mimounboulfich@live.nl, syrkavankuppenveld@gmail.com'
+__status__ = 'Dev'
+
+"""
+Tests of the Journal.
+"""
+
+
+def get_state(climber):
+    """
+    Returns a copy of everything a move changes.
+    """
+
+    graph = climber.graph
+    wire = climber.wire
+
+    return (bytes(wire.units), wire.length, wire.intersections, list(wire.visits), sorted(wire.coords, key=graph.get_index),
+            [graph.get_intersection(node) for node in graph.nodes.values()], dict(climber.wire_path))
+
+
+def test_rollback(climber, move):
+    """
+    Rolling back the Journal restores the wire, the graph and the wire path, also
+    after several moves.
+    """
+
+    for _ in range(12):
+        state = get_state(climber)
+        for _ in range(5):
+            move(climber)
+        climber.journal.rollback()
+
+        assert get_state(climber) == state
+
+
+def test_commit(climber, move):
+    """
+    A rollback after a commit keeps the committed moves.
+    """
+
+    move(climber)
+    climber.journal.commit()
+    state = get_state(climber)
+    climber.journal.rollback()
+
+    assert get_state(climber) == state
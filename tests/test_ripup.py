@@ -0,0 +1,77 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+
+# Built-in/Generic Imports
+import contextlib
+import io
+import random
+
+# Third party imports
+import pytest
+
+# Own modules
+from code.classes import Graph
+from code.algorithms import RipUp, GreedyNoIntersectRipUp, GreedyNoIntersectLookAheadRipUp, GreedyLookAheadCostsRipUp, GreedyWireJamRipUp, GreedyLookAheadWireJamRipUp
+from helpers.batch import CLASSES, RIPUP_CLASSES
+
+__author__ = 'Eline van Groningen, Mimoun Boulfich, Syrka van Kuppenveld'
+__copyright__ = 'Copyright 2020, Chips & Circuits'
+__credits__ = ['Eline van Groningen, Mimoun Boulfich, Syrka van Kuppenveld']
+__license__ = 'GNU GPL 3.0'
+__version__ = '0.1.0'
+__maintainer__ = 'Eline van Groningen, Mimoun Boulfich, Syrka van Kuppenveld'
+__email__ = 'elinevangroningen@gmail.com, mimounboulfich@live.nl, syrkavankuppenveld@gmail.com'
+__status__ = 'Dev'
+
+"""
+Tests of the rip-up and reroute recovery.
+"""
+
+PRINT_FILE = "gates&netlists/chip_0/print_0.csv"
+
+
+def test_every_greedy_algorithm_has_recovery():
+    """
+    The batch interface has a rip-up variant of every Greedy algorithm, A* builds a
+    net in one search and has none.
+    """
+
+    for (algorithm, heuristic), algorithm_class in CLASSES.items():
+        if algorithm in ('greedy', 'lookahead'):
+            assert issubclass(RIPUP_CLASSES[algorithm_class], algorithm_class)
+            assert issubclass(RIPUP_CLASSES[algorithm_class], RipUp)
+
+
+@pytest.mark.parametrize('algorithm_class', [GreedyNoIntersectRipUp, GreedyNoIntersectLookAheadRipUp, GreedyLookAheadCostsRipUp,
+                                             GreedyWireJamRipUp, GreedyLookAheadWireJamRipUp])
+@pytest.mark.parametrize('netlist', [2, 3])
+def test_route(path_costs, algorithm_class, netlist):
+    """
+    The rip-up variants connect the whole netlist with valid paths.
+    """
+
+    random.seed(0)
+
+    graph = Graph(PRINT_FILE, f"gates&netlists/chip_0/netlist_{netlist}.csv")
+    algo = algorithm_class(graph, list(graph.netlist), True)
+
+    # Silence the progress messages of the algorithm
+    with contextlib.redirect_stdout(io.StringIO()):
+        wire_path = algo.run()
+
+    assert set(wire_path) == set(graph.netlist)
+
+    units = set()
+    for (a, b), path in wire_path.items():
+        assert path[0] == graph.get_coords(graph.get_gate_node(graph.gates[a]))
+        assert path[-1] == graph.get_coords(graph.get_gate_node(graph.gates[b]))
+
+        nodes = [graph.get_node(coords) for coords in path]
+        for i in range(1, len(nodes)):
+            assert nodes[i] in graph.get_neighbors(nodes[i - 1])
+
+            edge = graph.get_edge(nodes[i - 1], nodes[i])
+            assert edge not in units
+            units.add(edge)
+
+    assert path_costs(graph, wire_path) == algo.wire.compute_costs()
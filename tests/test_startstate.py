@@ -0,0 +1,142 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+
+# Built-in/Generic Imports
+import contextlib
+import io
+import random
+
+# Third party imports
+import pytest
+
+# Own modules
+from code.classes import Graph, Lattice
+from code.algorithms import Greedy, StartState, GreedyStartState, FileStartState
+from helpers.save_csv import save_csv
+
+__author__ = 'Eline van Groningen, Mimoun Boulfich, Syrka van Kuppenveld'
+__copyright__ = 'Copyright 2020, Chips & Circuits'
+__credits__ = ['Eline van Groningen, Mimoun Boulfich, Syrka van Kuppenveld']
+__license__ = 'GNU GPL 3.0'
+__version__ = '0.1.0'
+__maintainer__ = 'Eline van Groningen, Mimoun Boulfich, Syrka van Kuppenveld'
+__email__ = 'elinevangroningen@gmail.com, mimounboulfich@live.nl, syrkavankuppenveld@gmail.com'
+__status__ = 'Dev'
+
+"""
+Tests of the start state providers.
+"""
+
+PRINT_FILE = "gates&netlists/chip_0/print_0.csv"
+NETLIST_FILE = "gates&netlists/chip_0/netlist_1.csv"
+
+
+def write_solution(filename, wire_path):
+    """
+    Writes a wire path as a solution file.
+    """
+
+    with open(filename, 'w') as output_file, contextlib.redirect_stdout(io.StringIO()):
+        save_csv(NETLIST_FILE, output_file, wire_path, 0)
+
+
+def test_incomplete_provider_fails_when_created():
+    """
+    A provider without a build method cannot be created.
+    """
+
+    class NamedStartState(StartState):
+        def get_name(self):
+            return 'named'
+
+    with pytest.raises(TypeError):
+        NamedStartState()
+
+
+@pytest.mark.parametrize('graph_class', [Graph, Lattice])
+def test_file_round_trip(tmp_path, graph_class):
+    """
+    A saved solution is loaded as the same wire path.
+    """
+
+    graph = graph_class(PRINT_FILE, NETLIST_FILE)
+    wire_path = GreedyStartState(Greedy).get(graph, 0)
+    filename = str(tmp_path / "solution.csv")
+    write_solution(filename, wire_path)
+
+    loaded = FileStartState(filename).get(graph_class(PRINT_FILE, NETLIST_FILE))
+
+    assert loaded == {connection: tuple(path) for connection, path in wire_path.items()}
+
+
+@pytest.mark.parametrize('graph_class', [Graph, Lattice])
+def test_file_turns_reversed_nets_around(tmp_path, graph_class):
+    """
+    A net saved from its second gate is loaded in the order of the netlist.
+    """
+
+    graph = graph_class(PRINT_FILE, NETLIST_FILE)
+    wire_path = {connection: tuple(path) for connection, path in GreedyStartState(Greedy).get(graph, 0).items()}
+    filename = str(tmp_path / "solution.csv")
+    write_solution(filename, {(b, a): path[::-1] for (a, b), path in wire_path.items()})
+
+    loaded = FileStartState(filename).get(graph_class(PRINT_FILE, NETLIST_FILE))
+
+    assert loaded == wire_path
+
+
+@pytest.mark.parametrize('seed', range(5))
+def test_file_loads_gate_ordered_solution(tmp_path, seed):
+    """
+    The solution of a run in the order of the gates (Social Map) is loaded.
+    """
+
+    random.seed(seed)
+
+    graph = Graph(PRINT_FILE, NETLIST_FILE)
+    algo = Greedy(graph, graph.get_gate_densities(False, 3), False)
+    with contextlib.redirect_stdout(io.StringIO()):
+        wire_path = algo.run()
+
+    filename = str(tmp_path / "solution.csv")
+    write_solution(filename, wire_path)
+
+    loaded = FileStartState(filename).get(Graph(PRINT_FILE, NETLIST_FILE))
+
+    assert set(loaded) == set(graph.netlist)
+    for (a, b), path in wire_path.items():
+        if (a, b) in graph.netlist:
+            assert loaded[(a, b)] == tuple(path)
+        else:
+            assert loaded[(b, a)] == tuple(path)[::-1]
+
+
+@pytest.mark.parametrize('graph_class', [Graph, Lattice])
+@pytest.mark.parametrize('change, message', [('end', "does not run from"), ('jump', "not a neighbor"), ('outside', "leaves the grid"),
+                                             ('shared', "twice")])
+def test_file_rejects_invalid_paths(tmp_path, graph_class, change, message):
+    """
+    A solution file with a path that misses its gate, jumps, leaves the grid or
+    shares a wire unit is rejected with a ValueError.
+    """
+
+    graph = graph_class(PRINT_FILE, NETLIST_FILE)
+    wire_path = {connection: list(path) for connection, path in GreedyStartState(Greedy).get(graph, 0).items()}
+    connection = max(wire_path, key=lambda connection: len(wire_path[connection]))
+    path = wire_path[connection]
+    x, y, z = path[1]
+
+    if change == 'end':
+        path.pop()
+    elif change == 'jump':
+        del path[1]
+    elif change == 'outside':
+        path[1:1] = [(x, y, -1), (x, y, 0)] if z == 0 else [(x, y, 99)]
+    else:
+        path[1:1] = [path[1], path[0]]
+
+    filename = str(tmp_path / "solution.csv")
+    write_solution(filename, wire_path)
+
+    with pytest.raises(ValueError, match=message):
+        FileStartState(filename).get(graph_class(PRINT_FILE, NETLIST_FILE))
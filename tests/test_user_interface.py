@@ -0,0 +1,82 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+
+# Built-in/Generic Imports
+import builtins
+import contextlib
+import io
+
+# Third party imports
+import pytest
+
+# Own modules
+from code.classes import Graph
+from helpers.user_interface import heuristic_extention, heuristic_order_input
+
+__author__ = 'Eline van Groningen, Mimoun Boulfich, Syrka van Kuppenveld'
+__copyright__ = 'Copyright 2020, Chips & Circuits'
+__credits__ = ['Eline van Groningen, Mimoun Boulfich, Syrka van Kuppenveld']
+__license__ = 'GNU GPL 3.0'
+__version__ = '0.1.0'
+__maintainer__ = 'Eline van Groningen, Mimoun Boulfich, Syrka van Kuppenveld'
+__email__ = 'elinevangroningen@gmail.com, mimounboulfich@live.nl, syrkavankuppenveld@gmail.com'
+__status__ = 'Dev'
+
+"""
+Tests of the prompts of the interactive user interface.
+"""
+
+PRINT_FILE = "gates&netlists/chip_0/print_0.csv"
+NETLIST_FILE = "gates&netlists/chip_0/netlist_2.csv"
+
+
+def get_distances(graph, connections):
+    """
+    Returns the Manhattan Distances of the connections.
+    """
+
+    distances = []
+    for a, b in connections:
+        gate_a = graph.gates[a]
+        gate_b = graph.gates[b]
+        distances.append(abs(gate_a.xcoord - gate_b.xcoord) + abs(gate_a.ycoord - gate_b.ycoord) + abs(gate_a.zcoord - gate_b.zcoord))
+
+    return distances
+
+
+@pytest.mark.parametrize('answer, descending', [('0', False), ('1', True)])
+def test_order_input(monkeypatch, answer, descending):
+    """
+    The order prompt sorts the connections from min to max on 0 and from max to
+    min on 1.
+    """
+
+    graph = Graph(PRINT_FILE, NETLIST_FILE)
+    monkeypatch.setattr(builtins, 'input', lambda: answer)
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        connections, approach = heuristic_order_input(0, 2, 1, 2, graph)
+
+    distances = get_distances(graph, connections)
+
+    assert approach
+    assert distances == sorted(distances, reverse=descending)
+
+
+@pytest.mark.parametrize('answer, descending', [('0', False), ('1', True)])
+def test_extention_order_input(monkeypatch, answer, descending):
+    """
+    The order prompt of the extended heuristics sorts the connections the same way.
+    """
+
+    graph = Graph(PRINT_FILE, NETLIST_FILE)
+    answers = iter(['2', answer])
+    monkeypatch.setattr(builtins, 'input', lambda: next(answers))
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        connections, approach = heuristic_extention(0, 3, graph)
+
+    distances = get_distances(graph, connections)
+
+    assert approach
+    assert distances == sorted(distances, reverse=descending)
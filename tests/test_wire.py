@@ -0,0 +1,132 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+
+# Built-in/Generic Imports
+import random
+
+# Own modules
+from code.classes import Graph, Lattice, Wire
+
+__author__ = 'Eline van Groningen, Mimoun Boulfich, Syrka van Kuppenveld'
+__copyright__ = 'Copyright 2020, Chips & Circuits'
+__credits__ = ['Eline van Groningen, Mimoun Boulfich, Syrka van Kuppenveld']
+__license__ = 'GNU GPL 3.0'
+__version__ = '0.1.0'
+__maintainer__ = 'Eline van Groningen, Mimoun Boulfich, Syrka van Kuppenveld'
+__email__ = 'elinevangroningen@gmail.com, mimounboulfich@live.nl, syrkavankuppenveld@gmail.com'
+__status__ = 'Dev'
+
+"""
+Tests of the Wire.
+"""
+
+PRINT_FILE = "gates&netlists/chip_0/print_0.csv"
+NETLIST_FILE = "gates&netlists/chip_0/netlist_2.csv"
+
+
+def test_edge_ids():
+    """
+    Every wire unit has its own edge ID, the same on both backends.
+    """
+
+    graph = Graph(PRINT_FILE, NETLIST_FILE)
+    lattice = Lattice(PRINT_FILE, NETLIST_FILE)
+
+    edges = {}
+    for coords, node in graph.nodes.items():
+        for neighbor in graph.get_neighbors(node):
+            edge = graph.get_edge(node, neighbor)
+            unit = frozenset((coords, graph.get_coords(neighbor)))
+
+            assert edge == graph.get_edge(neighbor, node)
+            assert edge == lattice.get_edge(lattice.get_node(coords), lattice.get_node(graph.get_coords(neighbor)))
+            assert edges.setdefault(edge, unit) == unit
+            assert 0 <= edge < len(Wire(graph).units)
+
+
+def test_units_match_paths(climber, moves):
+    """
+    The units of the wire are exactly the units of the paths.
+    """
+
+    moves(climber)
+
+    graph = climber.graph
+
+    edges = set()
+    for path in climber.wire_path.values():
+        nodes = [graph.get_node(coords) for coords in path]
+        edges.update(graph.get_edge(nodes[i - 1], nodes[i]) for i in range(1, len(nodes)))
+
+    assert {edge for edge, unit in enumerate(climber.wire.units) if unit} == edges
+
+
+def test_running_totals(climber, moves):
+    """
+    The running length and intersections equal a recount from scratch.
+    """
+
+    moves(climber)
+
+    wire = climber.wire
+
+    assert wire.recount() == (wire.length, wire.intersections)
+
+
+def test_graph_counts_match_wire_visits(climber, moves):
+    """
+    The intersection count of every node of the graph equals the number of visits
+    of the wire.
+    """
+
+    moves(climber)
+
+    graph = climber.graph
+    for node in graph.nodes.values():
+        if not graph.is_gate(node):
+            assert graph.get_intersection(node) == climber.wire.visits[graph.get_index(node)]
+
+
+def test_compute_costs_delta(climber, move):
+    """
+    The delta evaluator gives the change in costs of a move before it is made.
+    """
+
+    for _ in range(240):
+        costs = climber.wire.compute_costs()
+        connection, old_path, new_path = move(climber)
+        new_costs = climber.wire.compute_costs()
+        climber.journal.rollback()
+
+        assert climber.wire.compute_costs_delta(old_path, new_path) == new_costs - costs
+
+        # Keep about half of the moves, laid again from the path
+        if random.random() < 0.5:
+            climber.remove_connection(connection, None)
+            climber.wire.lay_path(new_path)
+            climber.wire_path[connection] = new_path
+            climber.journal.commit()
+
+            assert climber.wire.compute_costs() == new_costs
+
+
+def test_lay_path(climber, moves):
+    """
+    Laying the paths on an empty graph gives the same wire and graph counts as the
+    moves did.
+    """
+
+    moves(climber)
+
+    graph = climber.graph
+    wire = climber.wire
+    counts = [graph.get_intersection(node) for node in graph.nodes.values()]
+
+    graph.journal = None
+    graph.clear_graph()
+    laid = Wire(graph)
+    for path in climber.wire_path.values():
+        laid.lay_path(path)
+
+    assert (bytes(laid.units), laid.length, laid.intersections, laid.visits) == (bytes(wire.units), wire.length, wire.intersections, wire.visits)
+    assert [graph.get_intersection(node) for node in graph.nodes.values()] == counts